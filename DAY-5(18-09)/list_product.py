@@ -1,23 +1,68 @@
 # list_products.py
-from supabase import create_client, Client
-from dotenv import load_dotenv
-import os
- 
-load_dotenv()
- 
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
-sb: Client = create_client(supabase_url, supabase_key)
+#   python list_product.py                          (all products in one request)
+#   python list_product.py --all --stock-below 5    (every low-stock product, page by page)
+#   python list_product.py --all --min-price 100 --max-price 500 --name-prefix Pen
+import argparse
+from product_tool import get_client  # one shared client, created on first use
+
+LIST_COLUMNS = "product_id,name,sku,price,stock"
  
 def list_products():
-    resp = sb.table("products").select("*").order("product_id", desc=False).execute()
+    resp = get_client().table("products").select("*").order("product_id", desc=False).execute()
     return resp.data
  
+def like_prefix(prefix):
+    """ilike pattern for names starting with prefix taken literally (\\, % and _ escaped)"""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+ 
+def iter_products(page_size=1000, stock_below=None, min_price=None, max_price=None, name_prefix=None,
+                  columns=LIST_COLUMNS):
+    """
+    Yield products page by page using keyset paging on product_id
+    (each page starts after the last id seen, so deep pages cost the same as the first).
+    Filters run in the database and only the listed columns are fetched.
+    """
+    last_id = None
+    while True:
+        q = get_client().table("products").select(columns)
+        if last_id is not None:
+            q = q.gt("product_id", last_id)
+        if stock_below is not None:
+            q = q.lt("stock", stock_below)
+        if min_price is not None:
+            q = q.gte("price", min_price)
+        if max_price is not None:
+            q = q.lte("price", max_price)
+        if name_prefix:
+            q = q.ilike("name", like_prefix(name_prefix))
+        page = q.order("product_id", desc=False).limit(page_size).execute().data or []
+        yield from page
+        if len(page) < page_size:
+            return
+        last_id = page[-1]["product_id"]
+ 
 if __name__ == "__main__":
-    products = list_products()
-    if products:
-        print("Products:")
-        for p in products:
+    parser = argparse.ArgumentParser(description="List products")
+    parser.add_argument("--all", action="store_true", help="stream every matching product page by page")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--stock-below", type=int)
+    parser.add_argument("--min-price", type=float)
+    parser.add_argument("--max-price", type=float)
+    parser.add_argument("--name-prefix")
+    args = parser.parse_args()
+
+    if args.all or args.stock_below is not None or args.min_price is not None \
+            or args.max_price is not None or args.name_prefix:
+        count = 0
+        for p in iter_products(args.page_size, args.stock_below, args.min_price, args.max_price, args.name_prefix):
             print(f"{p['product_id']}: {p['name']} (SKU:{p['sku']}) — ₹{p['price']} — stock: {p['stock']}")
+            count += 1
+        print(f"{count} products")
     else:
-        print("No products found.")
\ No newline at end of file
+        products = list_products()
+        if products:
+            print("Products:")
+            for p in products:
+                print(f"{p['product_id']}: {p['name']} (SKU:{p['sku']}) — ₹{p['price']} — stock: {p['stock']}")
+        else:
+            print("No products found.")
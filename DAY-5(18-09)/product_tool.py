@@ -0,0 +1,144 @@
+# product_tool.py
+# Run many product operations with one Supabase client.
+# Reads one operation per line from a file or stdin:
+#   add,<name>,<sku>,<price>,<stock>
+#   update,<product_id>,<new_stock>
+#   delete,<product_id>
+# Consecutive operations of the same kind are sent together in batches; update and delete
+# batches report the product ids that matched no row. A failing batch is reported with its
+# ids (SKUs for adds) and the run carries on; the summary lists every failed id.
+#   python product_tool.py ops.txt --batch-size 500
+#   cat ops.txt | python product_tool.py
+import argparse
+import csv
+import os
+import sys
+import time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    """One shared client per process, created on first use"""
+    from supabase import create_client  # pip install supabase
+    from dotenv import load_dotenv  # pip install python-dotenv
+
+    load_dotenv()
+    return create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+
+
+def parse_ops(lines):
+    """Yield (kind, payload) for every non-empty, non-comment line"""
+    for line_no, row in enumerate(csv.reader(lines), start=1):
+        if not row or not row[0].strip() or row[0].startswith("#"):
+            continue
+        kind = row[0].strip().lower()
+        try:
+            if kind == "add":
+                name, sku, price, stock = (v.strip() for v in row[1:5])
+                yield kind, {"name": name, "sku": sku, "price": float(price), "stock": int(stock)}
+            elif kind == "update":
+                yield kind, {"product_id": int(row[1]), "stock": int(row[2])}
+            elif kind == "delete":
+                yield kind, int(row[1])
+            else:
+                raise ValueError(f"unknown operation '{kind}'")
+        except (IndexError, ValueError) as e:
+            raise SystemExit(f"Line {line_no}: {e}")
+
+
+def add_products(rows):
+    return get_client().table("products").insert(rows).execute().data or []
+
+
+def update_stocks(rows):
+    """
+    Set stocks in one server-side update; needs this function in the database:
+        create or replace function set_stock_bulk(stocks jsonb)
+        returns setof products language sql as $$
+            update products p
+            set stock = s.value::int
+            from jsonb_each_text(stocks) s
+            where p.product_id = s.key::int
+            returning p.*;
+        $$;
+    """
+    stocks = {str(r["product_id"]): r["stock"] for r in rows}  # the last update of an id wins
+    return get_client().rpc("set_stock_bulk", {"stocks": stocks}).execute().data or []
+
+
+def delete_products(ids):
+    return get_client().table("products").delete().in_("product_id", ids).execute().data or []
+
+
+HANDLERS = {"add": add_products, "update": update_stocks, "delete": delete_products}
+
+
+def op_ids(kind, batch):
+    """What identifies each op of a batch: SKU for adds, product id otherwise"""
+    if kind == "add":
+        return [op["sku"] for op in batch]
+    if kind == "update":
+        return [op["product_id"] for op in batch]
+    return list(batch)
+
+
+def run(ops, batch_size=500):
+    """
+    Execute ops in order, batching runs of the same kind.
+    Returns (rows affected, {kind: ids of the ops in failed batches})
+    """
+    total = 0
+    failed = {}
+    kind, batch = None, []
+
+    def flush():
+        nonlocal total
+        if not batch:
+            return
+        start = time.perf_counter()
+        try:
+            rows = HANDLERS[kind](batch)
+        except Exception as e:
+            ids = op_ids(kind, batch)
+            failed.setdefault(kind, []).extend(ids)
+            print(f"{kind:<6} batch: {len(batch)} ops FAILED ({e}); not applied: {ids}")
+            return
+        elapsed = time.perf_counter() - start
+        total += len(rows)
+        line = (f"{kind:<6} batch: {len(batch)} ops, {len(rows)} rows in {elapsed * 1000:.0f} ms "
+                f"({len(batch) / elapsed if elapsed else 0:.0f} ops/s)")
+        if kind in ("update", "delete"):
+            requested = {op["product_id"] for op in batch} if kind == "update" else set(batch)
+            missing = sorted(requested - {r["product_id"] for r in rows})
+            if missing:
+                line += f", missing ids: {missing}"
+        print(line)
+
+    for op_kind, payload in ops:
+        if op_kind != kind or len(batch) >= batch_size:
+            flush()
+            kind, batch = op_kind, []
+        batch.append(payload)
+    flush()
+    return total, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch add/update/delete products")
+    parser.add_argument("file", nargs="?", help="operations file (default: stdin)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.file:
+        with open(args.file, newline="") as f:
+            affected, failed = run(parse_ops(f), args.batch_size)
+    else:
+        affected, failed = run(parse_ops(sys.stdin), args.batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"Done: {affected} rows in {elapsed:.2f} s")
+    for kind, ids in failed.items():
+        print(f"Failed {kind}: {len(ids)} ops: {ids}")
+    if failed:
+        sys.exit(1)
@@ -1,16 +1,8 @@
 # update_stock.py
-from supabase import create_client, Client
-from dotenv import load_dotenv
-import os
- 
-load_dotenv()
- 
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
-sb: Client = create_client(supabase_url, supabase_key)
+from product_tool import get_client  # one shared client, created on first use
  
 def update_stock(product_id, new_stock):
-    resp = sb.table("products").update({"stock": new_stock}).eq("product_id", product_id).execute()
+    resp = get_client().table("products").update({"stock": new_stock}).eq("product_id", product_id).execute()
     return resp.data
  
 if __name__ == "__main__":
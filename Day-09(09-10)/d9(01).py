@@ -50,8 +50,11 @@ pip install pandas
 
 import pandas as pd
 import numpy as np
-data=pd.read_csv("/content/OnlineRetail.csv", encoding='latin1')
-df=pd.DataFrame(data)
+from retail_data import load_clean
+
+# chunked, typed read with the cleaning rules applied per chunk (missing CustomerID,
+# unparseable dates, returns, non-positive prices, duplicates); re-runs read the Parquet cache
+df = load_clean("/content/OnlineRetail.csv", cache_path="OnlineRetail_clean.parquet")
 df.head()
 
 df.tail()
@@ -59,24 +62,13 @@ df.tail()
 print(df.shape)
 print(df.info())
 
-df.isnull().sum()
-
-df = df.dropna(subset=['CustomerID'])
-df['Description'] = df['Description'].fillna("Unknown")
-
-df['InvoiceDate'] = pd.to_datetime(df['InvoiceDate'], errors='coerce')
-df = df.dropna(subset=['InvoiceDate'])
+print(df.attrs["clean_stats"])
 
-print(df[df['Quantity'] < 0].shape[0])
-returns = df[df['Quantity'] < 0]
-df = df[df['Quantity'] > 0]
+from retail_cube import RetailCube
 
-duplicates = df.duplicated().sum()
-print(f"Duplicate rows: {duplicates}")
-
-df = df.drop_duplicates()
-
-df.to_csv("OnlineRetail_Cleaned.csv", index=False)
+# Country x StockCode x Price_Range x Month aggregates, built once; the correlation,
+# group-bys and the Germany query below are answered from it instead of the full frame
+cube = RetailCube.build(df)
 
 """Filtering & Sorting    
 Filter transactions where Quantity > 1000 (suspicious outliers)
@@ -128,7 +120,7 @@ Save the final cleaned & enriched dataset to CSV / Excel
 
 """
 
-correlation_matrix = df[['Quantity', 'Price', 'Revenue']].corr()
+correlation_matrix = cube.corr()
 
 print("\nCorrelation matrix of numeric columns:")
 display(correlation_matrix)
@@ -150,22 +142,11 @@ glass_products = df[df['Description'].str.contains("glass", na=False)]
 print("\nProducts with 'glass' in their description:")
 display(glass_products.head())
 
-bins = [0, 5, 20, df['Price'].max()]
-labels = ['cheap', 'medium', 'expensive']
-df['Price_Range'] = pd.cut(df['Price'], bins=bins, labels=labels, right=False)
-
-price_range_agg = df.groupby('Price_Range').agg(
-    number_of_purchases=('InvoiceNo', 'count'),
-    average_revenue=('Revenue', 'mean')
-).reset_index()
+price_range_agg = cube.by_price_range()
 print("\nAggregated data by Price Range:")
 display(price_range_agg)
 
-country_agg = df.groupby('Country').agg(
-    total_revenue=('Revenue', 'sum'),
-    mean_revenue_per_order=('Revenue', 'mean'),
-    order_count=('InvoiceNo', 'nunique')
-).reset_index()
+country_agg = cube.by_country()
 
 print("\nAggregated data by Country:")
 display(country_agg.head())
@@ -175,7 +156,7 @@ display(df.describe())
 display(df['Country'].value_counts().head())
 display(df['Product_ID'].value_counts().head())
 
-query_result = df.query("Revenue > 1000 and Country == 'Germany'")
+query_result = cube.drill_down(country="Germany", min_revenue=1000)
 display(query_result.head())
 
 between_quantity = df[df['Quantity'].between(10, 100)]
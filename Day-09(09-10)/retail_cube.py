@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Aggregate cube for Online Retail revenue analytics
+
+Built once from the cleaned data (see retail_data.load_clean), the cube holds one row per
+Country x StockCode x Price_Range x Month with additive measures:
+  rows, quantity, revenue, max_revenue and the sums/cross-products needed for
+  Pearson correlation of Quantity, UnitPrice and Revenue
+plus the distinct (Country, Month, InvoiceNo) triples for order counts. The group-bys and
+correlation of d9(01) are answered from these few thousand rows; row-level filters
+such as Revenue > 1000 drill down into the raw frame, visiting only the countries whose
+cells can match.
+
+    cube = RetailCube.build(df)
+    cube.by_country(); cube.by_price_range(); cube.corr(country="Germany")
+    cube.drill_down(country="Germany", min_revenue=1000)
+    cube.add(new_invoices)          # incremental update
+"""
+
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = ["Country", "StockCode", "Price_Range", "Month"]
+PRICE_BINS = [0, 5, 20, np.inf]
+PRICE_LABELS = ["cheap", "medium", "expensive"]
+MOMENTS = ["Quantity", "UnitPrice", "Revenue"]
+
+
+def _prepare(df):
+    quantity = df["Quantity"].astype("float64")
+    price = df["UnitPrice"].astype("float64")
+    revenue = quantity * price
+    frame = pd.DataFrame({
+        "Country": df["Country"].astype(str),
+        "StockCode": df["StockCode"].astype(str),
+        "Price_Range": pd.cut(price, bins=PRICE_BINS, labels=PRICE_LABELS, right=False).astype(str),
+        "Month": df["InvoiceDate"].dt.to_period("M").astype(str),
+        "rows": 1,
+        "quantity": quantity,
+        "revenue": revenue,
+        "max_revenue": revenue,
+    })
+    values = {"Quantity": quantity, "UnitPrice": price, "Revenue": revenue}
+    for i, a in enumerate(MOMENTS):
+        frame[f"s_{a}"] = values[a]
+        for b in MOMENTS[i:]:
+            frame[f"s_{a}_{b}"] = values[a] * values[b]
+    return frame
+
+
+def _invoices(df):
+    return pd.DataFrame({
+        "Country": df["Country"].astype(str),
+        "Month": df["InvoiceDate"].dt.to_period("M").astype(str),
+        "InvoiceNo": df["InvoiceNo"].astype(str),
+    }).drop_duplicates()
+
+
+def _aggregate(frame):
+    measures = [c for c in frame.columns if c not in DIMENSIONS]
+    how = {c: ("max" if c == "max_revenue" else "sum") for c in measures}
+    return frame.groupby(DIMENSIONS, observed=True, sort=False).agg(how).reset_index()
+
+
+class RetailCube:
+    def __init__(self, cells, invoices, raw=None):
+        self.cells = cells
+        self.invoices = invoices  # distinct (Country, Month, InvoiceNo)
+        self.raw = raw
+        self._country_rows = None
+
+    @classmethod
+    def build(cls, df, keep_raw=True):
+        cells = _aggregate(_prepare(df))
+        return cls(cells, _invoices(df), df if keep_raw else None)
+
+    def add(self, df):
+        """Fold new invoices into the cube; only the new rows are aggregated"""
+        self.cells = _aggregate(pd.concat([self.cells, _aggregate(_prepare(df))], ignore_index=True))
+        self.invoices = pd.concat([self.invoices, _invoices(df)], ignore_index=True).drop_duplicates()
+        if self.raw is not None:
+            self.raw = pd.concat([self.raw, df], ignore_index=True)
+            self._country_rows = None
+        return self
+
+    def save(self, path):
+        pd.to_pickle((self.cells, self.invoices), path)
+
+    @classmethod
+    def load(cls, path, raw=None):
+        cells, invoices = pd.read_pickle(path)
+        return cls(cells, invoices, raw)
+
+    def _select(self, country=None, product=None, price_range=None, month_from=None, month_to=None):
+        cells = self.cells
+        mask = np.ones(len(cells), dtype=bool)
+        if country is not None:
+            mask &= cells["Country"].to_numpy() == country
+        if product is not None:
+            mask &= cells["StockCode"].to_numpy() == product
+        if price_range is not None:
+            mask &= cells["Price_Range"].to_numpy() == price_range
+        if month_from is not None:
+            mask &= cells["Month"].to_numpy() >= month_from  # "YYYY-MM" strings sort by date
+        if month_to is not None:
+            mask &= cells["Month"].to_numpy() <= month_to
+        return cells[mask]
+
+    def group(self, by, **filters):
+        """rows, quantity, revenue and mean revenue per row, grouped by any dimensions"""
+        cells = self._select(**filters)
+        out = cells.groupby(by, observed=True)[["rows", "quantity", "revenue"]].sum()
+        out["mean_revenue"] = out["revenue"] / out["rows"]
+        return out.reset_index()
+
+    def total_revenue(self, **filters):
+        return float(self._select(**filters)["revenue"].sum())
+
+    def by_country(self, **filters):
+        """
+        total_revenue, mean_revenue_per_order (per line, as in d9) and order_count per country;
+        order counts are kept per country and month only, so product/price_range filters are rejected
+        """
+        unsupported = [f for f in ("product", "price_range") if filters.get(f) is not None]
+        if unsupported:
+            raise ValueError(f"order_count cannot be filtered by {', '.join(unsupported)}")
+        out = self.group("Country", **filters).rename(
+            columns={"revenue": "total_revenue", "mean_revenue": "mean_revenue_per_order"})
+        invoices = self.invoices
+        mask = np.ones(len(invoices), dtype=bool)
+        if filters.get("country") is not None:
+            mask &= invoices["Country"].to_numpy() == filters["country"]
+        if filters.get("month_from") is not None:
+            mask &= invoices["Month"].to_numpy() >= filters["month_from"]
+        if filters.get("month_to") is not None:
+            mask &= invoices["Month"].to_numpy() <= filters["month_to"]
+        # an invoice spanning two months is still one order
+        orders = (invoices[mask].drop_duplicates(["Country", "InvoiceNo"])
+                  .groupby("Country").size().rename("order_count"))
+        out = out.join(orders, on="Country")
+        return out[["Country", "total_revenue", "mean_revenue_per_order", "order_count"]]
+
+    def by_price_range(self, **filters):
+        out = self.group("Price_Range", **filters).rename(
+            columns={"rows": "number_of_purchases", "mean_revenue": "average_revenue"})
+        out["Price_Range"] = pd.Categorical(out["Price_Range"], categories=PRICE_LABELS, ordered=True)
+        out = out.sort_values("Price_Range").reset_index(drop=True)
+        return out[["Price_Range", "number_of_purchases", "average_revenue"]]
+
+    def corr(self, **filters):
+        """Pearson correlation of Quantity, UnitPrice and Revenue over the selected rows"""
+        totals = self._select(**filters).sum(numeric_only=True)
+        n = totals["rows"]
+        result = pd.DataFrame(np.eye(len(MOMENTS)), index=MOMENTS, columns=MOMENTS)
+        if n < 2:
+            return result * np.nan
+        for i, a in enumerate(MOMENTS):
+            for b in MOMENTS[i + 1:]:
+                cov = totals[f"s_{a}_{b}"] - totals[f"s_{a}"] * totals[f"s_{b}"] / n
+                var_a = totals[f"s_{a}_{a}"] - totals[f"s_{a}"] ** 2 / n
+                var_b = totals[f"s_{b}_{b}"] - totals[f"s_{b}"] ** 2 / n
+                result.loc[a, b] = result.loc[b, a] = cov / np.sqrt(var_a * var_b)
+        return result
+
+    def drill_down(self, country=None, min_revenue=None):
+        """Raw rows of a country (and revenue floor); cells rule out countries that cannot match"""
+        if self.raw is None:
+            raise ValueError("Cube was built without raw data")
+        cells = self._select(country=country)
+        if min_revenue is not None:
+            cells = cells[cells["max_revenue"] > min_revenue]
+        if cells.empty:
+            return self.raw.iloc[0:0]
+        if self._country_rows is None:
+            self._country_rows = self.raw.groupby(self.raw["Country"].astype(str), observed=True).indices
+        rows = np.concatenate([self._country_rows[c] for c in cells["Country"].unique()])
+        rows.sort()
+        out = self.raw.iloc[rows]
+        if min_revenue is not None:
+            out = out[out["Quantity"] * out["UnitPrice"].astype("float64") > min_revenue]
+        return out
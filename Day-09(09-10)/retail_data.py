@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Chunked, typed loader for the Online Retail dataset (OnlineRetail.csv)
+
+The CSV is read in chunks with explicit dtypes, InvoiceDate is parsed once, and the
+cleaning rules from d9(01) are applied to each chunk as it arrives:
+  - drop rows without CustomerID
+  - fill missing Description with "Unknown"
+  - drop rows whose InvoiceDate does not parse
+  - drop returns (Quantity <= 0) and rows with UnitPrice <= 0
+  - drop duplicate rows (row hashes are kept per chunk and deduplicated once at the end)
+StockCode and Country are read as categoricals per chunk, and the chunks' categories are merged
+with union_categoricals. The cleaned frame is written to a columnar cache (Parquet, or pickle
+for a .pkl path or when no Parquet engine is installed) so later runs skip CSV parsing:
+
+    from retail_data import load_clean
+    df = load_clean("OnlineRetail.csv", cache_path="OnlineRetail_clean.parquet")
+    df.attrs["clean_stats"]   # rows dropped by each rule
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+COLUMNS = ["InvoiceNo", "StockCode", "Description", "Quantity", "InvoiceDate",
+           "UnitPrice", "CustomerID", "Country"]
+READ_DTYPES = {
+    "InvoiceNo": str,
+    "StockCode": "category",
+    "Description": str,
+    "Quantity": "int32",
+    "InvoiceDate": str,
+    "UnitPrice": "float32",
+    "CustomerID": "float32",  # NaN for anonymous rows; int32 after cleaning
+    "Country": "category",
+}
+CATEGORICAL = ["StockCode", "Country"]
+DATE_FORMAT = "%m/%d/%Y %H:%M"
+
+
+def _parse_dates(values, date_format):
+    dates = pd.to_datetime(values, format=date_format, errors="coerce")
+    retry = dates.isna() & values.notna()
+    if retry.any():
+        # some exports mix formats; only the rows that failed get the slow path
+        dates[retry] = pd.to_datetime(values[retry], format="mixed", errors="coerce")
+    return dates
+
+
+def clean_chunk(chunk, stats, date_format=DATE_FORMAT):
+    stats["rows_read"] += len(chunk)
+    missing = chunk["CustomerID"].isna()
+    stats["missing_customer"] += int(missing.sum())
+    chunk = chunk[~missing]
+
+    dates = _parse_dates(chunk["InvoiceDate"], date_format)
+    bad_date = dates.isna()
+    stats["bad_date"] += int(bad_date.sum())
+
+    returns = chunk["Quantity"] <= 0
+    stats["returns"] += int((returns & ~bad_date).sum())
+    bad_price = chunk["UnitPrice"] <= 0
+    stats["non_positive_price"] += int((bad_price & ~returns & ~bad_date).sum())
+
+    keep = ~(bad_date | returns | bad_price)
+    chunk = chunk[keep].assign(
+        InvoiceDate=dates[keep],
+        Description=chunk["Description"][keep].fillna("Unknown"),
+        CustomerID=chunk["CustomerID"][keep].astype("int32"),
+    )
+    return chunk
+
+
+def read_clean(csv_path, chunksize=100_000, date_format=DATE_FORMAT, encoding="latin1"):
+    """Stream the CSV through clean_chunk and return one cleaned, categorical-typed frame"""
+    stats = dict.fromkeys(["rows_read", "missing_customer", "bad_date", "returns",
+                           "non_positive_price", "duplicates", "kept"], 0)
+    chunks, hashes = [], []
+    for chunk in pd.read_csv(csv_path, usecols=COLUMNS, dtype=READ_DTYPES,
+                             encoding=encoding, chunksize=chunksize):
+        chunk = clean_chunk(chunk, stats, date_format)
+        chunks.append(chunk)
+        hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+
+    if not chunks:
+        return pd.DataFrame(columns=COLUMNS)
+    for column in CATEGORICAL:
+        # chunks see different values; give them all the same categories so concat keeps the codes
+        categories = union_categoricals([chunk[column] for chunk in chunks]).categories
+        for chunk in chunks:
+            chunk[column] = chunk[column].cat.set_categories(categories)
+    df = pd.concat(chunks, ignore_index=True)
+    duplicate = pd.Series(np.concatenate(hashes)).duplicated().to_numpy()
+    stats["duplicates"] = int(duplicate.sum())
+    df = df[~duplicate].reset_index(drop=True)
+    stats["kept"] = len(df)
+    df.attrs["clean_stats"] = stats
+    return df
+
+
+def _pickle_path(path):
+    return os.path.splitext(path)[0] + ".pkl"
+
+
+def write_cache(df, path):
+    """Write the cache and return its path; without pyarrow/fastparquet it goes to <path>.pkl"""
+    if not path.endswith(".pkl"):
+        try:
+            df.to_parquet(path, index=False)
+            return path
+        except ImportError:
+            path = _pickle_path(path)
+    df.to_pickle(path)
+    return path
+
+
+def read_cache(path):
+    return pd.read_pickle(path) if path.endswith(".pkl") else pd.read_parquet(path)
+
+
+def _existing_cache(path):
+    for candidate in (path, _pickle_path(path)):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def load_clean(csv_path, cache_path=None, refresh=False, **read_options):
+    """
+    Cleaned dataset, read from cache_path when it is newer than the CSV;
+    otherwise the CSV is parsed and cleaned and the cache rewritten
+    """
+    cached = _existing_cache(cache_path) if cache_path and not refresh else None
+    if cached and os.path.getmtime(cached) >= os.path.getmtime(csv_path):
+        return read_cache(cached)
+    df = read_clean(csv_path, **read_options)
+    if cache_path:
+        write_cache(df, cache_path)
+    return df
@@ -0,0 +1,89 @@
+#Slab electricity billing for a whole consumer file
+#The cost at the start of every slab is precomputed once, so a bill is
+#  cumulative[slab] + (units - slab start) * rate[slab]
+#with the slab of every consumer found by np.searchsorted.
+#Consumer file (CSV): consumer_no,name,present,last
+#   python billing_engine.py consumers.csv bills.csv
+#   python billing_engine.py --benchmark 1000000
+import argparse
+import time
+
+import numpy as np
+
+#(units up to, rate per unit)
+DEFAULT_SLABS = ((50, 3.80), (100, 4.20), (200, 5.10), (300, 6.30), (float("inf"), 7.50))
+
+
+class SlabTariff:
+    def __init__(self, slabs=DEFAULT_SLABS):
+        uppers = np.array([u for u, _ in slabs], dtype=np.float64)
+        if np.any(np.diff(uppers) <= 0):
+            raise ValueError("Slab limits must be increasing")
+        self.rates = np.array([r for _, r in slabs], dtype=np.float64)
+        self.starts = np.concatenate(([0.0], uppers[:-1]))
+        # cost of all units below each slab's start
+        self.cumulative = np.concatenate(([0.0], np.cumsum(np.diff(self.starts) * self.rates[:-1])))
+
+    def bills(self, units):
+        units = np.maximum(np.asarray(units, dtype=np.float64), 0)
+        slab = np.searchsorted(self.starts, units, side="right") - 1
+        slab = np.maximum(slab, 0)
+        return np.round(self.cumulative[slab] + (units - self.starts[slab]) * self.rates[slab], 2)
+
+    def bill(self, units):
+        return float(self.bills([units])[0])
+
+
+def bill_file(src, dest, tariff=None, chunk_rows=500_000):
+    """Bill every consumer in src and stream the bills to dest; returns (consumers, total)"""
+    import pandas as pd
+
+    tariff = tariff or SlabTariff()
+    consumers, total = 0, 0.0
+    first = True
+    for chunk in pd.read_csv(src, chunksize=chunk_rows):
+        units = (chunk["present"] - chunk["last"]).to_numpy()
+        amount = tariff.bills(units)
+        chunk.assign(units=units, bill=amount).to_csv(dest, mode="w" if first else "a",
+                                                      header=first, index=False)
+        first = False
+        consumers += len(chunk)
+        total += float(amount.sum())
+    return consumers, round(total, 2)
+
+
+def benchmark(consumers):
+    import os
+    import tempfile
+
+    import pandas as pd
+
+    rnd = np.random.default_rng(4)
+    last = rnd.integers(0, 50_000, consumers)
+    folder = tempfile.mkdtemp()
+    src, dest = os.path.join(folder, "consumers.csv"), os.path.join(folder, "bills.csv")
+    pd.DataFrame({"consumer_no": np.arange(consumers), "name": "consumer",
+                  "present": last + rnd.gamma(2.0, 90.0, consumers).astype(int), "last": last}).to_csv(src, index=False)
+
+    start = time.perf_counter()
+    count, total = bill_file(src, dest)
+    print(f"billed {count:,} consumers (total {total:,.2f}) in {time.perf_counter() - start:.2f} s")
+    units = rnd.gamma(2.0, 90.0, consumers)
+    start = time.perf_counter()
+    SlabTariff().bills(units)
+    print(f"slab computation alone: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Slab electricity billing")
+    parser.add_argument("consumers", nargs="?", help="CSV with consumer_no,name,present,last")
+    parser.add_argument("bills", nargs="?", default="bills.csv")
+    parser.add_argument("--benchmark", type=int, metavar="CONSUMERS")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif args.consumers:
+        count, total = bill_file(args.consumers, args.bills)
+        print(f"{count} bills written to {args.bills}, total {total:.2f}")
+    else:
+        parser.error("give a consumers file or --benchmark")
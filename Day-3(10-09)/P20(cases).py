@@ -10,27 +10,27 @@ Prints pairwise overlap counts (day1 & day2, day2 & day3, day1 & day3).
 Produces a final report with counts and sorted lists for each of the above outputs.'''
 
 
-def duplicates(s):
-    return set(i.lower().strip() for i in s)
-def days3(d1,d2,d3):
-    a1=duplicates(d1)
-    a2=duplicates(d2)
-    a3=duplicates(d3)
-    return f"{a1&a2&a3}"
+from attendance import Attendance
 
-def unique(d1,d2,d3):
-    a1=duplicates(d1)
-    a2=duplicates(d2)
-    a3=duplicates(d3)
-    return f"{a1|a2|a3}"
+
+def days3(a):
+    return f"{a.attended_all()}"
+
+def unique(a):
+    return f"{sorted(a.masks)}"
 
 
 
 d1=['a@','b@','c@','c@','D@','d@','f@']
 d2=['b@','c@','c@','D@','d@','f@']
 d3=['a@','b@','c@','c@','D@']
-print(f"Day-1- {len(duplicates(d1))}")
-print(f"Day-2- {len(duplicates(d2))}")
-print(f"Day-3- {len(duplicates(d3))}")
-print(f"3-days attendees- {days3(d1,d2,d3)}")
-print(f"3-days unique attendees- {unique(d1,d2,d3)}")
\ No newline at end of file
+a=Attendance()
+for d in (d1,d2,d3):
+    a.add_day(d)
+s=a.summary()
+for n, count in enumerate(s["per_day"], 1):
+    print(f"Day-{n}- {count}")
+print(f"3-days attendees- {days3(a)}")
+print(f"3-days unique attendees- {unique(a)}")
+print(f"Exactly one day- {a.attended_exactly(1)}")
+print(f"Pairwise overlap- day1&day2: {s['overlap'][0][1]}, day2&day3: {s['overlap'][1][2]}, day1&day3: {s['overlap'][0][2]}")
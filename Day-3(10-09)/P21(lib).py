@@ -9,49 +9,51 @@ Update the title of a book (e.g., correction in title).
 Display all books in the library.
 Count the total number of books in the library.
 Check if a book title exists in the library (reverse lookup).'''
+from library_catalogue import Catalogue
 def addbook(k,v):
-    if k not in lib.keys():
-        lib[k]=v
+    if lib.add(k,v):
         return f"{k},{v} added to the library"
     else:
-        return f"{k}-{v} already in library"
+        return f"{k}-{lib.get(k)} already in library"
 def removebook(k):
-    if k not in lib.keys():
-        return f"{k},{lib[k]} not in library"
+    v=lib.remove(k)
+    if v is None:
+        return f"{k} not in library"
     else:
-        del lib[k]
-        return f"{k}-{lib[k]} removed in library"
+        return f"{k}-{v} removed in library"
 def searchbookID(k):
-    if k not in lib.keys():
-        return f"{k},{lib[k]} not in library"
+    if k not in lib:
+        return f"{k} not in library"
     else:
-        return f"{k}-{lib[k]}"
+        return f"{k}-{lib.get(k)}"
 def searchbookT(v):
-    if v not in lib.values():
+    ids=lib.find_title(v)
+    if not ids:
         return f"{v} not in library"
     else:
-        for key, val in lib.items():
-            if val == v:
-                return f"{v} Id-{key} "
+        return f"{v} Id-{', '.join(ids)} "
+def searchpartial(q):
+    ids=lib.search(q)
+    return "\n".join(f"{k}-{lib.get(k)}" for k in ids) or f"No books match {q}"
 def updatebook(k):
-    if k not in lib.keys():
-        return f"{k},{v} not in library"
+    if k not in lib:
+        return f"{k} not in library"
     else:
         v=input("Enter the name for update: ")
-        lib[k]=v
+        lib.update(k,v)
         return f"{k}-{v} updated in library"
 def displaybook():
-    return f"Id-Book: {lib}"
+    return f"Id-Book: {lib.titles}"
 def countbook():
     return f"Ttal Books: {len(lib)}"
 
 
-lib={}
-print("1. Add book\n2. Remove book\n3. Search by id\n4. Display books\n5. Count books\n6.Update book\n7.search by title\n8.exit")
+lib=Catalogue()
+print("1. Add book\n2. Remove book\n3. Search by id\n4. Display books\n5. Count books\n6.Update book\n7.search by title\n8.exit\n9.search by partial title")
 while(True):
     n=int(input("Enter your choice: "))
     if n==1:
-        k,v=input("Enter id and name to add:").split()
+        k,v=input("Enter id and name to add:").split(maxsplit=1)
         print(addbook(k,v))
     elif n==2:
         print(removebook(input("Enter id to remove: ")))
@@ -67,5 +69,7 @@ while(True):
         print(searchbookT(input("Enter book name to search: ")))
     elif n==8:
         break
+    elif n==9:
+        print(searchpartial(input("Enter words of the title: ")))
     else:
         print("Invalid")
\ No newline at end of file
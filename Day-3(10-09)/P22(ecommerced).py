@@ -23,5 +23,5 @@ cart={
     'Phone'           : 30000,
    ' Headphones '     : 2000
    }
-ec.generate_invoice(cart)
+ec.generate_invoice(cart, discount_percent=10)
 
@@ -26,36 +26,35 @@ Enter product to search: Phone
 Yes, 'Phone' is in the cart.
 Enter choice: 5
 Total products in cart: 2'''
+from shopping_cart import Cart
 
 def addcart(n):
-    if n not in cart:
-        cart.append(n)
+    qty=cart.add(n)
+    if qty==1:
         return (f"Product '{n}' added to cart.")
     else:
-        return (f"Product '{n}' already in cart.")
+        return (f"Product '{n}' already in cart, quantity now {qty}.")
 def removecart(n):
-    if n in cart:
-        cart.remove(n)
+    if cart.remove(n) is not None:
         return (f"Product '{n}' removed from cart.")
     else:
         return (f"Product '{n}' not in cart.")
 def searchcart(n):
     if n in cart:
-        return (f"Yes, '{n}' is in the cart")
+        return (f"Yes, '{n}' is in the cart (quantity {cart.quantity(n)})")
     else:
         return (f"No, '{n} is not in the cart")
 def displaycart():
-    return (f"Cart: {cart}")
+    return (f"Cart: {cart.items}")
 def countcart():
     return (f"Total products in cart: {len(cart)}")
 def sortcart():
-    cart.sort()
-    return (f"Sorted cart : {cart}")
+    return (f"Sorted cart : {cart.sorted()}")
 def clearcart():
     cart.clear()
-    return (f"Cart is cleared - {cart}")
+    return (f"Cart is cleared - {cart.items}")
 
-cart=[]
+cart=Cart()
 print(" Cart Operations:\n1. Add Product\n2. Remove Product\n3. Search Product\n4. Display Cart\n5. Count Products\n6. Sort\n7.clear cart\n8.exit")
 while(True):
     n=int(input("Enter your choice: "))
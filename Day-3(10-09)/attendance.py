@@ -0,0 +1,106 @@
+#Attendee reconciliation for any number of registration days
+#Each email is normalized once and mapped to a bitmask of the days it registered on
+#(bit d set = attended day d+1). Every statistic is then read from the masks in one pass:
+#attendee counts per distinct mask give per-day totals, exactly-k counts and pairwise overlaps.
+#   python attendance.py day1.txt day2.txt day3.txt --report report.txt
+import argparse
+from collections import Counter
+from itertools import chain
+
+
+def normalize(email):
+    return email.strip().lower()
+
+
+class Attendance:
+    def __init__(self):
+        self.masks = {}
+        self.days = 0
+
+    def add_day(self, emails):
+        """Register one day's list (duplicates and case are ignored); returns its day index"""
+        day = self.days
+        self.days += 1
+        bit = 1 << day
+        masks = self.masks
+        for email in emails:
+            email = normalize(email)
+            if email:
+                masks[email] = masks.get(email, 0) | bit
+        return day
+
+    def add_day_file(self, path):
+        """
+        Stream one email per line; a CSV whose first column is the email also works.
+        A first line without "@" (e.g. an "email,name" header) is skipped.
+        """
+        with open(path, encoding="utf-8") as f:
+            first = f.readline().split(",", 1)[0]
+            emails = (line.split(",", 1)[0] for line in f)
+            return self.add_day(chain([first], emails) if "@" in first else emails)
+
+    def day_set(self, day):
+        bit = 1 << day
+        return {e for e, m in self.masks.items() if m & bit}
+
+    def attended_all(self):
+        full = (1 << self.days) - 1
+        return sorted(e for e, m in self.masks.items() if m == full)
+
+    def attended_exactly(self, k):
+        return sorted(e for e, m in self.masks.items() if m.bit_count() == k)
+
+    def summary(self):
+        """Counts per day, exactly-k days, all days and the pairwise overlap matrix"""
+        by_mask = Counter(self.masks.values())
+        per_day = [0] * self.days
+        exactly = [0] * (self.days + 1)
+        overlap = [[0] * self.days for _ in range(self.days)]
+        for mask, count in by_mask.items():
+            days = [d for d in range(self.days) if mask >> d & 1]
+            exactly[len(days)] += count
+            for i, a in enumerate(days):
+                per_day[a] += count
+                for b in days[i + 1:]:
+                    overlap[a][b] += count
+                    overlap[b][a] += count
+        for d in range(self.days):
+            overlap[d][d] = per_day[d]
+        return {
+            "unique": len(self.masks),
+            "per_day": per_day,
+            "all_days": exactly[self.days] if self.days else 0,
+            "exactly": {k: exactly[k] for k in range(1, self.days + 1)},
+            "overlap": overlap,
+        }
+
+    def write_report(self, path, lists=True):
+        s = self.summary()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"Days: {self.days}\nUnique attendees: {s['unique']}\n")
+            for d, count in enumerate(s["per_day"], 1):
+                f.write(f"Day-{d}: {count}\n")
+            for k, count in s["exactly"].items():
+                f.write(f"Exactly {k} day(s): {count}\n")
+            f.write("Pairwise overlap:\n")
+            for d, row in enumerate(s["overlap"], 1):
+                f.write(f"Day-{d}: " + " ".join(f"{c:>8}" for c in row) + "\n")
+            if lists:
+                f.write(f"\nAttended all {self.days} days:\n")
+                f.writelines(e + "\n" for e in self.attended_all())
+                f.write("\nAttended exactly one day:\n")
+                f.writelines(e + "\n" for e in self.attended_exactly(1))
+        return s
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile multi-day registration lists")
+    parser.add_argument("days", nargs="+", help="one registration file per day")
+    parser.add_argument("--report", default="attendance_report.txt")
+    parser.add_argument("--counts-only", action="store_true", help="leave the email lists out of the report")
+    args = parser.parse_args()
+    attendance = Attendance()
+    for path in args.days:
+        attendance.add_day_file(path)
+    summary = attendance.write_report(args.report, lists=not args.counts_only)
+    print(f"{summary['unique']} unique attendees over {attendance.days} days, report written to {args.report}")
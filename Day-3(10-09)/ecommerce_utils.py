@@ -19,19 +19,26 @@ After 10% discount: ₹78300.0
 After 18% GST: ₹92454.00
 ---------------------
 Thank you for shopping with us!'''
+from decimal import Decimal, ROUND_HALF_UP
+
+PAISE = Decimal("0.01")
+
+
+def money(value):
+    return Decimal(str(value)).quantize(PAISE, rounding=ROUND_HALF_UP)
 def apply_discount(price, dp):
-    return price-(price*(dp/100))
+    return money(money(price)-(money(price)*Decimal(str(dp))/100))
 def add_gst(price, gst_percent=18):
-    return price+(price*(gst_percent/100))
+    return money(money(price)+(money(price)*Decimal(str(gst_percent))/100))
 def generate_invoice(cart, discount_percent=0, gst_percent=18):
+    subtotal=sum((money(val) for val in cart.values()), Decimal(0))
+    discounted=apply_discount(subtotal, discount_percent)
     print("------ INVOICE ------")
     for key, val in cart.items():
-        print(f"{val}    : ₹{key}")
+        print(f"{key.strip():<16}: ₹{val}")
     print("---------------------")
-    print(f"Subtotal : ₹{sum(cart.values())}")
-    print(f"After 10% discount: ₹{apply_discount(sum(cart.values()), 10)}")
-    print(f"After 18% GST: ₹{add_gst(sum(cart.values()), gst_percent=18)}")
+    print(f"Subtotal : ₹{subtotal}")
+    print(f"After {discount_percent}% discount: ₹{discounted}")
+    print(f"After {gst_percent}% GST: ₹{add_gst(discounted, gst_percent)}")
     print("---------------------")
     print("Thank you for shopping with us!")
-        
-
@@ -0,0 +1,146 @@
+#Library catalogue with indexes for title lookups
+#  titles   : book id -> title
+#  by_title : normalized title -> set of ids (exact reverse lookup, O(1))
+#  tokens   : word -> set of ids, plus a sorted word list for prefix search (O(log n))
+import bisect
+import csv
+import pickle
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(title):
+    return " ".join(title.lower().split())
+
+
+def tokenize(title):
+    return set(_WORD.findall(title.lower()))
+
+
+class Catalogue:
+    def __init__(self):
+        self.titles = {}
+        self.by_title = {}
+        self.tokens = {}
+        self._sorted = None  # sorted token list, rebuilt on the first prefix search after a change
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __contains__(self, book_id):
+        return book_id in self.titles
+
+    def add(self, book_id, title):
+        if book_id in self.titles:
+            return False
+        self.titles[book_id] = title
+        self.by_title.setdefault(normalize(title), set()).add(book_id)
+        for word in tokenize(title):
+            ids = self.tokens.get(word)
+            if ids is None:
+                self.tokens[word] = ids = set()
+                self._sorted = None
+            ids.add(book_id)
+        return True
+
+    def remove(self, book_id):
+        title = self.titles.pop(book_id, None)
+        if title is None:
+            return None
+        key = normalize(title)
+        self.by_title[key].discard(book_id)
+        if not self.by_title[key]:
+            del self.by_title[key]
+        for word in tokenize(title):
+            self.tokens[word].discard(book_id)
+            if not self.tokens[word]:
+                del self.tokens[word]
+                self._sorted = None
+        return title
+
+    def update(self, book_id, title):
+        if book_id not in self.titles:
+            return False
+        self.remove(book_id)
+        self.add(book_id, title)
+        return True
+
+    def get(self, book_id):
+        return self.titles.get(book_id)
+
+    def find_title(self, title):
+        """Ids of books with exactly this title (case and spacing ignored)"""
+        return sorted(self.by_title.get(normalize(title), ()))
+
+    def words_with_prefix(self, prefix):
+        if self._sorted is None:
+            self._sorted = sorted(self.tokens)
+        i = bisect.bisect_left(self._sorted, prefix)
+        words = []
+        while i < len(self._sorted) and self._sorted[i].startswith(prefix):
+            words.append(self._sorted[i])
+            i += 1
+        return words
+
+    def search(self, query, limit=None):
+        """
+        Ids of books containing every word of the query; the last word may be partial,
+        so "harry pot" finds "Harry Potter and the ...". Rarest word is intersected first.
+        """
+        words = _WORD.findall(query.lower())
+        if not words:
+            return []
+        *full, partial = words
+        sets = [self.tokens.get(w, set()) for w in full]
+        prefix_ids = set()
+        for word in self.words_with_prefix(partial):
+            prefix_ids |= self.tokens[word]
+        sets.append(prefix_ids)
+        sets.sort(key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            if not result:
+                break
+            result &= ids
+        result = sorted(result)
+        return result[:limit] if limit else result
+
+    def load_csv(self, path, id_column="id", title_column="title"):
+        """Bulk load books from a CSV with id and title columns; returns the number added"""
+        added = 0
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                added += self.add(row[id_column].strip(), row[title_column].strip())
+        return added
+
+    def save(self, path):
+        """Write the catalogue and its indexes, so loading does not re-tokenize every title"""
+        with open(path, "wb") as f:
+            pickle.dump((self.titles, self.by_title, self.tokens), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        cat = cls()
+        with open(path, "rb") as f:
+            cat.titles, cat.by_title, cat.tokens = pickle.load(f)
+        return cat
+
+
+if __name__ == "__main__":
+    import time
+
+    cat = Catalogue()
+    start = time.perf_counter()
+    for i in range(1_000_000):
+        cat.add(str(i), f"Volume {i % 5000} of the history of topic {i}")
+    print(f"add 1,000,000 books: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    for i in range(10_000):
+        cat.find_title(f"volume {i % 5000} of the history of topic {i}")
+    print(f"10,000 exact title lookups: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    hits = cat.search("volume 42 topic 50")
+    print(f"search 'volume 42 topic 50': {len(hits)} hits in {(time.perf_counter() - start) * 1000:.1f} ms")
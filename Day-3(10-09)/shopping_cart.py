@@ -0,0 +1,113 @@
+#Shopping cart keyed by SKU
+#items is an insertion-ordered dict SKU -> quantity, so add/remove/search are O(1);
+#the sorted view is only rebuilt after the set of SKUs changes
+import zlib
+
+_COMPRESS_ABOVE = 256  # bytes; smaller carts are stored as plain text
+
+
+def _check_sku(sku):
+    # to_bytes writes one 'sku<TAB>qty' line per item
+    if not isinstance(sku, str) or "\t" in sku or sku.splitlines() != [sku]:
+        raise ValueError(f"SKU must be a non-empty single-line string without tabs: {sku!r}")
+
+
+class Cart:
+    __slots__ = ("items", "_total", "_sorted")  # many session carts stay in memory at once
+
+    def __init__(self, items=None):
+        self.items = {}
+        self._total = 0
+        self._sorted = None
+        for sku, qty in (items or {}).items():
+            self.add(sku, qty)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, sku):
+        return sku in self.items
+
+    def __iter__(self):
+        return iter(self.items.items())
+
+    def __eq__(self, other):
+        return isinstance(other, Cart) and self.items == other.items
+
+    def __repr__(self):
+        return f"Cart({self.items})"
+
+    @property
+    def total_quantity(self):
+        return self._total
+
+    def quantity(self, sku):
+        return self.items.get(sku, 0)
+
+    def add(self, sku, qty=1):
+        """Add qty of sku and return its new quantity"""
+        if qty <= 0:
+            raise ValueError("Quantity must be positive")
+        if sku not in self.items:
+            _check_sku(sku)
+            self._sorted = None
+        self.items[sku] = self.items.get(sku, 0) + qty
+        self._total += qty
+        return self.items[sku]
+
+    def remove(self, sku, qty=None):
+        """Remove qty of sku (all of it when qty is None); returns the quantity left, or None if absent"""
+        if qty is not None and qty <= 0:
+            raise ValueError("Quantity must be positive")
+        current = self.items.get(sku)
+        if current is None:
+            return None
+        if qty is None or qty >= current:
+            del self.items[sku]
+            self._sorted = None
+            self._total -= current
+            return 0
+        self.items[sku] = current - qty
+        self._total -= qty
+        return current - qty
+
+    def clear(self):
+        self.items.clear()
+        self._total = 0
+        self._sorted = None
+
+    def sorted(self):
+        """SKUs in sorted order (a copy; the cached list stays private)"""
+        if self._sorted is None:
+            self._sorted = sorted(self.items)
+        return list(self._sorted)
+
+    def update(self, other):
+        """Add every line of another cart (or SKU -> qty dict) into this one"""
+        items = other.items if isinstance(other, Cart) else other
+        for sku, qty in items.items():
+            self.add(sku, qty)
+        return self
+
+    @classmethod
+    def merge(cls, carts):
+        merged = cls()
+        for cart in carts:
+            merged.update(cart)
+        return merged
+
+    def to_bytes(self):
+        """Compact form: 'sku<TAB>qty' lines, zlib-compressed once the cart gets large"""
+        text = "\n".join(f"{sku}\t{qty}" for sku, qty in self.items.items()).encode("utf-8")
+        if len(text) > _COMPRESS_ABOVE:
+            return b"z" + zlib.compress(text)
+        return b"t" + text
+
+    @classmethod
+    def from_bytes(cls, data):
+        text = zlib.decompress(data[1:]) if data[:1] == b"z" else data[1:]
+        cart = cls()
+        for line in text.decode("utf-8").splitlines():
+            sku, qty = line.rsplit("\t", 1)
+            cart.add(sku, int(qty))
+        return cart
@@ -19,6 +19,8 @@ Paid ₹1000 in cash
 Paid ₹1000 using credit/debit card
 Paid ₹1000 using UPI
  '''
+from payment_dispatcher import PaymentDispatcher
+
 class Payment:
     def amount(self, amt):
         return f"Payment method not specified"
@@ -37,4 +39,13 @@ class UPIPayment(Payment):
 
 payments = [CashPayment(), CardPayment(), UPIPayment()]
 for p in payments:
-    print(p.amount(1000))
\ No newline at end of file
+    print(p.amount(1000))
+
+#settle a mixed batch through one dispatcher, each method with its own concurrency limit
+with PaymentDispatcher() as dispatcher:
+    dispatcher.register("cash", CashPayment().amount, concurrency=1)
+    dispatcher.register("card", CardPayment().amount, concurrency=4)
+    dispatcher.register("upi", UPIPayment().amount, concurrency=8)
+    for result in dispatcher.dispatch([("upi", 250), ("cash", 1000), ("card", 4999), ("upi", 80)]):
+        print(result)
+    print(dispatcher.report())
\ No newline at end of file
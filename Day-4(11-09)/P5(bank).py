@@ -1,25 +1,30 @@
 #bank
+from bank_ledger import Ledger, InsufficientFunds
+
+
 class BankAccount:
-    def __init__(self):
-        self.__balance = 0
+    def __init__(self, ledger=None, account_no="default"):
+        self.__ledger = ledger or Ledger()
+        self.__account_no = account_no
+        self.__ledger.open_account(account_no)
 
     def deposit(self, amt):
-        self.__balance += amt
-        return f"Deposit successful\nCurrent Balance - {self.__balance}"
+        balance = self.__ledger.deposit(self.__account_no, amt)
+        return f"Deposit successful\nCurrent Balance - {balance}"
 
     def withdraw(self, amt):
-        if amt <= self.__balance:
-            self.__balance -= amt
-            return f"Withdrawal successful\nCurrent Balance - {self.__balance}"
-        else:
-            return f"Withdrawal failed\nInsufficient Balance\nCurrent Balance - {self.__balance}"
+        try:
+            balance = self.__ledger.withdraw(self.__account_no, amt)
+            return f"Withdrawal successful\nCurrent Balance - {balance}"
+        except InsufficientFunds:
+            return f"Withdrawal failed\nInsufficient Balance\nCurrent Balance - {self.__ledger.balance(self.__account_no)}"
 
     def get_balance(self):
-        return f"Current Balance - {self.__balance}"
+        return f"Current Balance - {self.__ledger.balance(self.__account_no)}"
     
     
 d=BankAccount()    
 print(d.deposit(5000))
 print(d.withdraw(2000))
+print(d.withdraw(9000))
 print(d.get_balance())
-
@@ -0,0 +1,234 @@
+#Ledger for many bank accounts
+#- every open/deposit/withdrawal/transfer is appended to a transaction log (optionally a JSONL file)
+#- accounts are guarded by a fixed pool of striped locks; a transfer takes its two stripes
+#  in index order, so concurrent transfers cannot deadlock
+#- a batch of transfers takes all its stripes once and writes its log entries together
+#- snapshot() + the log tail recover balances without replaying the whole history
+#   python bank_ledger.py --benchmark
+import argparse
+import json
+import threading
+import time
+
+
+class LedgerError(Exception):
+    pass
+
+
+class InsufficientFunds(LedgerError):
+    pass
+
+
+class Ledger:
+    def __init__(self, stripes=64, log_path=None):
+        self.balances = {}
+        self.log = []  # (seq, op, src, dst, amount)
+        self.seq = 0
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._log_lock = threading.Lock()
+        self._log_file = open(log_path, "a", encoding="utf-8") if log_path else None
+
+    def close(self):
+        if self._log_file:
+            self._log_file.close()
+            self._log_file = None
+
+    def _stripe(self, account):
+        return hash(account) % len(self._stripes)
+
+    def _locked(self, accounts):
+        """Locks for these accounts' stripes, in a fixed global order"""
+        return [self._stripes[i] for i in sorted({self._stripe(a) for a in accounts})]
+
+    def _record(self, entries):
+        with self._log_lock:
+            records = []
+            for op, src, dst, amount in entries:
+                self.seq += 1
+                records.append((self.seq, op, src, dst, amount))
+            self.log.extend(records)
+            if self._log_file:
+                self._log_file.write("".join(
+                    json.dumps({"seq": s, "op": op, "src": src, "dst": dst, "amount": amt}) + "\n"
+                    for s, op, src, dst, amt in records))
+                self._log_file.flush()
+
+    def _check(self, account):
+        if account not in self.balances:
+            raise LedgerError(f"Unknown account: {account}")
+
+    def open_account(self, account, initial=0):
+        locks = self._locked([account])
+        for lock in locks:
+            lock.acquire()
+        try:
+            if account in self.balances:
+                raise LedgerError(f"Account {account} already exists")
+            if initial < 0:
+                raise LedgerError("Initial balance cannot be negative")
+            self.balances[account] = initial
+            # logged even with a zero balance, so recover() knows the account exists
+            self._record([("open", None, account, initial)])
+        finally:
+            for lock in locks:
+                lock.release()
+
+    def balance(self, account):
+        self._check(account)
+        return self.balances[account]
+
+    def _apply(self, op, src, dst, amount):
+        if amount <= 0:
+            raise LedgerError("Amount must be positive")
+        for account in (src, dst):
+            if account is not None:
+                self._check(account)
+        if src is not None and self.balances[src] < amount:
+            raise InsufficientFunds(f"Insufficient balance in {src}")
+        if src is not None:
+            self.balances[src] -= amount
+        if dst is not None:
+            self.balances[dst] += amount
+        return op, src, dst, amount
+
+    def _run(self, op, src, dst, amount):
+        """Apply and log one operation; returns the new balances, read while still locked"""
+        accounts = [a for a in (src, dst) if a is not None]
+        locks = self._locked(accounts)
+        for lock in locks:
+            lock.acquire()
+        try:
+            self._record([self._apply(op, src, dst, amount)])
+            return {a: self.balances[a] for a in accounts}
+        finally:
+            for lock in locks:
+                lock.release()
+
+    def deposit(self, account, amount):
+        return self._run("deposit", None, account, amount)[account]
+
+    def withdraw(self, account, amount):
+        return self._run("withdraw", account, None, amount)[account]
+
+    def transfer(self, src, dst, amount):
+        if src == dst:
+            raise LedgerError("Cannot transfer to the same account")
+        self._run("transfer", src, dst, amount)
+
+    def transfer_batch(self, transfers):
+        """
+        Apply (src, dst, amount) transfers in order under one acquisition of their stripes.
+        Failed transfers are skipped; returns [(transfer, error)] for them.
+        """
+        transfers = list(transfers)
+        locks = self._locked([a for src, dst, _ in transfers for a in (src, dst)])
+        failed, entries = [], []
+        for lock in locks:
+            lock.acquire()
+        try:
+            try:
+                for t in transfers:
+                    src, dst, amount = t
+                    try:
+                        if src == dst:
+                            raise LedgerError("Cannot transfer to the same account")
+                        entries.append(self._apply("transfer", src, dst, amount))
+                    except LedgerError as e:
+                        failed.append((t, e))
+            finally:
+                # transfers applied before an unexpected error are still logged
+                self._record(entries)
+        finally:
+            for lock in locks:
+                lock.release()
+        return failed
+
+    def snapshot(self, path=None):
+        """Consistent copy of every balance and the log position it includes"""
+        for lock in self._stripes:
+            lock.acquire()
+        try:
+            with self._log_lock:
+                snap = {"seq": self.seq, "balances": dict(self.balances)}
+        finally:
+            for lock in self._stripes:
+                lock.release()
+        if path:
+            # balances as [account, balance] pairs: JSON object keys would turn int ids into strings
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"seq": snap["seq"], "balances": list(snap["balances"].items())}, f)
+        return snap
+
+    @classmethod
+    def recover(cls, snapshot_path=None, log_path=None, stripes=64):
+        """Rebuild balances from a snapshot plus the log entries written after it"""
+        ledger = cls(stripes)
+        if snapshot_path:
+            with open(snapshot_path, encoding="utf-8") as f:
+                snap = json.load(f)
+            ledger.balances = {account: balance for account, balance in snap["balances"]}
+            ledger.seq = snap["seq"]
+        if log_path:
+            with open(log_path, encoding="utf-8") as f:
+                for line in f:
+                    e = json.loads(line)
+                    if e["seq"] <= ledger.seq:
+                        continue
+                    if e["op"] == "open":
+                        ledger.balances[e["dst"]] = e["amount"]
+                        ledger.seq = e["seq"]
+                        continue
+                    if e["src"] is not None:
+                        ledger.balances[e["src"]] -= e["amount"]
+                    if e["dst"] is not None:
+                        ledger.balances[e["dst"]] = ledger.balances.get(e["dst"], 0) + e["amount"]
+                    ledger.seq = e["seq"]
+        ledger._log_file = open(log_path, "a", encoding="utf-8") if log_path else None
+        return ledger
+
+
+def benchmark(accounts=10_000, transfers=200_000, workers=8, batch=100):
+    import random
+    from concurrent.futures import ThreadPoolExecutor
+
+    rnd = random.Random(11)
+    plan = [(f"acc{rnd.randrange(accounts)}", f"acc{rnd.randrange(accounts)}", rnd.randint(1, 500))
+            for _ in range(transfers)]
+    plan = [t for t in plan if t[0] != t[1]]
+
+    for label, batched in (("single", False), ("batched", True)):
+        ledger = Ledger()
+        for i in range(accounts):
+            ledger.open_account(f"acc{i}", 10_000)
+        total = sum(ledger.balances.values())
+
+        def work(part):
+            if batched:
+                return sum(len(ledger.transfer_batch(part[i:i + batch])) for i in range(0, len(part), batch))
+            failed = 0
+            for src, dst, amount in part:
+                try:
+                    ledger.transfer(src, dst, amount)
+                except InsufficientFunds:
+                    failed += 1
+            return failed
+
+        parts = [plan[i::workers] for i in range(workers)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            failed = sum(pool.map(work, parts))
+        elapsed = time.perf_counter() - start
+        assert sum(ledger.balances.values()) == total
+        print(f"{label:<8} {len(plan):,} transfers on {workers} threads: {elapsed:.2f} s, "
+              f"{len(plan) / elapsed:,.0f} transfers/s ({failed} rejected)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bank ledger benchmark")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(workers=args.workers)
+    else:
+        parser.print_help()
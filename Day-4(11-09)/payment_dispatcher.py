@@ -0,0 +1,179 @@
+#Settles batches of mixed payments through registered method handlers
+#A batch is grouped by method; each method has its own worker pool, so its concurrency
+#limit holds no matter what else is in the batch, and all groups run at the same time.
+#Handlers are any callable taking an amount, e.g. CashPayment().amount from P4(poly),
+#or batch handlers taking a list of amounts (registered with batch_size) for gateways with bulk APIs.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PaymentError(Exception):
+    pass
+
+
+class MethodStats:
+    def __init__(self):
+        self.count = 0
+        self.failed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.busy = 0.0  # wall time spent settling this method's groups
+        self._lock = threading.Lock()
+
+    def record(self, latency, ok):
+        with self._lock:
+            self.count += 1
+            self.failed += not ok
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def summary(self):
+        return {
+            "payments": self.count,
+            "failed": self.failed,
+            "throughput": round(self.count / self.busy, 1) if self.busy else 0.0,
+            "avg_latency_ms": round(self.total_latency / self.count * 1000, 3) if self.count else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
+
+class PaymentDispatcher:
+    def __init__(self):
+        self.handlers = {}
+        self.limits = {}
+        self.batch_sizes = {}
+        self.stats = {}
+        self._pools = {}
+        self._closed = False
+
+    def register(self, method, handler, concurrency=4, batch_size=None):
+        """
+        handler(amount) -> result; at most `concurrency` calls of it run at once.
+        With batch_size, handler is a batch handler, handler([amount, ...]) -> [result, ...],
+        called with up to batch_size payments of the method at a time.
+        """
+        if self._closed:
+            raise RuntimeError("dispatcher closed")
+        if not isinstance(method, str):
+            raise PaymentError(f"Payment method must be a string: {method!r}")
+        method = method.lower()
+        if method in self._pools:
+            self._pools.pop(method).shutdown()
+        self.handlers[method] = handler
+        self.limits[method] = concurrency
+        self.batch_sizes[method] = batch_size
+        self.stats.setdefault(method, MethodStats())
+        self._pools[method] = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"pay-{method}")
+
+    def close(self):
+        self._closed = True
+        for pool in self._pools.values():
+            pool.shutdown()
+        self._pools.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _settle(self, method, amount):
+        stats = self.stats[method]
+        start = time.perf_counter()
+        try:
+            result = self.handlers[method](amount)
+        except Exception as e:
+            result = PaymentError(f"{method} payment of {amount} failed: {e}")
+        end = time.perf_counter()
+        stats.record(end - start, ok=not isinstance(result, PaymentError))
+        return [result], end
+
+    def _settle_batch(self, method, amounts):
+        """One batch handler call; if it fails, every payment in the chunk fails"""
+        stats = self.stats[method]
+        start = time.perf_counter()
+        try:
+            results = list(self.handlers[method](amounts))
+            if len(results) != len(amounts):
+                raise PaymentError(f"handler returned {len(results)} results for {len(amounts)} payments")
+        except Exception as e:
+            results = [PaymentError(f"{method} payment of {amount} failed: {e}") for amount in amounts]
+        end = time.perf_counter()
+        for result in results:
+            stats.record(end - start, ok=not isinstance(result, PaymentError))
+        return results, end
+
+    def _submit(self, method, group):
+        """Futures for one method's (index, amount) pairs, as (indices, future) pairs"""
+        pool, size = self._pools[method], self.batch_sizes[method]
+        if not size:
+            return [([i], pool.submit(self._settle, method, amount)) for i, amount in group]
+        chunks = (group[k:k + size] for k in range(0, len(group), size))
+        return [([i for i, _ in chunk], pool.submit(self._settle_batch, method, [a for _, a in chunk]))
+                for chunk in chunks]
+
+    def dispatch(self, payments):
+        """
+        Settle (method, amount) pairs. Returns one entry per payment, in input order:
+        the handler's result, or a PaymentError for unknown or non-string methods and
+        failed payments. Raises RuntimeError once the dispatcher is closed.
+        """
+        if self._closed:
+            raise RuntimeError("dispatcher closed")
+        payments = list(payments)
+        results = [None] * len(payments)
+        groups = {}
+        for i, (method, amount) in enumerate(payments):
+            if not isinstance(method, str):
+                results[i] = PaymentError(f"Payment method must be a string: {method!r}")
+                continue
+            method = method.lower()
+            if method not in self.handlers:
+                results[i] = PaymentError(f"No handler for payment method: {method}")
+            else:
+                groups.setdefault(method, []).append((i, amount))
+
+        started = {method: time.perf_counter() for method in groups}
+        futures = {method: self._submit(method, group) for method, group in groups.items()}
+        for method, pending in futures.items():
+            finished = started[method]
+            for indices, future in pending:
+                settled, end = future.result()
+                for i, result in zip(indices, settled):
+                    results[i] = result
+                finished = max(finished, end)
+            self.stats[method].busy += finished - started[method]
+        return results
+
+    def report(self):
+        return {method: stats.summary() for method, stats in self.stats.items()}
+
+
+if __name__ == "__main__":
+    import random
+
+    def gateway(delay):
+        def pay(amt):
+            time.sleep(delay)  # simulated network round trip
+            return f"Paid ₹{amt}"
+        return pay
+
+    def bulk_gateway(delay):
+        def pay_all(amounts):
+            time.sleep(delay)  # one round trip for the whole chunk
+            return [f"Paid ₹{amt}" for amt in amounts]
+        return pay_all
+
+    rnd = random.Random(2)
+    batch = [(rnd.choice(["cash", "card", "upi", "netbanking"]), rnd.randint(10, 5000)) for _ in range(3000)]
+    with PaymentDispatcher() as dispatcher:
+        dispatcher.register("cash", gateway(0.0), concurrency=1)
+        dispatcher.register("card", gateway(0.005), concurrency=16)
+        dispatcher.register("upi", gateway(0.002), concurrency=32)
+        dispatcher.register("netbanking", bulk_gateway(0.01), concurrency=4, batch_size=100)
+        start = time.perf_counter()
+        results = dispatcher.dispatch(batch)
+        print(f"settled {len(results)} payments in {time.perf_counter() - start:.2f} s")
+        for method, summary in dispatcher.report().items():
+            print(method, summary)
@@ -0,0 +1,64 @@
+#Tests for bank_ledger.py
+#   python -m pytest -q test_bank_ledger.py
+import pytest
+
+from bank_ledger import InsufficientFunds, Ledger, LedgerError
+
+
+def test_deposit_withdraw_transfer():
+    ledger = Ledger()
+    ledger.open_account("a", 100)
+    ledger.open_account("b")
+    assert ledger.deposit("a", 50) == 150
+    assert ledger.withdraw("a", 30) == 120
+    ledger.transfer("a", "b", 20)
+    assert (ledger.balance("a"), ledger.balance("b")) == (100, 20)
+    with pytest.raises(InsufficientFunds):
+        ledger.withdraw("b", 21)
+    with pytest.raises(LedgerError):
+        ledger.transfer("a", "a", 1)
+    with pytest.raises(LedgerError):
+        ledger.open_account("c", -1)
+
+
+def test_transfer_batch_skips_failures():
+    ledger = Ledger()
+    ledger.open_account(1, 10)
+    ledger.open_account(2, 0)
+    failed = ledger.transfer_batch([(1, 2, 5), (2, 1, 100), (1, 3, 1), (1, 2, 5)])
+    assert [t for t, _ in failed] == [(2, 1, 100), (1, 3, 1)]
+    assert (ledger.balance(1), ledger.balance(2)) == (0, 10)
+
+
+def test_recover_from_snapshot_and_log_tail(tmp_path):
+    log_path = str(tmp_path / "ledger.jsonl")
+    snap_path = str(tmp_path / "snapshot.json")
+    ledger = Ledger(log_path=log_path)
+    # int account ids must survive the JSON round trip
+    ledger.open_account(1, 100)
+    ledger.open_account(2, 0)
+    ledger.transfer(1, 2, 40)
+    ledger.snapshot(snap_path)
+    ledger.open_account(3)
+    ledger.deposit(3, 7)
+    ledger.transfer_batch([(2, 3, 10), (1, 2, 5)])
+    ledger.close()
+
+    recovered = Ledger.recover(snap_path, log_path)
+    try:
+        assert recovered.balances == ledger.balances == {1: 55, 2: 35, 3: 17}
+        assert recovered.seq == ledger.seq
+        # the recovered ledger keeps appending to the same log
+        recovered.withdraw(3, 17)
+    finally:
+        recovered.close()
+    assert Ledger.recover(log_path=log_path).balances == {1: 55, 2: 35, 3: 0}
+
+
+def test_recover_from_log_only(tmp_path):
+    log_path = str(tmp_path / "ledger.jsonl")
+    ledger = Ledger(log_path=log_path)
+    ledger.open_account("x")
+    ledger.deposit("x", 5)
+    ledger.close()
+    assert Ledger.recover(log_path=log_path).balances == {"x": 5}
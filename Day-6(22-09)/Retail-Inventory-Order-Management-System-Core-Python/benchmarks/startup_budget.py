@@ -0,0 +1,66 @@
+# benchmarks/startup_budget.py
+"""
+Startup budget check for retail-cli.
+Run from the project root:  python benchmarks/startup_budget.py [--budget-ms 150]
+Fails (exit code 1) if `retail-cli --help` is over budget or if importing the
+CLI pulls in modules that should only load once a command actually runs.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# heavy modules that must stay out of the import path of --help
+DEFERRED_MODULES = ("supabase", "dotenv", "pandas", "numpy")
+
+
+def import_times(module: str) -> dict:
+    """Return {module: cumulative import time in microseconds} from `python -X importtime`"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def help_wall_time_ms(runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "src.cli.main", "--help"], capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="max median wall time of --help")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    times = import_times("src.cli.main")
+    leaked = sorted(name for name in times if name.split(".")[0] in DEFERRED_MODULES)
+    print(f"import src.cli.main: {times.get('src.cli.main', 0) / 1000:.1f} ms cumulative")
+
+    wall = help_wall_time_ms(args.runs)
+    print(f"retail-cli --help: {wall:.1f} ms median over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if leaked:
+        print("FAIL: deferred modules imported at startup:", ", ".join(leaked))
+        failed = True
+    if wall > args.budget_ms:
+        print("FAIL: --help is over the startup budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
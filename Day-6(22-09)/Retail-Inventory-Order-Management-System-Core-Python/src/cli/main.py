@@ -312,10 +312,14 @@ if __name__ == "__main__":
 # src/cli/main.py
 import argparse
 import json
+from datetime import date
 
 from src.service.product_service import ProductService, ProductError
 from src.service.customer_service import CustomerService, CustomerError
 from src.service.order_service import OrderService, OrderError
+from src.service.revenue_service import RevenueService, RevenueError
+from src.service.ranking_service import RankingService, RankingError
+from src.service.bulk_executor import BulkExecutor
 from src.dao.product_dao import ProductDAO
 from src.dao.customer_dao import CustomerDAO
 from src.dao.order_dao import OrderDAO
@@ -325,14 +329,26 @@ class CLI:
     """Main CLI handler using services"""
 
     def __init__(self):
+        # Services (and the supabase client) are only built once a command runs,
+        # so --help and argument errors stay fast.
+        self._connected = False
+
+    def connect(self):
+        if self._connected:
+            return
         product_dao = ProductDAO()
         customer_dao = CustomerDAO()
         order_dao = OrderDAO()
         
         self.product_service = ProductService(dao=product_dao)
         self.customer_service = CustomerService(dao=customer_dao)
-        self.order_service = OrderService(order_dao=order_dao, customer_service=self.customer_service)
-
+        self.revenue_service = RevenueService(product_dao=product_dao)
+        self.ranking_service = RankingService(order_dao=order_dao, product_dao=product_dao)
+        self.order_service = OrderService(order_dao=order_dao, customer_service=self.customer_service,
+                                          product_service=self.product_service,
+                                          revenue_service=self.revenue_service,
+                                          ranking_service=self.ranking_service)
+        self._connected = True
 
     def cmd_product_add(self, args):
         try:
@@ -346,6 +362,25 @@ class CLI:
         products = self.product_service.dao.list_products()
         print(json.dumps([vars(p) for p in products], indent=2))
 
+    def cmd_product_restock(self, args):
+        try:
+            if args.manifest:
+                results = self.product_service.restock_from_csv(args.manifest, progress=BulkExecutor.print_progress)
+            else:
+                deltas = {}
+                for item in args.item or []:
+                    try:
+                        pid, delta = item.split(":")
+                        deltas[int(pid)] = deltas.get(int(pid), 0) + int(delta)
+                    except ValueError:
+                        print("Invalid item format:", item)
+                        return
+                results = self.product_service.restock_products(deltas, progress=BulkExecutor.print_progress)
+            print("Restock results:")
+            print(json.dumps(results, indent=2))
+        except ProductError as e:
+            print("Error:", e)
+
 
     def cmd_customer_add(self, args):
         try:
@@ -394,14 +429,14 @@ class CLI:
                     return
             o = self.order_service.create_order(args.customer, items)
             print("Order created:")
-            print(json.dumps(vars(o), indent=2))
+            print(json.dumps(vars(o), indent=2, default=str))
         except OrderError as e:
             print("Error:", e)
 
     def cmd_order_show(self, args):
         try:
             o = self.order_service.get_order_details(args.order)
-            print(json.dumps(vars(o), indent=2))
+            print(json.dumps(o, indent=2, default=str))
         except OrderError as e:
             print("Error:", e)
 
@@ -409,10 +444,61 @@ class CLI:
         try:
             o = self.order_service.cancel_order(args.order)
             print("Order cancelled:")
-            print(json.dumps(vars(o), indent=2))
+            print(json.dumps(vars(o), indent=2, default=str))
         except OrderError as e:
             print("Error:", e)
 
+    def cmd_report_revenue(self, args):
+        try:
+            start = date.fromisoformat(args.start)
+            end = date.fromisoformat(args.end)
+            report = self.revenue_service.revenue(start, end, bucket=args.bucket, by=args.by)
+            print(json.dumps(report, indent=2))
+        except ValueError as e:
+            print("Invalid date:", e)
+        except RevenueError as e:
+            print("Error:", e)
+
+    def cmd_report_backfill(self, args):
+        self.revenue_service.backfill()
+        print("Revenue buckets rebuilt from existing orders")
+
+    def cmd_report_top(self, args):
+        try:
+            top = self.ranking_service.top_selling_products(args.n, args.window)
+            print(json.dumps(top, indent=2))
+        except RankingError as e:
+            print("Error:", e)
+
+    def cmd_report_rfm(self, args):
+        # pandas is only needed for this report, so load it on demand
+        from src.service.segmentation_service import SegmentationService, SegmentationError
+        service = SegmentationService(order_dao=self.order_service.dao, customer_dao=self.customer_service.dao)
+        try:
+            if args.export:
+                count = service.export(args.export, segment=args.segment)
+                print(f"Exported {count} customers to {args.export}")
+            else:
+                print(json.dumps(service.summary(), indent=2))
+        except SegmentationError as e:
+            print("Error:", e)
+
+    def cmd_sync(self, args):
+        from src.dao.replica import get_replica
+        from src.service.sync_service import SyncService, SyncError
+        replica = get_replica()
+        if replica is None:
+            print("Error: set REPLICA_PATH to enable the local replica")
+            return
+        service = SyncService(replica)
+        try:
+            if args.interval:
+                service.run_forever(args.interval)
+            else:
+                print(json.dumps(service.sync(), indent=2))
+        except SyncError as e:
+            print("Error:", e)
+
     def build_parser(self):
         parser = argparse.ArgumentParser(prog="retail-cli")
         sub = parser.add_subparsers(dest="cmd")
@@ -432,6 +518,11 @@ class CLI:
         listp = p_prod_sub.add_parser("list")
         listp.set_defaults(func=self.cmd_product_list)
 
+        restockp = p_prod_sub.add_parser("restock")
+        restockp.add_argument("--item", nargs="+", action="extend", help="prod_id:delta (repeatable)")
+        restockp.add_argument("--manifest", help="CSV receiving manifest with prod_id,delta columns")
+        restockp.set_defaults(func=self.cmd_product_restock)
+
         # Customer commands
         p_cust = sub.add_parser("customer")
         c_sub = p_cust.add_subparsers(dest="action")
@@ -467,7 +558,7 @@ class CLI:
 
         createo = o_sub.add_parser("create")
         createo.add_argument("--customer", required=True)
-        createo.add_argument("--item", required=True, nargs="+", help="prod_id:qty (repeatable)")
+        createo.add_argument("--item", required=True, nargs="+", action="extend", help="prod_id:qty (repeatable)")
         createo.set_defaults(func=self.cmd_order_create)
 
         showo = o_sub.add_parser("show")
@@ -478,12 +569,42 @@ class CLI:
         cano.add_argument("--order", type=int, required=True)
         cano.set_defaults(func=self.cmd_order_cancel)
 
+        # Report commands
+        p_report = sub.add_parser("report")
+        r_sub = p_report.add_subparsers(dest="action")
+
+        revenuer = r_sub.add_parser("revenue")
+        revenuer.add_argument("--start", required=True, help="YYYY-MM-DD")
+        revenuer.add_argument("--end", required=True, help="YYYY-MM-DD")
+        revenuer.add_argument("--bucket", choices=RevenueService.BUCKETS, default="day")
+        revenuer.add_argument("--by", choices=tuple(RevenueService.BREAKDOWNS))
+        revenuer.set_defaults(func=self.cmd_report_revenue)
+
+        backfillr = r_sub.add_parser("backfill", help="one-time load of revenue buckets from existing orders")
+        backfillr.set_defaults(func=self.cmd_report_backfill)
+
+        topr = r_sub.add_parser("top")
+        topr.add_argument("--n", type=int, default=5)
+        topr.add_argument("--window", choices=tuple(RankingService.WINDOWS))
+        topr.set_defaults(func=self.cmd_report_top)
+
+        rfmr = r_sub.add_parser("rfm")
+        rfmr.add_argument("--export", help="write the segment table to this CSV file")
+        rfmr.add_argument("--segment", help="export only this segment, e.g. Champions")
+        rfmr.set_defaults(func=self.cmd_report_rfm)
+
+        # Replica sync
+        p_sync = sub.add_parser("sync", help="pull changes into the local read replica")
+        p_sync.add_argument("--interval", type=float, help="keep polling every N seconds")
+        p_sync.set_defaults(func=self.cmd_sync)
+
         return parser
 
     def run(self):
         parser = self.build_parser()
         args = parser.parse_args()
         if hasattr(args, "func"):
+            self.connect()
             args.func(args)
         else:
             parser.print_help()
@@ -1,17 +1,61 @@
 # src/config.py
 import os
-from dotenv import load_dotenv
-from supabase import create_client, Client
- 
-load_dotenv()  # loads .env from project root
- 
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
- 
-def get_supabase() -> Client:
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+
+class Settings:
     """
-    Return a supabase client. Raises RuntimeError if config missing.
+    Environment settings, read on first access.
+    .env is only loaded when a setting is actually needed, so importing a DAO
+    (or running --help) does not touch the filesystem or the supabase package.
     """
-    if not supabase_url or not supabase_key:
+
+    def __init__(self):
+        self._loaded = False
+
+    def _load(self):
+        if not self._loaded:
+            from dotenv import load_dotenv
+            load_dotenv()  # loads .env from project root
+            self._loaded = True
+
+    @property
+    def supabase_url(self) -> str | None:
+        self._load()
+        return os.getenv("SUPABASE_URL")
+
+    @property
+    def supabase_key(self) -> str | None:
+        self._load()
+        return os.getenv("SUPABASE_KEY")
+
+    @property
+    def replica_path(self) -> str | None:
+        """SQLite file (or ":memory:") holding the local read replica; unset disables it"""
+        self._load()
+        return os.getenv("REPLICA_PATH")
+
+    @property
+    def replica_max_staleness(self) -> float:
+        """How old (seconds) replica data may be before DAOs read Supabase instead"""
+        self._load()
+        return float(os.getenv("REPLICA_MAX_STALENESS", "60"))
+
+
+settings = Settings()
+
+
+@lru_cache(maxsize=None)
+def get_supabase() -> "Client":
+    """
+    Return the shared supabase client, creating it on first use.
+    Raises RuntimeError if config missing.
+    """
+    if not settings.supabase_url or not settings.supabase_key:
         raise RuntimeError("SUPABASE_URL and SUPABASE_KEY must be set in environment (.env)")
-    return create_client(supabase_url, supabase_key)
\ No newline at end of file
+    from supabase import create_client
+    return create_client(settings.supabase_url, settings.supabase_key)
@@ -61,7 +61,8 @@ class CustomerDAO:
 
 # src/dao/customer_dao.py
 from typing import List, Optional, Dict
-from src.config import get_supabase
+from src.config import get_supabase, settings
+from src.dao.replica import get_replica
 
 class Customer:
     def __init__(self, name: str, email: str, phone: str, city: str | None = None):
@@ -79,6 +80,7 @@ class Customer:
             phone=data.get("phone"),
             city=data.get("city")
         )
+        customer.id = data.get("id")
         customer.orders = data.get("orders", [])
         return customer
 
@@ -87,6 +89,22 @@ class CustomerDAO:
 
     def __init__(self):
         self._sb = get_supabase()
+        self._replica = get_replica()
+
+    def _fresh_replica(self):
+        """The local replica, if customers were synced within REPLICA_MAX_STALENESS"""
+        if self._replica and self._replica.is_fresh("customers", settings.replica_max_staleness):
+            return self._replica
+        return None
+
+    def _write_through(self, rows: List[Dict]) -> None:
+        """Copy rows just written to Supabase into the replica, so the next read sees them"""
+        if self._replica and rows:
+            self._replica.upsert_rows("customers", rows)
+
+    def _evict(self, key) -> None:
+        if self._replica:
+            self._replica.delete_rows("customers", [key])
 
     def create_customer(self, customer: Customer) -> Customer:
         payload = {
@@ -98,16 +116,41 @@ class CustomerDAO:
         }
         self._sb.table("customers").insert(payload).execute()
         resp = self._sb.table("customers").select("*").eq("email", customer.email).limit(1).execute()
+        self._write_through(resp.data)
         if resp.data:
             return Customer.from_dict(resp.data[0])
         return customer
 
-    def get_customer_by_email(self, email: str) -> Optional[Customer]:
+    def get_customer_by_email(self, email: str, consistent: bool = False) -> Optional[Customer]:
+        """consistent=True always reads Supabase (use before writing the row back)"""
+        replica = None if consistent else self._fresh_replica()
+        if replica:
+            rows = replica.find("customers", "email", email)
+            return Customer.from_dict(rows[0]) if rows else None
         resp = self._sb.table("customers").select("*").eq("email", email).limit(1).execute()
         if resp.data:
             return Customer.from_dict(resp.data[0])
         return None
 
+    def get_customer_by_id(self, customer_id: int) -> Optional[Customer]:
+        replica = self._fresh_replica()
+        if replica:
+            row = replica.get("customers", customer_id)
+            return Customer.from_dict(row) if row else None
+        resp = self._sb.table("customers").select("*").eq("id", customer_id).limit(1).execute()
+        if resp.data:
+            return Customer.from_dict(resp.data[0])
+        return None
+
+    def get_customers_by_ids(self, customer_ids: List[int], chunk_size: int = 500) -> List[Customer]:
+        """Fetch many customers with one query per chunk of ids"""
+        ids = list(set(customer_ids))
+        customers = []
+        for start in range(0, len(ids), chunk_size):
+            resp = self._sb.table("customers").select("*").in_("id", ids[start:start + chunk_size]).execute()
+            customers.extend(Customer.from_dict(c) for c in resp.data or [])
+        return customers
+
     def update_customer(self, customer: Customer) -> Optional[Customer]:
         payload = {
             "name": customer.name,
@@ -117,6 +160,7 @@ class CustomerDAO:
         }
         self._sb.table("customers").update(payload).eq("email", customer.email).execute()
         resp = self._sb.table("customers").select("*").eq("email", customer.email).limit(1).execute()
+        self._write_through(resp.data)
         if resp.data:
             return Customer.from_dict(resp.data[0])
         return None
@@ -130,6 +174,7 @@ class CustomerDAO:
             # block deletion if orders exist
             return False
         self._sb.table("customers").delete().eq("email", email).execute()
+        self._evict(customer_data["id"])
         return True
 
     def list_customers(self) -> List[Customer]:
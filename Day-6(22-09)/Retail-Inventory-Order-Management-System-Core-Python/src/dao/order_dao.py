@@ -167,17 +167,25 @@ class OrderDAO:
 '''
 
 # src/dao/order_dao.py
+from datetime import datetime
 from typing import List, Dict, Optional
-from src.config import get_supabase
+from src.config import get_supabase, settings
+from src.dao.replica import get_replica
 
 
 class Order:
-    def __init__(self, order_id: int, customer_id: int, items: List[Dict], total_amount: float, status: str = "PLACED"):
+    def __init__(self, order_id: int, customer_id: int, items: List[Dict], total_amount: float, status: str = "PLACED",
+                 created_at: datetime | None = None):
         self.order_id = order_id
         self.customer_id = customer_id
         self.items = items
         self.total_amount = total_amount
         self.status = status
+        self.created_at = created_at
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
 
 
 class OrderDAO:
@@ -185,8 +193,38 @@ class OrderDAO:
         self._sb = get_supabase()
         self._orders_table = "orders"
         self._order_items_table = "order_items"
+        self._replica = get_replica()
+
+    def _fresh_replica(self):
+        """The local replica, if orders and their items were synced within REPLICA_MAX_STALENESS"""
+        max_staleness = settings.replica_max_staleness
+        if (self._replica and self._replica.is_fresh(self._orders_table, max_staleness)
+                and self._replica.is_fresh(self._order_items_table, max_staleness)):
+            return self._replica
+        return None
+
+    def _write_through(self, table: str, rows: List[Dict]) -> None:
+        """Copy rows just written to Supabase into the replica, so the next read sees them"""
+        if self._replica and rows:
+            self._replica.upsert_rows(table, rows)
+
+    @staticmethod
+    def _order_from_row(order_data: Dict, items: List[Dict]) -> Order:
+        return Order(
+            order_id=order_data["id"],
+            customer_id=order_data["customer_id"],
+            items=items,
+            total_amount=order_data["total_amount"],
+            status=order_data["status"],
+            created_at=_parse_timestamp(order_data.get("created_at"))
+        )
 
     def insert_order(self, customer_id: int, items: List[Dict], total_amount: float) -> Order:
+        """
+        Items may carry the category and priced line_total they were sold at:
+
+            alter table order_items add column category text, add column line_total numeric;
+        """
         # Insert into orders table
         order_payload = {
             "customer_id": customer_id,
@@ -199,6 +237,7 @@ class OrderDAO:
 
         # Get generated order_id
         order_id = resp.data[0]["id"]  # assuming PK column is "id"
+        self._write_through(self._orders_table, resp.data)
 
         # Insert order items
         for item in items:
@@ -206,13 +245,25 @@ class OrderDAO:
                 "order_id": order_id,
                 "prod_id": item["prod_id"],
                 "quantity": item["quantity"],
-                "price": item["price"]
+                "price": item["price"],
+                "category": item.get("category"),
+                "line_total": item.get("line_total")
             }
-            self._sb.table(self._order_items_table).insert(item_payload).execute()
+            item_resp = self._sb.table(self._order_items_table).insert(item_payload).execute()
+            self._write_through(self._order_items_table, item_resp.data)
 
-        return Order(order_id, customer_id, items, total_amount)
+        return Order(order_id, customer_id, items, total_amount,
+                     created_at=_parse_timestamp(resp.data[0].get("created_at")))
+
+    def get_order_by_id(self, order_id: int, consistent: bool = False) -> Optional[Order]:
+        """consistent=True always reads Supabase (use before status changes)"""
+        replica = None if consistent else self._fresh_replica()
+        if replica:
+            order_data = replica.get(self._orders_table, order_id)
+            if not order_data:
+                return None
+            return self._order_from_row(order_data, replica.find(self._order_items_table, "order_id", order_id))
 
-    def get_order_by_id(self, order_id: int) -> Optional[Order]:
         resp = self._sb.table(self._orders_table).select("*").eq("id", order_id).limit(1).execute()
         if not resp.data:
             return None
@@ -222,25 +273,82 @@ class OrderDAO:
         items_resp = self._sb.table(self._order_items_table).select("*").eq("order_id", order_id).execute()
         items = items_resp.data or []
 
-        return Order(
-            order_id=order_data["id"],
-            customer_id=order_data["customer_id"],
-            items=items,
-            total_amount=order_data["total_amount"],
-            status=order_data["status"]
-        )
+        return self._order_from_row(order_data, items)
 
     def list_orders_by_customer(self, customer_id: int) -> List[Order]:
+        replica = self._fresh_replica()
+        if replica:
+            return [
+                self._order_from_row(o, replica.find(self._order_items_table, "order_id", o["id"]))
+                for o in replica.find(self._orders_table, "customer_id", customer_id)
+            ]
+
         resp = self._sb.table(self._orders_table).select("*").eq("customer_id", customer_id).execute()
         orders = []
         for order_data in resp.data:
             items_resp = self._sb.table(self._order_items_table).select("*").eq("order_id", order_data["id"]).execute()
             items = items_resp.data or []
-            orders.append(Order(order_data["id"], customer_id, items, order_data["total_amount"], order_data["status"]))
+            orders.append(self._order_from_row(order_data, items))
         return orders
 
     def update_order(self, order: Order) -> None:
-        self._sb.table(self._orders_table).update({
+        resp = self._sb.table(self._orders_table).update({
             "status": order.status,
             "total_amount": order.total_amount
         }).eq("id", order.order_id).execute()
+        self._write_through(self._orders_table, resp.data)
+
+    def list_order_headers(self, page_size: int = 1000) -> List[Dict]:
+        """
+        Return id, customer_id, total_amount, status and created_at of every non-cancelled order (no items).
+        Pages by id (keyset), so each request is an index range scan however deep the page
+        """
+        headers: List[Dict] = []
+        last_id = None
+        while True:
+            q = (
+                self._sb.table(self._orders_table)
+                .select("id,customer_id,total_amount,status,created_at")
+                .neq("status", "CANCELLED")
+            )
+            if last_id is not None:
+                q = q.gt("id", last_id)
+            resp = q.order("id", desc=False).limit(page_size).execute()
+            page = resp.data or []
+            headers.extend(page)
+            if len(page) < page_size:
+                return headers
+            last_id = page[-1]["id"]
+
+    def product_sales_totals(self) -> Dict[int, int]:
+        """
+        Quantity sold per product, grouped in the database:
+
+            create or replace function product_sales_totals()
+            returns table (prod_id int, quantity bigint) language sql as $$
+                select i.prod_id, sum(i.quantity)
+                from order_items i join orders o on o.id = i.order_id
+                where o.status <> 'CANCELLED'
+                group by i.prod_id;
+            $$;
+        """
+        resp = self._sb.rpc("product_sales_totals", {}).execute()
+        return {row["prod_id"]: row["quantity"] for row in resp.data or []}
+
+    def product_sales_by_hour(self, since: datetime) -> List[Dict]:
+        """
+        Quantity sold per (hour, product) for orders placed since the given time:
+
+            create or replace function product_sales_by_hour(since timestamptz)
+            returns table (hour timestamptz, prod_id int, quantity bigint) language sql as $$
+                select date_trunc('hour', o.created_at), i.prod_id, sum(i.quantity)
+                from order_items i join orders o on o.id = i.order_id
+                where o.status <> 'CANCELLED' and o.created_at >= since
+                group by 1, 2;
+            $$;
+        """
+        resp = self._sb.rpc("product_sales_by_hour", {"since": since.isoformat()}).execute()
+        return [
+            {"hour": datetime.fromisoformat(row["hour"]), "prod_id": row["prod_id"], "quantity": row["quantity"]}
+            for row in resp.data or []
+        ]
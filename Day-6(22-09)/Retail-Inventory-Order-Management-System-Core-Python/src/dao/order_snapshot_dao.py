@@ -0,0 +1,26 @@
+# src/dao/order_snapshot_dao.py
+from typing import Dict, Optional
+from src.config import get_supabase
+
+
+class OrderSnapshotDAO:
+    """
+    Denormalized order-detail snapshots for orders that can no longer change
+    (COMPLETED or CANCELLED), so showing one is a single key lookup:
+
+        create table order_snapshots (
+            order_id int primary key references orders(id),
+            detail jsonb not null
+        );
+    """
+
+    def __init__(self):
+        self._sb = get_supabase()
+        self._table = "order_snapshots"
+
+    def get_snapshot(self, order_id: int) -> Optional[Dict]:
+        resp = self._sb.table(self._table).select("detail").eq("order_id", order_id).limit(1).execute()
+        return resp.data[0]["detail"] if resp.data else None
+
+    def save_snapshot(self, order_id: int, detail: Dict) -> None:
+        self._sb.table(self._table).upsert({"order_id": order_id, "detail": detail}).execute()
@@ -121,8 +121,10 @@ class ProductDAO:
 
 
 # src/dao/product_dao.py
-from typing import Optional, List
-from src.config import get_supabase
+import uuid
+from typing import Optional, List, Dict
+from src.config import get_supabase, settings
+from src.dao.replica import get_replica
 
 
 class Product:
@@ -151,6 +153,22 @@ class ProductDAO:
 
     def __init__(self):
         self._sb = get_supabase()
+        self._replica = get_replica()
+
+    def _fresh_replica(self):
+        """The local replica, if products were synced within REPLICA_MAX_STALENESS"""
+        if self._replica and self._replica.is_fresh("products", settings.replica_max_staleness):
+            return self._replica
+        return None
+
+    def _write_through(self, rows: List[Dict]) -> None:
+        """Copy rows just written to Supabase into the replica, so the next read sees them"""
+        if self._replica and rows:
+            self._replica.upsert_rows("products", rows)
+
+    def _evict(self, key) -> None:
+        if self._replica:
+            self._replica.delete_rows("products", [key])
 
     def create_product(
         self,
@@ -169,36 +187,97 @@ class ProductDAO:
 
         # Fetch inserted row
         resp = self._sb.table("products").select("*").eq("sku", sku).limit(1).execute()
+        self._write_through(resp.data)
         if resp.data:
             return Product.from_dict(resp.data[0])
         return None
 
-    def get_product_by_id(self, prod_id: int) -> Optional[Product]:
+    def get_product_by_id(self, prod_id: int, consistent: bool = False) -> Optional[Product]:
+        """consistent=True always reads Supabase (use before stock changes)"""
+        replica = None if consistent else self._fresh_replica()
+        if replica:
+            row = replica.get("products", prod_id)
+            return Product.from_dict(row) if row else None
         resp = self._sb.table("products").select("*").eq("prod_id", prod_id).limit(1).execute()
         if resp.data:
             return Product.from_dict(resp.data[0])
         return None
 
-    def get_product_by_sku(self, sku: str) -> Optional[Product]:
+    def get_product_by_sku(self, sku: str, consistent: bool = False) -> Optional[Product]:
+        """consistent=True always reads Supabase (use for uniqueness checks before inserting)"""
+        replica = None if consistent else self._fresh_replica()
+        if replica:
+            rows = replica.find("products", "sku", sku)
+            return Product.from_dict(rows[0]) if rows else None
         resp = self._sb.table("products").select("*").eq("sku", sku).limit(1).execute()
         if resp.data:
             return Product.from_dict(resp.data[0])
         return None
 
+    def get_products_by_ids(self, prod_ids: List[int]) -> List[Product]:
+        """Fetch many products in one query"""
+        if not prod_ids:
+            return []
+        resp = self._sb.table("products").select("*").in_("prod_id", list(set(prod_ids))).execute()
+        return [Product.from_dict(d) for d in resp.data] if resp.data else []
+
     def update_product(self, prod_id: int, fields: dict) -> Optional[Product]:
         """Update product fields and return updated Product"""
         self._sb.table("products").update(fields).eq("prod_id", prod_id).execute()
         resp = self._sb.table("products").select("*").eq("prod_id", prod_id).limit(1).execute()
+        self._write_through(resp.data)
         if resp.data:
             return Product.from_dict(resp.data[0])
         return None
 
+    def increment_stock_bulk(self, deltas: Dict[int, int], restock_id: str | None = None) -> List[Product]:
+        """
+        Add each delta to its product's stock in one RPC and return the updated Products.
+        The increment runs server-side, so concurrent restocks cannot overwrite each other.
+        Each (restock_id, prod_id) is applied at most once, so a retried or re-split call
+        with the same restock_id returns the current stock instead of adding the delta again.
+        Needs this table and function in the database:
+
+            create table stock_restocks (
+                restock_id uuid not null,
+                prod_id int not null,
+                primary key (restock_id, prod_id)
+            );
+
+            create or replace function increment_stock_bulk(restock_id uuid, deltas jsonb)
+            returns setof products language sql as $$
+                with claimed as (
+                    insert into stock_restocks (restock_id, prod_id)
+                    select increment_stock_bulk.restock_id, d.key::int from jsonb_each_text(deltas) d
+                    on conflict do nothing
+                    returning prod_id
+                ), updated as (
+                    update products p
+                    set stock = coalesce(p.stock, 0) + (deltas->>p.prod_id::text)::int
+                    from claimed c
+                    where p.prod_id = c.prod_id
+                    returning p.*
+                )
+                select * from updated
+                union all
+                select p.* from products p
+                where p.prod_id in (select d.key::int from jsonb_each_text(deltas) d)
+                  and p.prod_id not in (select prod_id from claimed);
+            $$;
+        """
+        payload = {str(prod_id): delta for prod_id, delta in deltas.items()}
+        params = {"restock_id": restock_id or str(uuid.uuid4()), "deltas": payload}
+        resp = self._sb.rpc("increment_stock_bulk", params).execute()
+        self._write_through(resp.data)
+        return [Product.from_dict(d) for d in resp.data] if resp.data else []
+
     def delete_product(self, prod_id: int) -> Optional[Product]:
         """Delete product and return deleted Product"""
         resp_before = self._sb.table("products").select("*").eq("prod_id", prod_id).limit(1).execute()
         if resp_before.data:
             product = Product.from_dict(resp_before.data[0])
             self._sb.table("products").delete().eq("prod_id", prod_id).execute()
+            self._evict(prod_id)
             return product
         return None
 
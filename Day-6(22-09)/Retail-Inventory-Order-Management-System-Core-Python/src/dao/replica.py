@@ -0,0 +1,109 @@
+# src/dao/replica.py
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+from src.config import settings
+
+
+class LocalReplica:
+    """
+    Local SQLite copy of the retail tables, kept up to date by SyncService; DAOs also
+    write their own inserts, updates and deletes through, so a write is visible at once.
+    Rows are stored as JSON keyed by (table, primary key); the columns DAOs
+    look rows up by get their own expression indexes.
+    Use path=":memory:" for a process-local replica.
+    """
+
+    PRIMARY_KEYS = {"products": "prod_id", "customers": "id", "orders": "id", "order_items": "id"}
+    LOOKUPS = {"products": ["sku"], "customers": ["email"], "orders": ["customer_id"], "order_items": ["order_id"]}
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "create table if not exists replica_rows (tbl text, pk text, data text, primary key (tbl, pk))"
+            )
+            self._conn.execute(
+                "create table if not exists replica_state (tbl text primary key, watermark text, synced_at real)"
+            )
+            for table, columns in self.LOOKUPS.items():
+                for column in columns:
+                    self._conn.execute(
+                        f"create index if not exists ix_{table}_{column} "
+                        f"on replica_rows (tbl, json_extract(data, '$.{column}'))"
+                    )
+
+    # ---- writes (SyncService) ----
+    def upsert_rows(self, table: str, rows: Iterable[Dict]) -> int:
+        pk = self.PRIMARY_KEYS[table]
+        params = [(table, str(row[pk]), json.dumps(row, default=str)) for row in rows]
+        with self._lock, self._conn:
+            self._conn.executemany("insert or replace into replica_rows (tbl, pk, data) values (?, ?, ?)", params)
+        return len(params)
+
+    def delete_rows(self, table: str, keys: Iterable) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("delete from replica_rows where tbl = ? and pk = ?",
+                                   [(table, str(k)) for k in keys])
+
+    def clear(self, table: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("delete from replica_rows where tbl = ?", (table,))
+
+    def mark_synced(self, table: str, watermark: str | None, synced_at: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "insert or replace into replica_state (tbl, watermark, synced_at) values (?, ?, ?)",
+                (table, watermark, synced_at),
+            )
+
+    # ---- reads (DAOs) ----
+    def watermark(self, table: str) -> Optional[str]:
+        row = self._state(table)
+        return row[0] if row else None
+
+    def staleness(self, table: str) -> float:
+        """Seconds since the table was last synced (infinite if never)"""
+        row = self._state(table)
+        return time.time() - row[1] if row else float("inf")
+
+    def is_fresh(self, table: str, max_staleness: float) -> bool:
+        return self.staleness(table) <= max_staleness
+
+    def get(self, table: str, key) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute("select data from replica_rows where tbl = ? and pk = ?",
+                                     (table, str(key))).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, table: str, column: str, value) -> List[Dict]:
+        if column not in self.LOOKUPS.get(table, []):
+            raise ValueError(f"No replica index on {table}.{column}")
+        with self._lock:
+            rows = self._conn.execute(
+                f"select data from replica_rows where tbl = ? and json_extract(data, '$.{column}') = ?",
+                (table, value),
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def keys(self, table: str) -> List[str]:
+        """Primary keys (as text) of every replicated row of the table"""
+        with self._lock:
+            rows = self._conn.execute("select pk from replica_rows where tbl = ?", (table,)).fetchall()
+        return [r[0] for r in rows]
+
+    def _state(self, table: str):
+        with self._lock:
+            return self._conn.execute("select watermark, synced_at from replica_state where tbl = ?",
+                                      (table,)).fetchone()
+
+
+@lru_cache(maxsize=None)
+def get_replica() -> Optional[LocalReplica]:
+    """The configured replica (REPLICA_PATH), or None when DAOs should always read Supabase"""
+    path = settings.replica_path
+    return LocalReplica(path) if path else None
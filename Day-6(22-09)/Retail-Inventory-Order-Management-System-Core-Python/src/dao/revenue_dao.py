@@ -0,0 +1,101 @@
+# src/dao/revenue_dao.py
+from datetime import date
+from typing import List, Dict
+from src.config import get_supabase
+
+
+class RevenueDAO:
+    """
+    Data Access Object for pre-aggregated daily revenue buckets.
+    One row per (day, customer_id, category), kept up to date as orders change:
+
+        create table revenue_daily (
+            day date not null,
+            customer_id int not null,
+            category text not null,
+            revenue numeric not null default 0,
+            primary key (day, customer_id, category)
+        );
+
+        create or replace function increment_revenue_buckets(rows jsonb)
+        returns void language sql as $$
+            insert into revenue_daily (day, customer_id, category, revenue)
+            select (r->>'day')::date, (r->>'customer_id')::int, r->>'category', (r->>'revenue')::numeric
+            from jsonb_array_elements(rows) r
+            on conflict (day, customer_id, category)
+            do update set revenue = revenue_daily.revenue + excluded.revenue;
+        $$;
+
+    Orders placed before the table existed are loaded once with backfill(), which
+    rebuilds every bucket from non-cancelled, non-refunded orders (days are UTC dates,
+    lines count at their stored category and priced line_total where they have one):
+
+        create or replace function backfill_revenue_daily()
+        returns void language sql as $$
+            insert into revenue_daily (day, customer_id, category, revenue)
+            select (o.created_at at time zone 'utc')::date, o.customer_id,
+                   coalesce(i.category, p.category, 'Uncategorized'),
+                   sum(coalesce(i.line_total, i.price * i.quantity))
+            from orders o
+            join order_items i on i.order_id = o.id
+            left join products p on p.prod_id = i.prod_id
+            where o.status <> 'CANCELLED'
+              and not exists (select 1 from payments pay
+                              where pay.order_id = o.id and pay.status = 'REFUNDED')
+            group by 1, 2, 3
+            on conflict (day, customer_id, category)
+            do update set revenue = excluded.revenue;
+        $$;
+    """
+
+    PAGE_SIZE = 1000
+
+    def __init__(self):
+        self._sb = get_supabase()
+        self._table = "revenue_daily"
+
+    def increment_buckets(self, rows: List[Dict]) -> None:
+        """Add revenue to (day, customer_id, category) buckets in one RPC"""
+        if rows:
+            self._sb.rpc("increment_revenue_buckets", {"rows": rows}).execute()
+
+    def backfill(self) -> None:
+        """Rebuild all buckets from the orders tables (one-time, see backfill_revenue_daily)"""
+        self._sb.rpc("backfill_revenue_daily", {}).execute()
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        """PostgREST filter literal; quoted so commas and parentheses in categories are safe"""
+        return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    def list_buckets(self, start: date, end: date) -> List[Dict]:
+        """
+        Return all buckets with start <= day <= end, paging through the table by its
+        primary key (keyset), so each page is an index range scan however deep it is
+        """
+        rows: List[Dict] = []
+        last = None
+        while True:
+            q = (
+                self._sb.table(self._table)
+                .select("day,customer_id,category,revenue")
+                .gte("day", start.isoformat())
+                .lte("day", end.isoformat())
+            )
+            if last is not None:
+                day, customer_id, category = last["day"], last["customer_id"], self._quote(last["category"])
+                q = q.or_(f"day.gt.{day},"
+                          f"and(day.eq.{day},customer_id.gt.{customer_id}),"
+                          f"and(day.eq.{day},customer_id.eq.{customer_id},category.gt.{category})")
+            resp = (
+                q.order("day", desc=False)
+                .order("customer_id", desc=False)
+                .order("category", desc=False)
+                .limit(self.PAGE_SIZE)
+                .execute()
+            )
+            page = resp.data or []
+            rows.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                return rows
+            last = page[-1]
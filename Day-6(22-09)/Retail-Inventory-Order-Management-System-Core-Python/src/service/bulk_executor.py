@@ -0,0 +1,165 @@
+# src/service/bulk_executor.py
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+
+class TokenBucket:
+    """Allows `rate` calls per second on average, with bursts of up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_for = (1 - self._tokens) / self.rate
+            time.sleep(wait_for)
+
+
+class BulkResult:
+    def __init__(self):
+        self.succeeded = 0
+        self.failed: List[Tuple[Any, Exception]] = []  # (row, error) for rows isolated by bisection
+        self.results: List[Any] = []  # return value of every successful call
+        self.calls = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed else 0.0
+
+
+class BulkExecutor:
+    """
+    Runs a batch operation (e.g. a DAO insert/upsert/RPC taking a list of rows)
+    over many rows:
+    - rows are cut into chunks and sent from a bounded thread pool; at most
+      2 * max_workers chunks are in flight, so a huge input is never all buffered
+    - every call waits for a token-bucket rate limiter
+    - chunk size grows while calls are fast and halves when they are slow or fail
+    - a failing chunk is retried after a jittered exponential backoff (backoff, 2x, 4x, ...
+      capped at max_backoff), then split in half until the bad rows are isolated
+    """
+
+    def __init__(self, operation: Callable[[List[Any]], Any], chunk_size: int = 200,
+                 min_chunk: int = 10, max_chunk: int = 1000, max_workers: int = 4,
+                 calls_per_second: float = 10.0, target_latency: float = 1.0, retries: int = 2,
+                 backoff: float = 0.5, max_backoff: float = 30.0,
+                 progress: Callable[[BulkResult], None] | None = None, progress_every: float = 2.0):
+        self.operation = operation
+        self.chunk_size = chunk_size
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self.max_workers = max_workers
+        self.limiter = TokenBucket(calls_per_second)
+        self.target_latency = target_latency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.progress = progress  # e.g. BulkExecutor.print_progress
+        self.progress_every = progress_every
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def print_progress(result: BulkResult) -> None:
+        print(f"{result.succeeded} rows ok, {len(result.failed)} failed, "
+              f"{result.calls} calls, {result.throughput:.0f} rows/s")
+
+    def run(self, rows: Iterable[Any]) -> BulkResult:
+        result = BulkResult()
+        started = time.monotonic()
+        last_report = started
+
+        def report():
+            nonlocal last_report
+            now = time.monotonic()
+            if self.progress and now - last_report >= self.progress_every:
+                result.elapsed = now - started
+                self.progress(result)
+                last_report = now
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = set()
+            for chunk in self._chunks(iter(rows)):
+                pending.add(pool.submit(self._run_chunk, chunk, result))
+                while len(pending) >= 2 * self.max_workers:
+                    # backpressure: wait for a slot before reading more rows
+                    _, pending = wait(pending, timeout=self.progress_every, return_when=FIRST_COMPLETED)
+                    report()
+                report()
+            while pending:
+                # drain the last chunks, still reporting progress while they run
+                _, pending = wait(pending, timeout=self.progress_every)
+                report()
+        result.elapsed = time.monotonic() - started
+        if self.progress:
+            self.progress(result)
+        return result
+
+    def _chunks(self, rows: Iterator[Any]) -> Iterator[List[Any]]:
+        while True:
+            chunk = [row for _, row in zip(range(self.chunk_size), rows)]
+            if not chunk:
+                return
+            yield chunk
+
+    def _call(self, chunk: List[Any], result: BulkResult) -> Any:
+        self.limiter.acquire()
+        start = time.monotonic()
+        try:
+            value = self.operation(chunk)
+        except Exception:
+            self._adapt(ok=False, latency=0)
+            raise
+        finally:
+            with self._lock:
+                result.calls += 1
+        self._adapt(ok=True, latency=time.monotonic() - start)
+        return value
+
+    def _adapt(self, ok: bool, latency: float) -> None:
+        with self._lock:
+            if ok and latency < self.target_latency:
+                self.chunk_size = min(self.max_chunk, self.chunk_size + max(1, self.chunk_size // 4))
+            else:
+                self.chunk_size = max(self.min_chunk, self.chunk_size // 2)
+
+    def _delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number `attempt` (1-based)"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def _run_chunk(self, chunk: List[Any], result: BulkResult) -> None:
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self._delay(attempt))
+            try:
+                value = self._call(chunk, result)
+            except Exception as e:
+                error = e
+                continue
+            with self._lock:
+                result.succeeded += len(chunk)
+                result.results.append(value)
+            return
+        if len(chunk) == 1:
+            with self._lock:
+                result.failed.append((chunk[0], error))
+            return
+        # bisect to find the rows that keep failing
+        middle = len(chunk) // 2
+        self._run_chunk(chunk[:middle], result)
+        self._run_chunk(chunk[middle:], result)
@@ -110,13 +110,13 @@ class CustomerService:
         self.dao = dao or CustomerDAO()
 
     def add_customer(self, name: str, email: str, phone: str, city: str | None = None) -> Customer:
-        if self.dao.get_customer_by_email(email):
+        if self.dao.get_customer_by_email(email, consistent=True):
             raise CustomerError(f"Customer with email '{email}' already exists.")
         customer = Customer(name, email, phone, city)
         return self.dao.create_customer(customer)
 
     def update_customer(self, email: str, phone: str | None = None, city: str | None = None) -> Customer:
-        customer = self.dao.get_customer_by_email(email)
+        customer = self.dao.get_customer_by_email(email, consistent=True)
         if not customer:
             raise CustomerError(f"Customer with email '{email}' not found.")
         if phone:
@@ -126,7 +126,7 @@ class CustomerService:
         return self.dao.update_customer(customer)
 
     def delete_customer(self, email: str) -> bool:
-        customer = self.dao.get_customer_by_email(email)
+        customer = self.dao.get_customer_by_email(email, consistent=True)
         if not customer:
             raise CustomerError(f"Customer with email '{email}' not found.")
         if customer.orders:
@@ -292,10 +292,15 @@ class OrderService:
         return order
 '''
 # src/service/order_service.py
-from typing import List, Dict
+import time
+from typing import List, Dict, Tuple
 from src.dao.order_dao import OrderDAO, Order
+from src.dao.order_snapshot_dao import OrderSnapshotDAO
 from src.service.customer_service import CustomerService, CustomerError
 from src.service.product_service import ProductService, ProductError
+from src.service.revenue_service import RevenueService
+from src.service.ranking_service import RankingService
+from src.service.pricing_service import PricingService, PricingError
 
 
 class OrderError(Exception):
@@ -305,53 +310,96 @@ class OrderError(Exception):
 class OrderService:
     """Business logic for order management"""
 
+    TERMINAL_STATUSES = ("COMPLETED", "CANCELLED")
+
     def __init__(self, order_dao: OrderDAO = None,
                  customer_service: CustomerService = None,
-                 product_service: ProductService = None):
+                 product_service: ProductService = None,
+                 revenue_service: RevenueService = None,
+                 ranking_service: RankingService = None,
+                 snapshot_dao: OrderSnapshotDAO = None,
+                 pricing_service: PricingService = None,
+                 live_ttl: float = 30.0):
         self.dao = order_dao or OrderDAO()
         self.customer_service = customer_service or CustomerService()
         self.product_service = product_service or ProductService()
+        self.revenue_service = revenue_service or RevenueService(product_dao=self.product_service.dao)
+        self.ranking_service = ranking_service or RankingService(order_dao=self.dao, product_dao=self.product_service.dao)
+        self.snapshot_dao = snapshot_dao or OrderSnapshotDAO()
+        self.pricing_service = pricing_service or PricingService()
+        # order details of still-changing orders: order_id -> (expires_at, detail)
+        self.live_ttl = live_ttl
+        self._live_cache: Dict[int, Tuple[float, Dict]] = {}
 
     def create_order(self, customer_email: str, items: List[Dict]) -> Order:
         """
         items = [{"prod_id": 1, "quantity": 2}, {"prod_id": 3, "quantity": 1}]
         """
-        # Check customer exists
-        customer = self.customer_service.dao.get_customer_by_email(customer_email)
+        # Check customer exists (consistent read: the row is written back with the new order)
+        customer = self.customer_service.dao.get_customer_by_email(customer_email, consistent=True)
         if not customer:
             raise OrderError(f"Customer '{customer_email}' does not exist.")
 
-        total_amount = 0
+        # Validate every line before anything is written
+        if not items:
+            raise OrderError("Order must contain at least one item.")
+        for item in items:
+            quantity = item.get("quantity")
+            if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+                raise OrderError(f"Quantity must be a positive integer for product {item.get('prod_id')}.")
+
         order_items = []
+        categories = {}
+        products = {}
+        requested: Dict[int, int] = {}
 
-        # Validate products and deduct stock
+        # Validate products and stock
         for item in items:
             prod_id = item.get("prod_id")
             quantity = item.get("quantity")
 
-            product = self.product_service.dao.get_product_by_id(prod_id)
+            product = products.get(prod_id) or self.product_service.dao.get_product_by_id(prod_id, consistent=True)
             if not product:
                 raise OrderError(f"Product ID {prod_id} does not exist.")
-            if product.stock < quantity:
+            products[prod_id] = product
+            requested[prod_id] = requested.get(prod_id, 0) + quantity
+            if product.stock < requested[prod_id]:
                 raise OrderError(
                     f"Not enough stock for product '{product.name}'. "
-                    f"Available: {product.stock}, Requested: {quantity}"
+                    f"Available: {product.stock}, Requested: {requested[prod_id]}"
                 )
 
-            # Deduct stock
-            new_stock = product.stock - quantity
-            self.product_service.dao.update_product(prod_id, {"stock": new_stock})
-
             # Prepare order item
             order_items.append({
                 "prod_id": prod_id,
                 "quantity": quantity,
                 "price": product.price
             })
-            total_amount += product.price * quantity
+            categories[prod_id] = product.category
+
+        # Exact Decimal total for the whole cart (promotions, GST tiers)
+        try:
+            priced = self.pricing_service.price_cart(
+                [{**item, "category": categories[item["prod_id"]]} for item in order_items]
+            )
+        except PricingError as e:
+            raise OrderError(str(e))
+        total_amount = float(priced["total"])
+        # keep each line's priced total and category, so revenue is booked (and later
+        # reversed) exactly as charged, even if the product changes or is deleted
+        order_items = [
+            {**item, "category": line["category"], "line_total": float(line["total"])}
+            for item, line in zip(order_items, priced["lines"])
+        ]
+
+        # Deduct stock
+        for prod_id, quantity in requested.items():
+            self.product_service.dao.update_product(prod_id, {"stock": products[prod_id].stock - quantity})
 
         # Insert order (using customer.id, not email)
         order = self.dao.insert_order(customer.id, order_items, total_amount)
+        self.revenue_service.record_order(order, categories)
+        self.ranking_service.record_order(order)
 
         # Link order to customer
         if hasattr(customer, "orders"):
@@ -361,18 +409,55 @@ class OrderService:
         return order
 
     def get_order_details(self, order_id: int) -> Dict:
+        """
+        Order with its customer, items and totals.
+        Live orders are cached for live_ttl seconds; completed and cancelled
+        orders are read from their snapshot in a single lookup.
+        """
+        cached = self._live_cache.get(order_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        detail = self.snapshot_dao.get_snapshot(order_id)
+        if detail:
+            return detail
+
         order = self.dao.get_order_by_id(order_id)
         if not order:
             raise OrderError(f"Order {order_id} not found.")
+        detail = self._build_details(order)
+        if order.status in self.TERMINAL_STATUSES:
+            # older orders finished before snapshots existed
+            self.snapshot_dao.save_snapshot(order_id, detail)
+        else:
+            self._live_cache[order_id] = (time.monotonic() + self.live_ttl, detail)
+        return detail
+
+    def _build_details(self, order: Order) -> Dict:
         customer = self.customer_service.dao.get_customer_by_id(order.customer_id)
+        items = [
+            {"prod_id": i["prod_id"], "quantity": i["quantity"], "price": i["price"],
+             "line_total": i.get("line_total") or i["price"] * i["quantity"]}
+            for i in order.items
+        ]
         return {
             "order_id": order.order_id,
-            "customer": vars(customer),
-            "items": order.items,
+            "customer": vars(customer) if customer else None,
+            "items": items,
+            "totals": {
+                "lines": len(items),
+                "quantity": sum(i["quantity"] for i in items),
+                "amount": order.total_amount,
+            },
             "total_amount": order.total_amount,
-            "status": order.status
+            "status": order.status,
+            "created_at": order.created_at.isoformat() if order.created_at else None,
         }
 
+    def _snapshot(self, order: Order) -> None:
+        self._live_cache.pop(order.order_id, None)
+        self.snapshot_dao.save_snapshot(order.order_id, self._build_details(order))
+
     def list_orders_by_customer(self, customer_email: str) -> List[Order]:
         customer = self.customer_service.dao.get_customer_by_email(customer_email)
         if not customer:
@@ -380,31 +465,37 @@ class OrderService:
         return self.dao.list_orders_by_customer(customer.id)
 
     def cancel_order(self, order_id: int) -> Order:
-        order = self.dao.get_order_by_id(order_id)
+        order = self.dao.get_order_by_id(order_id, consistent=True)
         if not order:
             raise OrderError(f"Order {order_id} not found.")
         if order.status != "PLACED":
             raise OrderError(f"Only PLACED orders can be cancelled. Current status: {order.status}")
 
         # Restore stock
+        categories = {}
         for item in order.items:
-            product = self.product_service.dao.get_product_by_id(item["prod_id"])
+            product = self.product_service.dao.get_product_by_id(item["prod_id"], consistent=True)
             if product:
                 new_stock = product.stock + item["quantity"]
                 self.product_service.dao.update_product(product.prod_id, {"stock": new_stock})
+                categories[product.prod_id] = product.category
 
         # Update status
         order.status = "CANCELLED"
         self.dao.update_order(order)
+        self.revenue_service.reverse_order(order, categories)
+        self.ranking_service.record_order(order, sign=-1)
+        self._snapshot(order)
 
         return order
 
     def complete_order(self, order_id: int) -> Order:
-        order = self.dao.get_order_by_id(order_id)
+        order = self.dao.get_order_by_id(order_id, consistent=True)
         if not order:
             raise OrderError(f"Order {order_id} not found.")
         if order.status != "PLACED":
             raise OrderError(f"Only PLACED orders can be completed. Current status: {order.status}")
         order.status = "COMPLETED"
         self.dao.update_order(order)
+        self._snapshot(order)
         return order
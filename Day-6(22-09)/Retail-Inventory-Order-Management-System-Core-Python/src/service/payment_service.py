@@ -29,5 +29,13 @@ class PaymentService:
         payment = self.dao.get_payment_by_order(order_id)
         if not payment:
             raise PaymentError("Payment record not found")
+        if payment.status == "REFUNDED":
+            raise PaymentError("Payment already refunded")
+        if payment.status != "PAID":
+            raise PaymentError(f"Only PAID payments can be refunded. Current status: {payment.status}")
         payment = self.dao.update_payment(payment.payment_id, {"status": "REFUNDED"})
+        # a paid order is COMPLETED; cancelled orders were already reversed by cancel_order
+        order = self.order_service.dao.get_order_by_id(order_id, consistent=True)
+        if order and order.status == "COMPLETED":
+            self.order_service.revenue_service.reverse_order(order)
         return payment
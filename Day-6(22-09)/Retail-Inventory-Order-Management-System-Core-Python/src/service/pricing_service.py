@@ -0,0 +1,118 @@
+# src/service/pricing_service.py
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List, Tuple
+
+PAISE = Decimal("0.01")
+HUNDRED = Decimal(100)
+
+
+def to_money(value) -> Decimal:
+    """Exact rupee amount rounded to paise (floats go through str to avoid binary noise)"""
+    return Decimal(str(value)).quantize(PAISE, rounding=ROUND_HALF_UP)
+
+
+class PricingError(Exception):
+    pass
+
+
+class Promotion:
+    """Percentage off every line of a category (or of any category) once min_quantity is bought"""
+
+    def __init__(self, name: str, percent: float, category: str | None = None, min_quantity: int = 1):
+        if not 0 < percent <= 100:
+            raise PricingError("Promotion percent must be between 0 and 100")
+        self.name = name
+        self.percent = Decimal(str(percent))
+        self.category = category
+        self.min_quantity = min_quantity
+
+    def applies_to(self, line: Dict) -> bool:
+        return (self.category is None or line.get("category") == self.category) and line["quantity"] >= self.min_quantity
+
+
+class PricingService:
+    """
+    Prices whole carts with exact Decimal money in a single pass over the lines:
+    line promotions, then the cart-wide discount, then GST by category tier.
+    With no tiers configured GST is 0, i.e. catalogue prices are final.
+    """
+
+    def __init__(self, gst_tiers: Dict[str, float] | None = None, default_gst_percent: float = 0,
+                 promotions: List[Promotion] | None = None):
+        self.gst_tiers = {category: Decimal(str(p)) for category, p in (gst_tiers or {}).items()}
+        self.default_gst = Decimal(str(default_gst_percent))
+        self.promotions = promotions or []
+
+    def price_cart(self, lines: List[Dict], discount_percent: float = 0) -> Dict:
+        """
+        lines = [{"prod_id": 1, "quantity": 2, "price": 499.0, "category": "Books"}, ...]
+        Returns the priced lines plus subtotal, promotions, discount, tax and total (all Decimal).
+        """
+        if not 0 <= discount_percent <= 100:
+            raise PricingError("Discount must be between 0 and 100 percent")
+        discount_rate = Decimal(str(discount_percent)) / HUNDRED
+
+        priced = []
+        subtotal = promo_total = discount_total = tax_total = Decimal(0)
+        for line in lines:
+            if line["quantity"] <= 0:
+                raise PricingError(f"Quantity must be positive for product {line.get('prod_id')}")
+            gross = to_money(line["price"]) * line["quantity"]
+            # best single promotion for this line
+            promo_rate = max((p.percent for p in self.promotions if p.applies_to(line)), default=Decimal(0)) / HUNDRED
+            promo = to_money(gross * promo_rate)
+            discount = to_money((gross - promo) * discount_rate)
+            taxable = gross - promo - discount
+            gst_rate = self.gst_tiers.get(line.get("category"), self.default_gst)
+            tax = to_money(taxable * gst_rate / HUNDRED)
+
+            priced.append({**line, "gross": gross, "promotion": promo, "discount": discount,
+                           "gst_percent": gst_rate, "tax": tax, "total": taxable + tax})
+            subtotal += gross
+            promo_total += promo
+            discount_total += discount
+            tax_total += tax
+
+        return {
+            "lines": priced,
+            "subtotal": subtotal,
+            "promotions": promo_total,
+            "discount": discount_total,
+            "tax": tax_total,
+            "total": subtotal - promo_total - discount_total + tax_total,
+        }
+
+    @staticmethod
+    def render_invoice(order_id, priced: Dict) -> str:
+        rows = [f"------ INVOICE #{order_id} ------"]
+        for line in priced["lines"]:
+            label = line.get("name") or f"Product {line.get('prod_id')}"
+            rows.append(f"{label:<24} {line['quantity']:>4} x ₹{to_money(line['price'])}  = ₹{line['gross']}")
+        rows += [
+            "-" * 32,
+            f"Subtotal   : ₹{priced['subtotal']}",
+            f"Promotions : -₹{priced['promotions']}",
+            f"Discount   : -₹{priced['discount']}",
+            f"GST        : ₹{priced['tax']}",
+            f"Total      : ₹{priced['total']}",
+            "",
+        ]
+        return "\n".join(rows)
+
+    def write_invoices(self, orders: Iterable[Tuple[int, List[Dict]]], path: str,
+                       discount_percent: float = 0) -> Dict:
+        """
+        Month-end billing: price and render every (order_id, lines) pair in one pass,
+        streaming each invoice to the file as soon as it is priced.
+        Returns the number of invoices and the grand total.
+        """
+        count = 0
+        grand_total = Decimal(0)
+        with open(path, "w", encoding="utf-8") as f:
+            for order_id, lines in orders:
+                priced = self.price_cart(lines, discount_percent)
+                f.write(self.render_invoice(order_id, priced))
+                f.write("\n")
+                count += 1
+                grand_total += priced["total"]
+        return {"invoices": count, "total": grand_total}
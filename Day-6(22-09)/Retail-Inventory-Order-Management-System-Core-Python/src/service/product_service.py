@@ -32,8 +32,11 @@ def get_low_stock(threshold: int = 5) -> List[Dict]:
  '''
 #usimg oops concept
 # src/services/product_service.py
-from typing import List, Dict
-from src.dao.product_dao import ProductDAO
+import csv
+import uuid
+from typing import Callable, List, Dict
+from src.dao.product_dao import ProductDAO, Product
+from src.service.bulk_executor import BulkExecutor, BulkResult
 
 
 class ProductError(Exception):
@@ -54,7 +57,7 @@ class ProductService:
         """
         if price <= 0:
             raise ProductError("Price must be greater than 0")
-        if self.dao.get_product_by_sku(sku):
+        if self.dao.get_product_by_sku(sku, consistent=True):
             raise ProductError(f"SKU already exists: {sku}")
         return self.dao.create_product(name, sku, price, stock, category)
 
@@ -62,14 +65,65 @@ class ProductService:
         """Increase stock of an existing product"""
         if delta <= 0:
             raise ProductError("Delta must be positive")
-        product = self.dao.get_product_by_id(prod_id)
+        product = self.dao.get_product_by_id(prod_id, consistent=True)
         if not product:
             raise ProductError("Product not found")
-        new_stock = (product.get("stock") or 0) + delta
+        new_stock = (product.stock or 0) + delta
         return self.dao.update_product(prod_id, {"stock": new_stock})
 
-    def get_low_stock(self, threshold: int = 5) -> List[Dict]:
+    def restock_products(self, deltas: Dict[int, int], batch_size: int = 500,
+                         progress: Callable[[BulkResult], None] | None = None) -> Dict[int, Dict]:
+        """
+        Increase stock of many products at once.
+        All deltas are validated before anything is written, then applied as
+        server-side increments, one RPC per batch of products, through a BulkExecutor.
+        Every batch carries the same restock id, which the database uses to apply each
+        product's delta only once, so the executor's retries and bisection are safe.
+        Returns {prod_id: {"stock": new_stock}} or {prod_id: {"error": message}} per product.
+        """
+        if not deltas:
+            raise ProductError("No products to restock")
+        invalid = [pid for pid, delta in deltas.items()
+                   if isinstance(delta, bool) or not isinstance(delta, int) or delta <= 0]
+        if invalid:
+            raise ProductError(f"Delta must be positive for products: {invalid}")
+
+        restock_id = str(uuid.uuid4())
+        executor = BulkExecutor(lambda batch: self.dao.increment_stock_bulk(dict(batch), restock_id),
+                                chunk_size=batch_size, max_chunk=max(batch_size, 1000), progress=progress)
+        outcome = executor.run(deltas.items())
+
+        results: Dict[int, Dict] = {}
+        for products in outcome.results:
+            for product in products:
+                results[product.prod_id] = {"stock": product.stock}
+        for (pid, _), error in outcome.failed:
+            results[pid] = {"error": str(error)}
+        for pid in deltas:
+            results.setdefault(pid, {"error": "Product not found"})
+        return results
+
+    def restock_from_csv(self, path: str, batch_size: int = 500,
+                         progress: Callable[[BulkResult], None] | None = None) -> Dict[int, Dict]:
+        """
+        Restock from a receiving manifest CSV with "prod_id" and "delta" columns.
+        Rows are read one at a time; repeated prod_ids are summed.
+        """
+        deltas: Dict[int, int] = {}
+        with open(path, newline="") as f:
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                try:
+                    prod_id = int(row["prod_id"])
+                    delta = int(row["delta"])
+                except (KeyError, TypeError, ValueError):
+                    raise ProductError(f"Invalid manifest row {line_no}: {row}")
+                if delta <= 0:
+                    raise ProductError(f"Delta must be positive (manifest row {line_no})")
+                deltas[prod_id] = deltas.get(prod_id, 0) + delta
+        return self.restock_products(deltas, batch_size=batch_size, progress=progress)
+
+    def get_low_stock(self, threshold: int = 5) -> List[Product]:
         """Return products with stock below or equal to the threshold"""
         all_products = self.dao.list_products(limit=1000)
-        return [p for p in all_products if (p.get("stock") or 0) <= threshold]
+        return [p for p in all_products if (p.stock or 0) <= threshold]
 
@@ -0,0 +1,99 @@
+# src/service/ranking_service.py
+import heapq
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Dict, List, Tuple
+from src.dao.order_dao import OrderDAO, Order
+from src.dao.product_dao import ProductDAO
+
+
+class RankingError(Exception):
+    pass
+
+
+class SalesWindow:
+    """Per-hour sales counters, so a sliding-window total only sums a few buckets"""
+
+    def __init__(self, hours: int):
+        self.hours = hours
+        self._buckets: Dict[int, Counter] = {}  # hours since epoch -> {prod_id: quantity}
+
+    @staticmethod
+    def _hour(at: datetime) -> int:
+        return int(at.timestamp() // 3600)
+
+    def add(self, prod_id: int, quantity: int, at: datetime) -> None:
+        self._buckets.setdefault(self._hour(at), Counter())[prod_id] += quantity
+
+    def totals(self, now: datetime, hours: int) -> Counter:
+        current = self._hour(now)
+        # drop buckets that have slid out of the widest window
+        for hour in [h for h in self._buckets if h <= current - self.hours]:
+            del self._buckets[hour]
+        total = Counter()
+        for hour, counts in self._buckets.items():
+            if hour > current - hours:
+                total.update(counts)
+        return total
+
+
+class RankingService:
+    """
+    Top-N product rankings.
+    All-time counts are grouped in the database; 24h/7d rankings come from hourly
+    counters that are loaded once and then kept up to date as orders change.
+    Results are cached until the next order is placed or cancelled; 24h/7d results
+    are also keyed by the current hour, so they expire as the window slides.
+    """
+
+    WINDOWS = {"24h": 24, "7d": 24 * 7}
+
+    def __init__(self, order_dao: OrderDAO = None, product_dao: ProductDAO = None):
+        self.order_dao = order_dao or OrderDAO()
+        self.product_dao = product_dao or ProductDAO()
+        self._cache: Dict[Tuple[int, str | None, int | None], List[Dict]] = {}
+        self._window: SalesWindow | None = None
+
+    def top_selling_products(self, top_n: int = 5, window: str | None = None) -> List[Dict]:
+        if top_n <= 0:
+            raise RankingError("top_n must be positive")
+        if window is not None and window not in self.WINDOWS:
+            raise RankingError(f"Window must be one of {tuple(self.WINDOWS)}")
+        now = datetime.now(timezone.utc)
+        hour = SalesWindow._hour(now) if window is not None else None
+        key = (top_n, window, hour)
+        if key in self._cache:
+            return self._cache[key]
+
+        if window is None:
+            counts = self.order_dao.product_sales_totals()
+        else:
+            counts = self._sales_window().totals(now, self.WINDOWS[window])
+        top = heapq.nlargest(top_n, ((pid, qty) for pid, qty in counts.items() if qty > 0), key=itemgetter(1))
+
+        names = {p.prod_id: p.name for p in self.product_dao.get_products_by_ids([pid for pid, _ in top])}
+        result = [{"product": names[pid], "quantity_sold": qty} for pid, qty in top if pid in names]
+        # windowed rankings from earlier hours can no longer be hit
+        self._cache = {k: v for k, v in self._cache.items() if k[2] in (None, hour)}
+        self._cache[key] = result
+        return result
+
+    def record_order(self, order: Order, sign: int = 1) -> None:
+        """Count a placed (sign=1) or cancelled (sign=-1) order and drop cached rankings"""
+        self._cache.clear()
+        if self._window is None:
+            return
+        at = order.created_at or datetime.now(timezone.utc)
+        for item in order.items:
+            self._window.add(item["prod_id"], sign * item["quantity"], at)
+
+    def _sales_window(self) -> SalesWindow:
+        if self._window is None:
+            hours = max(self.WINDOWS.values())
+            window = SalesWindow(hours)
+            since = datetime.now(timezone.utc) - timedelta(hours=hours)
+            for row in self.order_dao.product_sales_by_hour(since):
+                window.add(row["prod_id"], row["quantity"], row["hour"])
+            self._window = window
+        return self._window
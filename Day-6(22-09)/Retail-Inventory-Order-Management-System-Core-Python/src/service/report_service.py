@@ -1,55 +1,36 @@
 # src/service/report_service.py
+from datetime import date, timedelta
 from src.dao.order_dao import OrderDAO
 from src.dao.product_dao import ProductDAO
 from src.dao.customer_dao import CustomerDAO
+from src.service.revenue_service import RevenueService
+from src.service.ranking_service import RankingService
 
 class ReportService:
     def __init__(self):
         self.order_dao = OrderDAO()
         self.product_dao = ProductDAO()
         self.customer_dao = CustomerDAO()
+        self.revenue_service = RevenueService(product_dao=self.product_dao)
+        self.ranking_service = RankingService(order_dao=self.order_dao, product_dao=self.product_dao)
 
-    def top_selling_products(self, top_n: int = 5):
-        all_orders = self.order_dao.list_orders()  # each order has order_items [{prod_id, quantity}]
-        product_count = {}
-        for order in all_orders:
-            for item in order.items:
-                product_count[item["prod_id"]] = product_count.get(item["prod_id"], 0) + item["quantity"]
-        sorted_products = sorted(product_count.items(), key=lambda x: x[1], reverse=True)
-        result = []
-        for prod_id, qty in sorted_products[:top_n]:
-            product = self.product_dao.get_product_by_id(prod_id)
-            if product:
-                result.append({"product": product.name, "quantity_sold": qty})
-        return result
+    def top_selling_products(self, top_n: int = 5, window: str | None = None):
+        return self.ranking_service.top_selling_products(top_n, window)
 
     def total_revenue_last_month(self):
-        from datetime import datetime, timedelta
-        import calendar
-
-        today = datetime.today()
-        first_day_last_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+        today = date.today()
         last_day_last_month = today.replace(day=1) - timedelta(days=1)
-
-        all_orders = self.order_dao.list_orders()
-        total = sum(o.total_amount for o in all_orders 
-                    if first_day_last_month <= o.created_at <= last_day_last_month)
-        return total
+        first_day_last_month = last_day_last_month.replace(day=1)
+        return self.revenue_service.total(first_day_last_month, last_day_last_month)
 
     def orders_by_customer(self):
-        all_orders = self.order_dao.list_orders()
         customer_count = {}
-        for order in all_orders:
-            cid = order.customer_id
+        for order in self.order_dao.list_order_headers():
+            cid = order["customer_id"]
             customer_count[cid] = customer_count.get(cid, 0) + 1
         return customer_count
 
     def frequent_customers(self, min_orders: int = 2):
-        counts = self.orders_by_customer()
-        frequent = []
-        for cid, count in counts.items():
-            if count > min_orders:
-                customer = self.customer_dao.get_customer_by_id(cid)
-                if customer:
-                    frequent.append({"customer": customer.name, "email": customer.email, "orders": count})
-        return frequent
+        counts = {cid: count for cid, count in self.orders_by_customer().items() if count > min_orders}
+        customers = self.customer_dao.get_customers_by_ids(list(counts))
+        return [{"customer": c.name, "email": c.email, "orders": counts[c.id]} for c in customers]
@@ -0,0 +1,103 @@
+# src/service/revenue_service.py
+from datetime import date, datetime, timezone
+from typing import Dict
+from src.dao.revenue_dao import RevenueDAO
+from src.dao.product_dao import ProductDAO
+from src.dao.order_dao import Order
+
+
+class RevenueError(Exception):
+    pass
+
+
+class RevenueService:
+    """
+    Revenue analytics over pre-aggregated daily buckets.
+    Buckets are updated when an order is placed, cancelled or refunded, so a
+    range query reads one row per (day, customer, category) instead of every order.
+    Days are UTC dates of the order's created_at, the same as backfill() uses.
+    """
+
+    BUCKETS = ("day", "week", "month")
+    BREAKDOWNS = {"category": "category", "customer": "customer_id"}
+
+    def __init__(self, dao: RevenueDAO = None, product_dao: ProductDAO = None):
+        self.dao = dao or RevenueDAO()
+        self.product_dao = product_dao or ProductDAO()
+
+    def record_order(self, order: Order, categories: Dict[int, str] | None = None) -> None:
+        """Add a newly placed order to its day's buckets"""
+        self._apply(order, categories, sign=1)
+
+    def reverse_order(self, order: Order, categories: Dict[int, str] | None = None) -> None:
+        """Take a cancelled or refunded order back out of the day it was placed on"""
+        self._apply(order, categories, sign=-1)
+
+    def _apply(self, order: Order, categories: Dict[int, str] | None, sign: int) -> None:
+        # items store the category and priced line_total they were booked with;
+        # orders placed before that fall back to the product's category and price * quantity
+        if categories is None and any(not item.get("category") for item in order.items):
+            products = self.product_dao.get_products_by_ids([item["prod_id"] for item in order.items])
+            categories = {p.prod_id: p.category for p in products}
+        day = self._utc_day(order.created_at)
+
+        revenue_by_category: Dict[str, float] = {}
+        for item in order.items:
+            category = item.get("category") or (categories or {}).get(item["prod_id"]) or "Uncategorized"
+            line_total = item.get("line_total")
+            amount = sign * float(line_total if line_total is not None else item["price"] * item["quantity"])
+            revenue_by_category[category] = revenue_by_category.get(category, 0) + amount
+
+        self.dao.increment_buckets([
+            {"day": day.isoformat(), "customer_id": order.customer_id, "category": category, "revenue": revenue}
+            for category, revenue in revenue_by_category.items()
+        ])
+
+    def backfill(self) -> None:
+        """One-time rebuild of every bucket from existing orders (run once after creating revenue_daily)"""
+        self.dao.backfill()
+
+    @staticmethod
+    def _utc_day(created_at: datetime | None) -> date:
+        if created_at is None:
+            return datetime.now(timezone.utc).date()
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc)
+        return created_at.date()
+
+    def revenue(self, start: date, end: date, bucket: str = "day", by: str | None = None) -> Dict:
+        """
+        Revenue between start and end (inclusive) grouped into day/week/month buckets.
+        With by="category" or by="customer" each bucket is broken down further:
+        {"2025-09": 1200.0} or {"2025-09": {"Electronics": 1000.0, "Books": 200.0}}
+        """
+        if start > end:
+            raise RevenueError("Start date must not be after end date")
+        if bucket not in self.BUCKETS:
+            raise RevenueError(f"Bucket must be one of {self.BUCKETS}")
+        if by is not None and by not in self.BREAKDOWNS:
+            raise RevenueError(f"Breakdown must be one of {tuple(self.BREAKDOWNS)}")
+
+        result: Dict = {}
+        for row in self.dao.list_buckets(start, end):
+            period = self._period_key(date.fromisoformat(row["day"]), bucket)
+            revenue = float(row["revenue"])
+            if by is None:
+                result[period] = result.get(period, 0) + revenue
+            else:
+                group = result.setdefault(period, {})
+                key = row[self.BREAKDOWNS[by]]
+                group[key] = group.get(key, 0) + revenue
+        return result
+
+    def total(self, start: date, end: date) -> float:
+        return sum(self.revenue(start, end, bucket="month").values())
+
+    @staticmethod
+    def _period_key(day: date, bucket: str) -> str:
+        if bucket == "week":
+            year, week, _ = day.isocalendar()
+            return f"{year}-W{week:02d}"
+        if bucket == "month":
+            return f"{day.year}-{day.month:02d}"
+        return day.isoformat()
@@ -0,0 +1,98 @@
+# src/service/segmentation_service.py
+import time
+import numpy as np
+import pandas as pd
+from src.dao.order_dao import OrderDAO
+from src.dao.customer_dao import CustomerDAO
+
+
+class SegmentationError(Exception):
+    pass
+
+
+class SegmentationService:
+    """
+    RFM (recency, frequency, monetary) customer segmentation.
+    Order headers are pulled once and scored with pandas group-bys; the
+    resulting segment table is cached for cache_seconds.
+    """
+
+    COLUMNS = ["customer_id", "name", "email", "recency_days", "frequency", "monetary",
+               "r_score", "f_score", "m_score", "segment"]
+
+    def __init__(self, order_dao: OrderDAO = None, customer_dao: CustomerDAO = None, cache_seconds: int = 900):
+        self.order_dao = order_dao or OrderDAO()
+        self.customer_dao = customer_dao or CustomerDAO()
+        self.cache_seconds = cache_seconds
+        self._segments: pd.DataFrame | None = None
+        self._computed_at = 0.0
+
+    def segments(self, refresh: bool = False) -> pd.DataFrame:
+        if refresh or self._segments is None or time.monotonic() - self._computed_at > self.cache_seconds:
+            self._segments = self._compute()
+            self._computed_at = time.monotonic()
+        return self._segments
+
+    def invalidate(self) -> None:
+        self._segments = None
+
+    def _compute(self) -> pd.DataFrame:
+        headers = self.order_dao.list_order_headers()
+        if not headers:
+            return pd.DataFrame(columns=self.COLUMNS)
+
+        orders = pd.DataFrame(headers)
+        orders["created_at"] = pd.to_datetime(orders["created_at"], utc=True, format="ISO8601")
+        orders["total_amount"] = orders["total_amount"].astype(float)
+        rfm = orders.groupby("customer_id").agg(
+            last_order=("created_at", "max"),
+            frequency=("id", "count"),
+            monetary=("total_amount", "sum"),
+        )
+        rfm["recency_days"] = (pd.Timestamp.now(tz="UTC") - rfm["last_order"]).dt.days
+
+        # 1-5 quintile scores; a recent order (few days) scores high
+        rfm["r_score"] = self._quintile(rfm["recency_days"], ascending=False)
+        rfm["f_score"] = self._quintile(rfm["frequency"])
+        rfm["m_score"] = self._quintile(rfm["monetary"])
+
+        r, f, m = rfm["r_score"], rfm["f_score"], rfm["m_score"]
+        rfm["segment"] = np.select(
+            [
+                (r >= 4) & (f >= 4) & (m >= 4),
+                f >= 4,
+                (r <= 2) & (f >= 3),
+                (r >= 4) & (rfm["frequency"] == 1),
+                r <= 2,
+            ],
+            ["Champions", "Loyal", "At Risk", "New", "Hibernating"],
+            default="Needs Attention",
+        )
+
+        customers = self.customer_dao.get_customers_by_ids(rfm.index.tolist())
+        details = pd.DataFrame(
+            [{"customer_id": c.id, "name": c.name, "email": c.email} for c in customers],
+            columns=["customer_id", "name", "email"],
+        ).set_index("customer_id")
+        rfm = rfm.join(details).reset_index()
+        return rfm[self.COLUMNS].sort_values(["r_score", "f_score", "m_score"], ascending=False)
+
+    @staticmethod
+    def _quintile(values: pd.Series, ascending: bool = True) -> pd.Series:
+        # tied values share the lowest rank, so e.g. every one-order customer gets the same f_score
+        pct = values.rank(method="min", ascending=ascending, pct=True)
+        return np.ceil(pct * 5).astype(int)
+
+    def summary(self) -> dict:
+        """Customers per segment"""
+        return self.segments()["segment"].value_counts().to_dict()
+
+    def export(self, path: str, segment: str | None = None) -> int:
+        """Write the segment table (optionally one segment) to CSV and return the row count"""
+        table = self.segments()
+        if segment is not None:
+            if segment not in set(table["segment"]):
+                raise SegmentationError(f"No customers in segment '{segment}'")
+            table = table[table["segment"] == segment]
+        table.to_csv(path, index=False)
+        return len(table)
@@ -0,0 +1,159 @@
+# src/service/sync_service.py
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Tuple
+from src.config import get_supabase
+from src.dao.replica import LocalReplica
+
+
+class SyncError(Exception):
+    pass
+
+
+class ChangeFeed(ABC):
+    """
+    Source of changes for the replica. Subclass to plug in another feed
+    (e.g. Supabase Realtime or a trigger-maintained changelog that also reports deletes).
+    """
+
+    @abstractmethod
+    def snapshot(self, table: str) -> Iterable[Dict]:
+        """Every current row of the table"""
+
+    @abstractmethod
+    def changes(self, table: str, since: str) -> Iterable[Tuple[str, Dict]]:
+        """("upsert" | "delete", row) for every change after the watermark"""
+
+    def keys(self, table: str) -> Iterable:
+        """Primary key of every current row; override with a cheaper key-only query"""
+        pk = LocalReplica.PRIMARY_KEYS[table]
+        return (row[pk] for row in self.snapshot(table))
+
+
+class UpdatedAtFeed(ChangeFeed):
+    """
+    Polls Supabase for rows whose updated_at is at or after the watermark.
+    Needs an updated_at column maintained by a trigger on each synced table.
+    Polling cannot see hard deletes; only upserts are reported, and SyncService
+    drops deleted rows when it reconciles the replica's keys against keys().
+    """
+
+    def __init__(self, page_size: int = 1000):
+        self._sb = get_supabase()
+        self.page_size = page_size
+
+    def _pages(self, table: str, since: str | None):
+        """
+        Keyset paging on (updated_at, primary key): each page continues after the last
+        row seen, so rows updated during the pull cannot shift others past a page boundary
+        """
+        pk = LocalReplica.PRIMARY_KEYS[table]
+        last = None
+        while True:
+            q = self._sb.table(table).select("*")
+            if last is not None:
+                ts, key = last
+                q = q.or_(f'updated_at.gt."{ts}",and(updated_at.eq."{ts}",{pk}.gt.{key})')
+            elif since is not None:
+                q = q.gte("updated_at", since)
+            page = (q.order("updated_at", desc=False).order(pk, desc=False)
+                    .limit(self.page_size).execute().data or [])
+            yield from page
+            if len(page) < self.page_size:
+                return
+            last = (page[-1]["updated_at"], page[-1][pk])
+
+    def snapshot(self, table: str) -> Iterable[Dict]:
+        return self._pages(table, None)
+
+    def keys(self, table: str) -> Iterable:
+        pk = LocalReplica.PRIMARY_KEYS[table]
+        last = None
+        while True:
+            q = self._sb.table(table).select(pk)
+            if last is not None:
+                q = q.gt(pk, last)
+            page = q.order(pk, desc=False).limit(self.page_size).execute().data or []
+            for row in page:
+                yield row[pk]
+            if len(page) < self.page_size:
+                return
+            last = page[-1][pk]
+
+    def changes(self, table: str, since: str) -> Iterable[Tuple[str, Dict]]:
+        # gte rather than gt: rows sharing the watermark timestamp are re-applied, which is harmless
+        return (("upsert", row) for row in self._pages(table, since))
+
+
+class SyncService:
+    """
+    Keeps a LocalReplica up to date: initial snapshot, then incremental pulls by watermark.
+    Every reconcile_every seconds the replica's keys are also checked against the feed's,
+    so rows hard-deleted upstream (which a polling feed never reports) are dropped.
+    """
+
+    TABLES = ("products", "customers", "orders", "order_items")
+
+    def __init__(self, replica: LocalReplica, feed: ChangeFeed = None, batch_size: int = 500,
+                 reconcile_every: float = 3600.0):
+        self.replica = replica
+        self.feed = feed or UpdatedAtFeed()
+        self.batch_size = batch_size
+        self.reconcile_every = reconcile_every
+        self._reconciled: Dict[str, float] = {}  # table -> time of the last key reconcile
+
+    def sync(self, tables: Tuple[str, ...] = TABLES) -> Dict[str, int]:
+        """Sync each table and return the number of rows applied per table"""
+        applied = {}
+        for table in tables:
+            if table not in LocalReplica.PRIMARY_KEYS:
+                raise SyncError(f"Unknown table: {table}")
+            started = time.time()
+            watermark = self.replica.watermark(table)
+            if watermark is None:
+                self.replica.clear(table)
+                changes = (("upsert", row) for row in self.feed.snapshot(table))
+                self._reconciled[table] = started  # a full snapshot has no stale rows
+            else:
+                changes = self.feed.changes(table, watermark)
+            count, watermark = self._apply(table, changes, watermark)
+            if started - self._reconciled.get(table, 0.0) >= self.reconcile_every:
+                count += self._reconcile(table)
+                self._reconciled[table] = started
+            self.replica.mark_synced(table, watermark, started)
+            applied[table] = count
+        return applied
+
+    def _apply(self, table: str, changes: Iterable[Tuple[str, Dict]], watermark: str | None):
+        pk = LocalReplica.PRIMARY_KEYS[table]
+        count = 0
+        upserts: List[Dict] = []
+        for op, row in changes:
+            if op == "delete":
+                self.replica.upsert_rows(table, upserts)
+                upserts = []
+                self.replica.delete_rows(table, [row[pk]])
+            else:
+                upserts.append(row)
+                if len(upserts) >= self.batch_size:
+                    self.replica.upsert_rows(table, upserts)
+                    upserts = []
+            updated_at = row.get("updated_at")
+            if updated_at and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+            count += 1
+        self.replica.upsert_rows(table, upserts)
+        return count, watermark
+
+    def _reconcile(self, table: str) -> int:
+        """Delete replica rows whose key no longer exists upstream; returns how many"""
+        live = {str(key) for key in self.feed.keys(table)}
+        gone = [key for key in self.replica.keys(table) if key not in live]
+        self.replica.delete_rows(table, gone)
+        return len(gone)
+
+    def run_forever(self, interval: float = 30.0) -> None:
+        """Poll continuously, e.g. from a background process next to the CLI"""
+        while True:
+            self.sync()
+            time.sleep(interval)
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# the app imports itself as the top-level "src" package, as when run with `python -m src.cli.main`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
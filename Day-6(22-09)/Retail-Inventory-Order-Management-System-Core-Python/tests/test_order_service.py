@@ -0,0 +1,123 @@
+# tests/test_order_service.py
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.dao.customer_dao import Customer
+from src.dao.order_dao import Order
+from src.dao.product_dao import Product
+from src.service.order_service import OrderError, OrderService
+from src.service.pricing_service import PricingService
+
+
+class FakeProductDAO:
+    def __init__(self, products):
+        self.products = {p.prod_id: p for p in products}
+
+    def get_product_by_id(self, prod_id, consistent=False):
+        return self.products.get(prod_id)
+
+    def update_product(self, prod_id, fields):
+        for key, value in fields.items():
+            setattr(self.products[prod_id], key, value)
+
+
+class FakeOrderDAO:
+    def __init__(self):
+        self.orders = {}
+
+    def insert_order(self, customer_id, items, total_amount):
+        order = Order(len(self.orders) + 1, customer_id, items, total_amount)
+        self.orders[order.order_id] = order
+        return order
+
+    def get_order_by_id(self, order_id, consistent=False):
+        return self.orders.get(order_id)
+
+    def update_order(self, order):
+        self.orders[order.order_id] = order
+
+
+@pytest.fixture
+def shop():
+    customer = Customer("Asha", "asha@example.com", "9999999999")
+    customer.id = 7
+    customer_dao = MagicMock()
+    customer_dao.get_customer_by_email.return_value = customer
+    product_dao = FakeProductDAO([
+        Product(1, "Pen", "PEN-1", 10.0, 5, "Stationery"),
+        Product(2, "Book", "BK-1", 250.0, 2, "Books"),
+    ])
+    service = OrderService(
+        order_dao=FakeOrderDAO(),
+        customer_service=SimpleNamespace(dao=customer_dao),
+        product_service=SimpleNamespace(dao=product_dao),
+        revenue_service=MagicMock(),
+        ranking_service=MagicMock(),
+        snapshot_dao=MagicMock(),
+        pricing_service=PricingService(gst_tiers={"Books": 5}),
+    )
+    return SimpleNamespace(service=service, products=product_dao.products)
+
+
+def stock(shop):
+    return {prod_id: p.stock for prod_id, p in shop.products.items()}
+
+
+def test_create_order_deducts_stock_and_prices_lines(shop):
+    order = shop.service.create_order("asha@example.com", [{"prod_id": 1, "quantity": 2}, {"prod_id": 2, "quantity": 1}])
+    assert stock(shop) == {1: 3, 2: 1}
+    assert order.customer_id == 7
+    assert order.total_amount == pytest.approx(20.0 + 262.5)
+    assert [(i["category"], i["line_total"]) for i in order.items] == [("Stationery", 20.0), ("Books", 262.5)]
+    shop.service.revenue_service.record_order.assert_called_once()
+    shop.service.ranking_service.record_order.assert_called_once_with(order)
+
+
+@pytest.mark.parametrize("quantity", [-3, 0, 1.5, True, "2", None])
+def test_create_order_rejects_invalid_quantity(shop, quantity):
+    with pytest.raises(OrderError):
+        shop.service.create_order("asha@example.com", [{"prod_id": 1, "quantity": 1}, {"prod_id": 2, "quantity": quantity}])
+    assert stock(shop) == {1: 5, 2: 2}
+    assert shop.service.dao.orders == {}
+
+
+def test_create_order_rejects_empty_cart(shop):
+    with pytest.raises(OrderError):
+        shop.service.create_order("asha@example.com", [])
+
+
+def test_create_order_checks_stock_against_repeated_lines(shop):
+    with pytest.raises(OrderError, match="Not enough stock"):
+        shop.service.create_order("asha@example.com", [{"prod_id": 2, "quantity": 2}, {"prod_id": 2, "quantity": 1}])
+    assert stock(shop) == {1: 5, 2: 2}
+
+
+def test_create_order_rejects_unknown_product_and_customer(shop):
+    with pytest.raises(OrderError, match="does not exist"):
+        shop.service.create_order("asha@example.com", [{"prod_id": 99, "quantity": 1}])
+    shop.service.customer_service.dao.get_customer_by_email.return_value = None
+    with pytest.raises(OrderError, match="does not exist"):
+        shop.service.create_order("nobody@example.com", [{"prod_id": 1, "quantity": 1}])
+    assert stock(shop) == {1: 5, 2: 2}
+
+
+def test_cancel_order_restores_stock_and_reverses_revenue(shop):
+    order = shop.service.create_order("asha@example.com", [{"prod_id": 1, "quantity": 4}])
+    cancelled = shop.service.cancel_order(order.order_id)
+    assert cancelled.status == "CANCELLED"
+    assert stock(shop) == {1: 5, 2: 2}
+    shop.service.revenue_service.reverse_order.assert_called_once_with(cancelled, {1: "Stationery"})
+    shop.service.ranking_service.record_order.assert_called_with(cancelled, sign=-1)
+    shop.service.snapshot_dao.save_snapshot.assert_called_once()
+
+
+def test_cancel_order_only_from_placed(shop):
+    order = shop.service.create_order("asha@example.com", [{"prod_id": 1, "quantity": 1}])
+    shop.service.cancel_order(order.order_id)
+    with pytest.raises(OrderError, match="Only PLACED"):
+        shop.service.cancel_order(order.order_id)
+    assert stock(shop) == {1: 5, 2: 2}
+    with pytest.raises(OrderError, match="not found"):
+        shop.service.cancel_order(404)
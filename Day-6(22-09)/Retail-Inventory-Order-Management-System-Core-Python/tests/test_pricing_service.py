@@ -0,0 +1,76 @@
+# tests/test_pricing_service.py
+from decimal import Decimal
+
+import pytest
+
+from src.service.pricing_service import PricingError, PricingService, Promotion, to_money
+
+
+def test_to_money_rounds_half_up_to_paise():
+    assert to_money(0.1 + 0.2) == Decimal("0.30")
+    assert to_money("2.675") == Decimal("2.68")
+
+
+def test_no_tiers_means_catalogue_prices_are_final():
+    priced = PricingService().price_cart([{"prod_id": 1, "quantity": 3, "price": 19.99}])
+    assert priced["subtotal"] == Decimal("59.97")
+    assert priced["tax"] == 0
+    assert priced["total"] == Decimal("59.97")
+
+
+def test_promotion_then_discount_then_gst():
+    pricing = PricingService(
+        gst_tiers={"Books": 5},
+        default_gst_percent=18,
+        promotions=[Promotion("books10", 10, category="Books", min_quantity=2)],
+    )
+    priced = pricing.price_cart(
+        [
+            {"prod_id": 1, "quantity": 2, "price": 500, "category": "Books"},
+            {"prod_id": 2, "quantity": 1, "price": 100, "category": "Toys"},
+        ],
+        discount_percent=10,
+    )
+    books, toys = priced["lines"]
+    # 1000 gross, -100 promotion, -90 discount, 5% GST on 810
+    assert (books["promotion"], books["discount"], books["tax"]) == (Decimal("100.00"), Decimal("90.00"), Decimal("40.50"))
+    assert books["total"] == Decimal("850.50")
+    # 100 gross, no promotion, -10 discount, 18% GST on 90
+    assert toys["total"] == Decimal("106.20")
+    assert priced["total"] == sum(line["total"] for line in priced["lines"])
+
+
+def test_best_single_promotion_applies():
+    pricing = PricingService(promotions=[Promotion("all5", 5), Promotion("bulk20", 20, min_quantity=10)])
+    few = pricing.price_cart([{"prod_id": 1, "quantity": 2, "price": 100}])
+    many = pricing.price_cart([{"prod_id": 1, "quantity": 10, "price": 100}])
+    assert few["promotions"] == Decimal("10.00")
+    assert many["promotions"] == Decimal("200.00")
+
+
+@pytest.mark.parametrize("quantity", [0, -1])
+def test_rejects_non_positive_quantity(quantity):
+    with pytest.raises(PricingError):
+        PricingService().price_cart([{"prod_id": 1, "quantity": quantity, "price": 10}])
+
+
+@pytest.mark.parametrize("percent", [-1, 101])
+def test_rejects_out_of_range_discount(percent):
+    with pytest.raises(PricingError):
+        PricingService().price_cart([{"prod_id": 1, "quantity": 1, "price": 10}], discount_percent=percent)
+
+
+def test_rejects_out_of_range_promotion():
+    with pytest.raises(PricingError):
+        Promotion("free", 0)
+
+
+def test_write_invoices_streams_every_order(tmp_path):
+    path = tmp_path / "invoices.txt"
+    result = PricingService().write_invoices(
+        [(1, [{"prod_id": 1, "quantity": 1, "price": 10}]), (2, [{"prod_id": 2, "quantity": 2, "price": 2.5}])],
+        str(path),
+    )
+    assert result == {"invoices": 2, "total": Decimal("15.00")}
+    text = path.read_text(encoding="utf-8")
+    assert "INVOICE #1" in text and "INVOICE #2" in text
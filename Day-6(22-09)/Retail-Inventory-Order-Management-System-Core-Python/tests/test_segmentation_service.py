@@ -0,0 +1,42 @@
+# tests/test_segmentation_service.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from src.service.segmentation_service import SegmentationService
+
+
+def test_quintiles_span_one_to_five():
+    scores = SegmentationService._quintile(pd.Series([10, 20, 30, 40, 50, 60, 70, 80, 90, 100]))
+    assert scores.tolist() == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+
+def test_tied_values_share_the_lowest_quintile():
+    # most customers ordered once; they must all get the same frequency score
+    scores = SegmentationService._quintile(pd.Series([1, 1, 1, 1, 1, 1, 2, 3, 5, 8]))
+    assert set(scores[:6]) == {1}
+    assert scores.tolist()[6:] == [4, 4, 5, 5]
+
+
+def test_descending_quintile_scores_small_values_high():
+    scores = SegmentationService._quintile(pd.Series([1, 400, 30, 90, 7]), ascending=False)
+    assert scores.tolist() == [5, 1, 3, 2, 4]
+
+
+def test_segments_from_order_headers():
+    now = datetime.now(timezone.utc)
+    headers = [
+        {"id": i, "customer_id": 1, "created_at": (now - timedelta(days=1)).isoformat(), "total_amount": 500}
+        for i in range(5)
+    ] + [
+        {"id": 10, "customer_id": 2, "created_at": (now - timedelta(days=400)).isoformat(), "total_amount": 20},
+    ]
+    order_dao = MagicMock()
+    order_dao.list_order_headers.return_value = headers
+    customer_dao = MagicMock()
+    customer_dao.get_customers_by_ids.return_value = []
+    table = SegmentationService(order_dao, customer_dao).segments().set_index("customer_id")
+    assert table.loc[1, "frequency"] == 5 and table.loc[1, "monetary"] == 2500
+    assert table.loc[1, "r_score"] > table.loc[2, "r_score"]
+    assert table.loc[1, "segment"] == "Champions"
@@ -0,0 +1,58 @@
+# tests/test_sync_service.py
+from src.dao.replica import LocalReplica
+from src.service.sync_service import ChangeFeed, SyncService
+
+
+class FakeFeed(ChangeFeed):
+    """In-memory upstream table; like UpdatedAtFeed it never reports deletes"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def put(self, prod_id, name, updated_at):
+        self.rows[prod_id] = {"prod_id": prod_id, "name": name, "sku": f"SKU-{prod_id}", "updated_at": updated_at}
+
+    def snapshot(self, table):
+        return list(self.rows.values())
+
+    def changes(self, table, since):
+        return [("upsert", row) for row in self.rows.values() if row["updated_at"] >= since]
+
+
+def make_sync(reconcile_every=3600.0):
+    feed = FakeFeed()
+    feed.put(1, "Pen", "2024-01-01T00:00:00")
+    feed.put(2, "Book", "2024-01-02T00:00:00")
+    replica = LocalReplica(":memory:")
+    return feed, replica, SyncService(replica, feed, reconcile_every=reconcile_every)
+
+
+def test_initial_snapshot_then_incremental_changes():
+    feed, replica, sync = make_sync()
+    assert sync.sync(("products",)) == {"products": 2}
+    assert replica.watermark("products") == "2024-01-02T00:00:00"
+    assert replica.find("products", "sku", "SKU-2")[0]["name"] == "Book"
+
+    feed.put(1, "Gel Pen", "2024-01-03T00:00:00")
+    sync.sync(("products",))
+    assert replica.get("products", 1)["name"] == "Gel Pen"
+    assert replica.watermark("products") == "2024-01-03T00:00:00"
+    assert replica.is_fresh("products", 60)
+
+
+def test_reconcile_drops_rows_deleted_upstream():
+    feed, replica, sync = make_sync(reconcile_every=0)
+    sync.sync(("products",))
+    del feed.rows[2]
+    sync.sync(("products",))
+    assert replica.get("products", 2) is None
+    assert replica.keys("products") == ["1"]
+
+
+def test_deletes_wait_for_the_next_reconcile():
+    feed, replica, sync = make_sync(reconcile_every=3600.0)
+    sync.sync(("products",))
+    del feed.rows[2]
+    sync.sync(("products",))
+    # a polling feed cannot see the delete, and the snapshot counts as a fresh reconcile
+    assert replica.get("products", 2) is not None
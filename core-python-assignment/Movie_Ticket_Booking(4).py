@@ -1,23 +1,34 @@
+from seat_inventory import ShowSeats, SeatError
+
 def bookseat(seat):
-    if seat > ts or seat in bs:
+    try:
+        booked = show.book(seat)
+    except SeatError:
+        booked = False
+    if not booked:
         print("Seat unavailable.")
     else:
-        bs.append(seat)
         print(f"{seat}-booked.")
 
 def cancelseat(seat):
-    if seat in bs:
-        bs.remove(seat)
+    try:
+        cancelled = show.cancel(seat)
+    except SeatError:
+        cancelled = False
+    if cancelled:
         print(f"Seat {seat} cancelled.")
     else:
         print("Seat not booked.")
 
 def availableseats():
-    return [i for i in range(1, ts + 1) if i not in bs]
+    return show.available_seats()
 
 ts=int(input("Total seats: "))
-bs = [2, 5, 7] #bs=[]
-#bs = list(map(int, input("Enter booked seats: ").split()))
+show = ShowSeats(ts)
+for seat in [2, 5, 7]: #bs=[]
+    if seat <= ts:
+        show.book(seat)
+#for seat in map(int, input("Enter booked seats: ").split()): show.book(seat)
 bookseat(int(input("Enter to book: ")))
 cancelseat(int(input("Enter to cancel: ")))
 print(f"Available seats: {availableseats()}")
\ No newline at end of file
@@ -1,12 +1,12 @@
+from fare_engine import Tariff
+
 def fare(d):
     if not d:
         return 0
-    sum=0
-    for i, j in enumerate(d, 1):
-        f=50+(10*j)
-        sum=sum+f
-        print(f"Trip {i}: ${f}")
-    print(f"Total Fare: ${sum}")
+    fares=Tariff().fares(d)
+    for i, f in enumerate(fares.tolist(), 1):
+        print(f"Trip {i}: ${f:g}")
+    print(f"Total Fare: ${fares.sum():g}")
 
 trips = [5, 10, 3]
 fare(trips)
\ No newline at end of file
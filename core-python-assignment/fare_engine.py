@@ -0,0 +1,173 @@
+#Vectorised taxi fare engine
+#fare = (base + distance slabs + per-minute charge) * surge(zone) * time-of-day factor(hour)
+#Trip files (CSV, JSONL, or a plain JSON array/table) are streamed in chunks with columns:
+#  distance_km [, minutes] [, zone] [, hour]
+#Trips that cannot be priced (NaN or negative values, zone not a whole number >= 0, hour outside
+#0-23) are skipped by process_file and counted as "rejected"; Tariff.fares raises ValueError on them.
+#   python fare_engine.py trips.csv --out fares.csv
+#   python fare_engine.py --benchmark 20000000
+import argparse
+import time
+
+import numpy as np
+
+
+def invalid_trips(distance, minutes=None, zone=None, hour=None):
+    """Boolean mask of the trips that cannot be priced"""
+    d = np.asarray(distance, dtype=np.float64)
+    bad = ~(d >= 0)  # also true for NaN
+    if minutes is not None:
+        bad |= ~(np.asarray(minutes, dtype=np.float64) >= 0)
+    if zone is not None:
+        z = np.asarray(zone, dtype=np.float64)
+        bad |= ~(z >= 0) | (z != np.floor(z))
+    if hour is not None:
+        h = np.asarray(hour, dtype=np.float64)
+        bad |= ~((h >= 0) & (h < 24)) | (h != np.floor(h))
+    return bad
+
+
+class Tariff:
+    def __init__(self, base=50.0, slabs=((float("inf"), 10.0),), per_minute=0.0,
+                 surge=None, hourly=None):
+        """
+        slabs: (upper km, rate per km) in increasing order, e.g. ((10, 12), (30, 10), (inf, 8))
+        surge: {zone id: multiplier}, zones not listed pay 1.0
+        hourly: 24 multipliers indexed by hour of day
+        """
+        self.base = base
+        self.per_minute = per_minute
+        uppers = np.array([u for u, _ in slabs], dtype=np.float64)
+        self.lowers = np.concatenate(([0.0], uppers[:-1]))
+        self.widths = uppers - self.lowers
+        self.rates = np.array([r for _, r in slabs], dtype=np.float64)
+        surge = surge or {}
+        self.surge = np.ones(max(surge, default=0) + 1)
+        for zone, multiplier in surge.items():
+            self.surge[zone] = multiplier
+        self.hourly = np.ones(24) if hourly is None else np.asarray(hourly, dtype=np.float64)
+
+    def fares(self, distance, minutes=None, zone=None, hour=None):
+        """Fare for every trip; all arguments are equal-length arrays (see invalid_trips)"""
+        bad = invalid_trips(distance, minutes, zone, hour)
+        if bad.any():
+            raise ValueError(f"{int(bad.sum())} trips cannot be priced, first at position {int(np.argmax(bad))}")
+        d = np.asarray(distance, dtype=np.float64)
+        km = np.clip(d[:, None] - self.lowers, 0, self.widths)
+        fare = self.base + km @ self.rates
+        if minutes is not None:
+            fare += self.per_minute * np.asarray(minutes, dtype=np.float64)
+        if zone is not None:
+            z = np.asarray(zone, dtype=np.int64)
+            fare *= np.where(z < len(self.surge), self.surge[np.minimum(z, len(self.surge) - 1)], 1.0)
+        if hour is not None:
+            fare *= self.hourly[np.asarray(hour, dtype=np.int64)]
+        return np.round(fare, 2)
+
+
+def read_chunks(path, chunk_rows=1_000_000):
+    import pandas as pd
+
+    if path.endswith(".jsonl"):
+        return pd.read_json(path, lines=True, chunksize=chunk_rows)
+    if path.endswith(".json"):
+        try:
+            df = pd.read_json(path)
+        except ValueError:
+            # "Trailing data": the file is JSON Lines after all
+            return pd.read_json(path, lines=True, chunksize=chunk_rows)
+        return (df.iloc[i:i + chunk_rows] for i in range(0, len(df), chunk_rows))
+    return pd.read_csv(path, chunksize=chunk_rows)
+
+
+class FareTotals:
+    def __init__(self):
+        self.trips = 0
+        self.rejected = 0
+        self.revenue = 0.0
+        self.max_fare = 0.0
+        self.by_zone = np.zeros(0)
+
+    def add(self, fares, zone=None):
+        if not len(fares):
+            return
+        self.trips += len(fares)
+        self.revenue += float(fares.sum())
+        self.max_fare = max(self.max_fare, float(fares.max()))
+        if zone is not None:
+            counts = np.bincount(np.asarray(zone, dtype=np.int64), weights=fares)
+            if len(counts) > len(self.by_zone):
+                counts[:len(self.by_zone)] += self.by_zone
+                self.by_zone = counts
+            else:
+                self.by_zone[:len(counts)] += counts
+
+    def summary(self):
+        return {
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "revenue": round(self.revenue, 2),
+            "average": round(self.revenue / self.trips, 2) if self.trips else 0.0,
+            "max": self.max_fare,
+            "by_zone": {z: round(v, 2) for z, v in enumerate(self.by_zone.tolist()) if v},
+        }
+
+
+def _column(chunk, name):
+    return chunk[name].to_numpy() if name in chunk else None
+
+
+def process_file(path, tariff=None, out=None, chunk_rows=1_000_000):
+    """Price every trip in a CSV/JSONL file; per-trip fares go to `out` (CSV) if given"""
+    tariff = tariff or Tariff()
+    totals = FareTotals()
+    first = True
+    for chunk in read_chunks(path, chunk_rows):
+        bad = invalid_trips(chunk["distance_km"].to_numpy(), _column(chunk, "minutes"),
+                            _column(chunk, "zone"), _column(chunk, "hour"))
+        if bad.any():
+            totals.rejected += int(bad.sum())
+            chunk = chunk[~bad]
+        zone = _column(chunk, "zone")
+        fares = tariff.fares(chunk["distance_km"].to_numpy(), _column(chunk, "minutes"),
+                             zone, _column(chunk, "hour"))
+        totals.add(fares, zone)
+        if out:
+            chunk.assign(fare=fares).to_csv(out, mode="w" if first else "a", header=first, index=False)
+            first = False
+    return totals.summary()
+
+
+def benchmark(trips, chunk_rows=1_000_000):
+    tariff = Tariff(slabs=((2, 0.0), (10, 14.0), (30, 12.0), (float("inf"), 10.0)), per_minute=1.5,
+                    surge={1: 1.2, 2: 1.5, 3: 2.0},
+                    hourly=[1.25] * 6 + [1.0] * 16 + [1.25] * 2)
+    rnd = np.random.default_rng(7)
+    totals = FareTotals()
+    elapsed = 0.0
+    for done in range(0, trips, chunk_rows):
+        n = min(chunk_rows, trips - done)
+        distance = rnd.gamma(2.0, 4.0, n)
+        minutes = distance * rnd.uniform(2, 5, n)
+        zone = rnd.integers(0, 5, n)
+        hour = rnd.integers(0, 24, n)
+        start = time.perf_counter()
+        totals.add(tariff.fares(distance, minutes, zone, hour), zone)
+        elapsed += time.perf_counter() - start
+    print(f"{trips:,} trips priced in {elapsed:.2f} s ({trips / elapsed:,.0f} trips/s)")
+    print(totals.summary())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compute taxi fares in bulk")
+    parser.add_argument("file", nargs="?", help="trips CSV or JSONL")
+    parser.add_argument("--out", help="write per-trip fares to this CSV")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument("--benchmark", type=int, metavar="TRIPS", help="price random trips instead of a file")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(args.benchmark, args.chunk_rows)
+    elif args.file:
+        print(process_file(args.file, out=args.out, chunk_rows=args.chunk_rows))
+    else:
+        parser.error("give a trips file or --benchmark")
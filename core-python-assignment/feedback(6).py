@@ -1,8 +1,7 @@
+from ratings_aggregator import RatingStats
+
 def percentage(rate):
-    if not rate:
-        return 0
-    count = sum(1 for i in rate if i >= 4)
-    return (count / len(rate)) * 100
+    return rate.positive_percentage()
 
-ratings = [5, 4, 3, 5, 2, 4, 1, 5]
+ratings = RatingStats().extend([5, 4, 3, 5, 2, 4, 1, 5])
 print(f"Positive Feedback: {percentage(ratings):.1f}%")
\ No newline at end of file
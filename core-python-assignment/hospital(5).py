@@ -1,14 +1,13 @@
+from patient_registry import PatientRegistry
+
 def searchdisease(p, d):
-    result = []
-    for i in p:
-        if i["Disease"].lower() == d.lower():
-            result.append(i["Name"])
-    return result
+    return p.names_of(p.with_disease(d))
 
-patients = [
+patients = PatientRegistry([
     {"Name": "Alice", "Age": 30, "Disease": "Flu"},
     {"Name": "Bob", "Age": 45, "Disease": "Diabetes"},
     {"Name": "Charlie", "Age": 35, "Disease": "Flu"}
-]
+])
 search = "Flu"
-print(f"Patients with {search}: {searchdisease(patients, search)}")
\ No newline at end of file
+print(f"Patients with {search}: {searchdisease(patients, search)}")
+print(f"Patients with {search} aged 30-32: {patients.names_of(patients.query(search, 30, 32))}")
\ No newline at end of file
@@ -1,22 +1,22 @@
+from menu_service import Menu
+
 def additem(m):
     if m in menu:
         print(f"{m} is available")
     else:
-        menu.append(m)
+        menu.add(m)
 def removeitem(m):
-    if m in menu:
-        menu.remove(m)
-    else:
+    if not menu.remove(m):
         print(f"{m} is not available")
 def check(m):
-    if m in menu:
+    if menu.is_available(m):
         print(f'Availability: "{m} is available"')
     else:
         print(f'Availability: "{m} is not available"')
 
 
-menu= ["Pizza", "Burger", "Pasta", "Salad"]
+menu= Menu(["Pizza", "Burger", "Pasta", "Salad"])
 additem(input("Add-item: "))
 removeitem(input("Remove-item: "))
-print("Updated menu: ",menu)
+print("Updated menu: ",menu.names())
 check(input("Check-item: "))
\ No newline at end of file
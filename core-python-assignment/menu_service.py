@@ -0,0 +1,202 @@
+#Menu service for one or many outlets
+#Items live in a dict keyed by normalized name; per-category sets and an availability
+#set make lookups O(1), and operations can be applied in bulk from a file:
+#   add,<outlet>,<item>[,<category>[,<price>]]      (the item must be new to the outlet)
+#   update,<outlet>,<item>[,<category>[,<price>]]   (blank fields keep their value)
+#   remove,<outlet>,<item>
+#   available,<outlet>,<item>
+#   unavailable,<outlet>,<item>
+#   python menu_service.py ops.csv
+import csv
+import sys
+
+
+class MenuError(Exception):
+    pass
+
+
+def key(name):
+    return name.strip().lower()
+
+
+class MenuItem:
+    __slots__ = ("name", "category", "price")
+
+    def __init__(self, name, category="general", price=None):
+        self.name = name.strip()
+        self.category = key(category)
+        self.price = price
+
+    def __repr__(self):
+        return f"MenuItem({self.name!r}, {self.category!r}, {self.price!r})"
+
+
+class Menu:
+    def __init__(self, items=()):
+        self.items = {}
+        self.by_category = {}
+        self.available = set()
+        for name in items:
+            self.add(name)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, name):
+        return key(name) in self.items
+
+    def add(self, name, category="general", price=None, available=True):
+        """Add a new item; raises MenuError if it is already on the menu (use update)"""
+        k = key(name)
+        if k in self.items:
+            raise MenuError(f"{name} is already on the menu")
+        item = self.items[k] = MenuItem(name, category, price)
+        self.by_category.setdefault(item.category, set()).add(k)
+        if available:
+            self.available.add(k)
+
+    def update(self, name, category=None, price=None, available=None):
+        """Change the given fields of an existing item; None keeps the current value"""
+        k = key(name)
+        item = self.items.get(k)
+        if item is None:
+            raise MenuError(f"{name} is not on the menu")
+        if category is not None and key(category) != item.category:
+            self._uncategorize(k, item.category)
+            item.category = key(category)
+            self.by_category.setdefault(item.category, set()).add(k)
+        if price is not None:
+            item.price = price
+        if available is not None:
+            self.set_available(name, available)
+        return item
+
+    def _uncategorize(self, k, category):
+        members = self.by_category[category]
+        members.discard(k)
+        if not members:
+            del self.by_category[category]
+
+    def remove(self, name):
+        k = key(name)
+        item = self.items.pop(k, None)
+        if item is None:
+            return False
+        self._uncategorize(k, item.category)
+        self.available.discard(k)
+        return True
+
+    def set_available(self, name, available=True):
+        k = key(name)
+        if k not in self.items:
+            raise MenuError(f"{name} is not on the menu")
+        if available:
+            self.available.add(k)
+        else:
+            self.available.discard(k)
+
+    def is_available(self, name):
+        return key(name) in self.available
+
+    def check_many(self, names):
+        """name -> available? for every requested name"""
+        available = self.available
+        return {name: key(name) in available for name in names}
+
+    def category(self, category, only_available=True):
+        keys = self.by_category.get(key(category), set())
+        if only_available:
+            keys = keys & self.available
+        return sorted(self.items[k].name for k in keys)
+
+    def names(self):
+        return [item.name for item in self.items.values()]
+
+
+class MenuService:
+    def __init__(self):
+        self.outlets = {}
+        self.serving = {}  # item key -> outlets that have it on the menu
+
+    def outlet(self, outlet):
+        menu = self.outlets.get(outlet)
+        if menu is None:
+            menu = self.outlets[outlet] = Menu()
+        return menu
+
+    def add_item(self, outlet, name, category="general", price=None, available=True):
+        self.outlet(outlet).add(name, category, price, available)
+        self.serving.setdefault(key(name), set()).add(outlet)
+
+    def update_item(self, outlet, name, category=None, price=None, available=None):
+        if outlet not in self.outlets:
+            raise MenuError(f"Unknown outlet: {outlet}")
+        return self.outlets[outlet].update(name, category, price, available)
+
+    def remove_item(self, outlet, name):
+        if outlet not in self.outlets or not self.outlets[outlet].remove(name):
+            return False
+        outlets = self.serving[key(name)]
+        outlets.discard(outlet)
+        if not outlets:
+            del self.serving[key(name)]
+        return True
+
+    def set_available(self, outlet, name, available=True):
+        if outlet not in self.outlets:
+            raise MenuError(f"Unknown outlet: {outlet}")
+        self.outlets[outlet].set_available(name, available)
+
+    def availability(self, outlet, names):
+        if outlet not in self.outlets:
+            raise MenuError(f"Unknown outlet: {outlet}")
+        return self.outlets[outlet].check_many(names)
+
+    def outlets_with(self, name, only_available=True):
+        outlets = self.serving.get(key(name), set())
+        if only_available:
+            outlets = {o for o in outlets if self.outlets[o].is_available(name)}
+        return sorted(outlets)
+
+    def apply(self, rows):
+        """Apply parsed CSV rows in order; returns counts per operation"""
+        counts = {"add": 0, "update": 0, "remove": 0, "available": 0, "unavailable": 0}
+        for line_no, row in enumerate(rows, start=1):
+            if not row or not row[0].strip() or row[0].startswith("#"):
+                continue
+            op = row[0].strip().lower()
+            if op not in counts or len(row) < 3:
+                raise MenuError(f"Line {line_no}: expected <op>,<outlet>,<item>")
+            outlet, name = row[1].strip(), row[2]
+            try:
+                if op in ("add", "update"):
+                    category = row[3] if len(row) > 3 and row[3].strip() else None
+                    try:
+                        price = float(row[4]) if len(row) > 4 and row[4].strip() else None
+                    except ValueError:
+                        raise MenuError(f"invalid price {row[4]!r}")
+                    if op == "add":
+                        self.add_item(outlet, name, category or "general", price)
+                    else:
+                        self.update_item(outlet, name, category, price)
+                elif op == "remove":
+                    self.remove_item(outlet, name)
+                else:
+                    self.set_available(outlet, name, op == "available")
+            except MenuError as e:
+                raise MenuError(f"Line {line_no}: {e}")
+            counts[op] += 1
+        return counts
+
+    def apply_file(self, path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return self.apply(csv.reader(f))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python menu_service.py <ops.csv>")
+    service = MenuService()
+    print(service.apply_file(sys.argv[1]))
+    for outlet, menu in service.outlets.items():
+        print(f"{outlet}: {len(menu)} items, {len(menu.available)} available")
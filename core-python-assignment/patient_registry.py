@@ -0,0 +1,111 @@
+#Patient registry with disease and age indexes
+#Fields are normalized once at insert and stored column-wise (patient id = position).
+#  by_disease : normalized disease -> list of ids
+#  age index  : ids sorted by age, searched with bisect for range queries; built by one sort on
+#               first use (so bulk loads never re-sort), then kept sorted with bisect.insort
+#Queries on several criteria start from the smallest candidate set and check the rest per id.
+#Every query returns ids in ascending order.
+import bisect
+import csv
+
+
+def normalize(text):
+    return " ".join(str(text).split()).lower()
+
+
+class PatientRegistry:
+    def __init__(self, patients=()):
+        self.names = []
+        self.ages = []
+        self.diseases = []  # normalized
+        self.by_disease = {}
+        self._age_order = None  # ids sorted by (age, id); None until the first age query
+        self._age_keys = None  # the matching ages, for bisect
+        for p in patients:
+            self.add(p["Name"], p["Age"], p["Disease"])
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name, age, disease):
+        age = int(age)
+        if age < 0:
+            raise ValueError(f"Invalid age for {name}: {age}")
+        pid = len(self.names)
+        disease = normalize(disease)
+        self.names.append(name.strip())
+        self.ages.append(age)
+        self.diseases.append(disease)
+        self.by_disease.setdefault(disease, []).append(pid)
+        if self._age_order is not None:
+            # ids grow, so inserting after equal ages keeps (age, id) order
+            at = bisect.bisect_right(self._age_keys, age)
+            self._age_keys.insert(at, age)
+            self._age_order.insert(at, pid)
+        return pid
+
+    def load_csv(self, path, name_column="Name", age_column="Age", disease_column="Disease"):
+        """Bulk load patients from CSV; the age index is sorted once afterwards"""
+        before = len(self)
+        self._age_order = self._age_keys = None  # one sort on next use beats many inserts
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                self.add(row[name_column], row[age_column], row[disease_column])
+        return len(self) - before
+
+    def get(self, pid):
+        return {"Name": self.names[pid], "Age": self.ages[pid], "Disease": self.diseases[pid]}
+
+    def _age_span(self, min_age, max_age):
+        if self._age_order is None:
+            self._age_order = sorted(range(len(self.ages)), key=self.ages.__getitem__)
+            self._age_keys = [self.ages[i] for i in self._age_order]
+        lo = 0 if min_age is None else bisect.bisect_left(self._age_keys, min_age)
+        hi = len(self._age_keys) if max_age is None else bisect.bisect_right(self._age_keys, max_age)
+        return lo, hi
+
+    def with_disease(self, disease):
+        return self.by_disease.get(normalize(disease), [])
+
+    def in_age_range(self, min_age=None, max_age=None):
+        lo, hi = self._age_span(min_age, max_age)
+        return sorted(self._age_order[lo:hi])
+
+    def query(self, disease=None, min_age=None, max_age=None):
+        """Ids (ascending) of patients matching every given criterion"""
+        by_age = min_age is not None or max_age is not None
+        if disease is None:
+            return self.in_age_range(min_age, max_age) if by_age else list(range(len(self)))
+        ids = self.with_disease(disease)
+        if not by_age:
+            return list(ids)
+        lo, hi = self._age_span(min_age, max_age)
+        if hi - lo < len(ids):
+            # the age range is the smaller side: walk it and check the disease column
+            d = normalize(disease)
+            return sorted(i for i in self._age_order[lo:hi] if self.diseases[i] == d)
+        low = float("-inf") if min_age is None else min_age
+        high = float("inf") if max_age is None else max_age
+        ages = self.ages
+        return [i for i in ids if low <= ages[i] <= high]
+
+    def names_of(self, ids):
+        return [self.names[i] for i in ids]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rnd = random.Random(5)
+    diseases = ["Flu", "Diabetes", "Asthma", "Malaria", "Covid", "Dengue", "Typhoid", "Migraine"]
+    reg = PatientRegistry()
+    start = time.perf_counter()
+    for i in range(1_000_000):
+        reg.add(f"Patient{i}", rnd.randint(0, 95), rnd.choice(diseases))
+    print(f"insert 1,000,000 patients: {time.perf_counter() - start:.2f} s")
+
+    for args in (("flu", None, None), (None, 30, 35), ("Asthma", 30, 35), ("malaria", 90, None)):
+        start = time.perf_counter()
+        hits = reg.query(*args)
+        print(f"query{args}: {len(hits)} patients in {(time.perf_counter() - start) * 1000:.1f} ms")
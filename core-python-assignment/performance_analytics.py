@@ -0,0 +1,125 @@
+#Student performance analytics on a students x subjects NumPy array
+#Each statistic is computed in one vectorised pass and cached until marks change.
+#CSV layout: name,<subject 1>,<subject 2>,...
+#Missing marks (ragged lists, blank CSV cells) are NaN and left out of every average.
+import csv
+
+import numpy as np
+
+
+class Performance:
+    def __init__(self, names, subjects, marks):
+        self.names = np.asarray(names, dtype=object)
+        self.subjects = list(subjects)
+        self.marks = np.asarray(marks, dtype=np.float32).reshape(len(self.names), len(self.subjects))
+        self._index = None
+        self._cache = {}
+
+    @classmethod
+    def from_dict(cls, students, subjects=None):
+        """{name: [mark per subject]} as used by performance_tracker; shorter lists are padded with NaN"""
+        names = list(students)
+        width = max((len(students[n]) for n in names), default=0)
+        marks = np.full((len(names), width), np.nan, dtype=np.float32)
+        for i, n in enumerate(names):
+            marks[i, :len(students[n])] = students[n]
+        return cls(names, subjects or [f"subject{i + 1}" for i in range(width)], marks)
+
+    @classmethod
+    def from_csv(cls, path, chunk_rows=50_000):
+        """Stream a marks CSV; rows are converted to arrays chunk by chunk and joined once"""
+        names, chunks, rows = [], [], []
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            subjects = next(reader)[1:]
+            for row in reader:
+                if not row:
+                    continue
+                names.append(row[0])
+                rows.append([v if v.strip() else "nan" for v in row[1:]])
+                if len(rows) >= chunk_rows:
+                    chunks.append(np.array(rows, dtype=np.float32))
+                    rows = []
+        if rows or not chunks:
+            chunks.append(np.array(rows, dtype=np.float32).reshape(len(rows), len(subjects)))
+        return cls(names, subjects, np.concatenate(chunks))
+
+    def __len__(self):
+        return len(self.names)
+
+    def _stat(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def row(self, name):
+        if self._index is None:
+            self._index = {n: i for i, n in enumerate(self.names)}
+        return self._index[name]
+
+    def set_mark(self, name, subject, mark):
+        self.marks[self.row(name), self.subjects.index(subject)] = mark
+        self._cache.clear()
+
+    def set_marks(self, name, marks):
+        self.marks[self.row(name)] = marks
+        self._cache.clear()
+
+    def averages(self):
+        """Average mark per student"""
+        return self._stat("averages", lambda: np.nanmean(self.marks, axis=1, dtype=np.float64))
+
+    def subject_averages(self):
+        return self._stat("subject_averages",
+                          lambda: dict(zip(self.subjects, np.nanmean(self.marks, axis=0, dtype=np.float64).tolist())))
+
+    def toppers(self):
+        """Names of every student sharing the best average"""
+        def compute():
+            avg = self.averages()
+            return self.names[avg == np.nanmax(avg)].tolist() if len(avg) else []
+        return self._stat("toppers", compute)
+
+    def above(self, threshold, subject=None):
+        """Names whose average (or mark in one subject) is strictly above threshold"""
+        values = self.averages() if subject is None else self.marks[:, self.subjects.index(subject)]
+        return self.names[values > threshold].tolist()
+
+    def percentiles(self, q=(25, 50, 75, 90)):
+        """{percentile: value} over student averages"""
+        q = tuple(q)
+        return self._stat(("percentiles", q), lambda: dict(zip(q, np.nanpercentile(self.averages(), q).tolist())))
+
+    def ranks(self):
+        """Rank per student by average, 1 = best; ties share a rank"""
+        def compute():
+            avg = self.averages()
+            ordered = np.sort(avg)
+            return 1 + len(avg) - np.searchsorted(ordered, avg, side="right")
+        return self._stat("ranks", compute)
+
+    def rank_of(self, name):
+        return int(self.ranks()[self.row(name)])
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    rnd = np.random.default_rng(3)
+    n, subjects = 100_000, ["maths", "physics", "chemistry", "english", "cs"]
+    path = os.path.join(tempfile.mkdtemp(), "marks.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name"] + subjects)
+        writer.writerows([f"student{i}", *row] for i, row in enumerate(rnd.integers(0, 101, (n, 5)).tolist()))
+
+    start = time.perf_counter()
+    perf = Performance.from_csv(path)
+    print(f"load {n} students: {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    toppers, ranks, pct = perf.toppers(), perf.ranks(), perf.percentiles()
+    above = perf.above(75)
+    print(f"toppers, ranks, percentiles, above 75: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"{len(toppers)} topper(s), {len(above)} above 75, percentiles {pct}")
@@ -1,19 +1,19 @@
+from performance_analytics import Performance
+
+
 class Student:
     def __init__(self, students):
         self.students = students
+        self.perf = Performance.from_dict(students)
    
     def average(self):
-        avg = {}
-        for i, j in self.students.items():
-            avg[i] = round(sum(j) / len(j), 2)
-        return avg
+        return dict(zip(self.perf.names.tolist(), self.perf.averages().round(2).tolist()))
    
     def Topper(self):
-        avg = self.average()
-        topper = max(avg, key=avg.get)
-        return topper
+        return self.perf.toppers()[0]
 
 
 students = {"John": [85, 78, 92], "Alice": [88, 79, 95], "Bob": [70, 75, 80]}
-print(f"Average Marks: {Student(students).average()}")
-print(f'Top Performer: "{Student(students).Topper()}"')
\ No newline at end of file
+s = Student(students)
+print(f"Average Marks: {s.average()}")
+print(f'Top Performer: "{s.Topper()}"')
\ No newline at end of file
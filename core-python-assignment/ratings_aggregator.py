@@ -0,0 +1,168 @@
+#Streaming ratings aggregator
+#Every rating updates a histogram, a positive counter and Welford's running mean/variance,
+#so percentages, distributions and averages are O(1) to read at any time.
+#Reviews come from any iterable of dicts or a JSONL file: {"product": ..., "rating": 1-5, "ts": ...}
+#(ratings may be fractional, e.g. 4.5 counts in the 4-star histogram bucket; ts is epoch seconds)
+#   python ratings_aggregator.py reviews.jsonl
+import json
+import math
+import sys
+from collections import deque
+
+
+def _number(value, name):
+    """JSON numbers pass through, numeric strings are parsed, anything else is rejected"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be numeric: {value!r}") from None
+
+
+class RatingStats:
+    def __init__(self, scale=5, positive_from=4):
+        self.scale = scale
+        self.positive_from = positive_from
+        self.counts = [0] * (scale + 1)  # counts[r] = number of r-star ratings
+        self.n = 0
+        self.positive = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, rating):
+        if not 1 <= rating <= self.scale:
+            raise ValueError(f"Rating must be between 1 and {self.scale}: {rating}")
+        self.counts[int(rating)] += 1
+        self.positive += rating >= self.positive_from
+        self.n += 1
+        delta = rating - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (rating - self.mean)
+
+    def remove(self, rating):
+        """Undo one earlier add (used by sliding windows)"""
+        if self.counts[int(rating)] == 0:
+            raise ValueError(f"No {rating}-star rating to remove")
+        self.counts[int(rating)] -= 1
+        self.positive -= rating >= self.positive_from
+        self.n -= 1
+        if self.n == 0:
+            self.mean, self._m2 = 0.0, 0.0
+            return
+        delta = rating - self.mean
+        self.mean -= delta / self.n
+        self._m2 = max(0.0, self._m2 - delta * (rating - self.mean))
+
+    def extend(self, ratings):
+        for rating in ratings:
+            self.add(rating)
+        return self
+
+    def positive_percentage(self):
+        return self.positive / self.n * 100 if self.n else 0
+
+    def variance(self):
+        return self._m2 / self.n if self.n else 0.0
+
+    def stddev(self):
+        return math.sqrt(self.variance())
+
+    def distribution(self):
+        """{stars: share of ratings in %}"""
+        return {r: (self.counts[r] / self.n * 100 if self.n else 0) for r in range(1, self.scale + 1)}
+
+    def summary(self):
+        return {"count": self.n, "mean": round(self.mean, 3), "stddev": round(self.stddev(), 3),
+                "positive_pct": round(self.positive_percentage(), 1), "histogram": self.counts[1:]}
+
+
+class SlidingWindow(RatingStats):
+    """Stats over the last `size` ratings and/or the ratings of the last `seconds`"""
+
+    def __init__(self, size=None, seconds=None, scale=5, positive_from=4):
+        super().__init__(scale, positive_from)
+        self.size = size
+        self.seconds = seconds
+        self._window = deque()  # (ts, rating)
+
+    def add(self, rating, ts=None):
+        if ts is not None:
+            ts = _number(ts, "ts")
+        super().add(rating)
+        self._window.append((ts, rating))
+        if self.size is not None and len(self._window) > self.size:
+            self.remove(self._window.popleft()[1])
+        if ts is not None:
+            self.expire(ts)
+
+    def expire(self, now):
+        if self.seconds is None:
+            return
+        while self._window and self._window[0][0] is not None and self._window[0][0] <= now - self.seconds:
+            self.remove(self._window.popleft()[1])
+
+
+class RatingsAggregator:
+    def __init__(self, window_size=None, window_seconds=None, scale=5, positive_from=4):
+        self.scale = scale
+        self.positive_from = positive_from
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+        self.overall = RatingStats(scale, positive_from)
+        self.products = {}
+        self.windows = {}
+        self.latest_ts = None  # newest ts ingested; "now" for recent() on replayed data
+
+    def add(self, product, rating, ts=None):
+        if ts is not None:
+            ts = _number(ts, "ts")
+            if self.latest_ts is None or ts > self.latest_ts:
+                self.latest_ts = ts
+        stats = self.products.get(product)
+        if stats is None:
+            stats = self.products[product] = RatingStats(self.scale, self.positive_from)
+            if self.window_size or self.window_seconds:
+                self.windows[product] = SlidingWindow(self.window_size, self.window_seconds,
+                                                      self.scale, self.positive_from)
+        stats.add(rating)
+        self.overall.add(rating)
+        if product in self.windows:
+            self.windows[product].add(rating, ts)
+
+    def consume(self, reviews):
+        """Feed an iterable of {"product", "rating"[, "ts"]} dicts; returns how many were added"""
+        count = 0
+        for review in reviews:
+            self.add(review.get("product"), _number(review["rating"], "rating"), review.get("ts"))
+            count += 1
+        return count
+
+    def consume_jsonl(self, path):
+        with open(path, encoding="utf-8") as f:
+            return self.consume(json.loads(line) for line in f if line.strip())
+
+    def product(self, product):
+        return self.products.get(product) or RatingStats(self.scale, self.positive_from)
+
+    def recent(self, product, now=None):
+        """
+        Window stats of a product, with ratings older than window_seconds (as of now) expired.
+        now defaults to the newest ts ingested, so replaying a historical file keeps its window;
+        pass time.time() for a live stream that may have gone quiet.
+        """
+        window = self.windows.get(product)
+        now = self.latest_ts if now is None else _number(now, "now")
+        if window is not None and now is not None:
+            window.expire(now)
+        return window
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python ratings_aggregator.py <reviews.jsonl>")
+    agg = RatingsAggregator()
+    agg.consume_jsonl(sys.argv[1])
+    print("overall:", agg.overall.summary())
+    for name, stats in sorted(agg.products.items(), key=lambda kv: -kv[1].n)[:10]:
+        print(f"{name}: {stats.summary()}")
@@ -0,0 +1,197 @@
+#Seat inventory for many shows (the Movie_Ticket_Booking exercise, scaled up)
+#Each show keeps one byte per seat (0 free, 1 booked, 2 held), so book/cancel are O(1)
+#and free-seat / contiguous-block searches run inside bytearray.count/find
+import heapq
+import itertools
+import threading
+import time
+import uuid
+
+FREE, BOOKED, HELD = 0, 1, 2
+#maps FREE -> 1 and everything else -> 0, for itertools.compress
+_FREE_MASK = bytes([1, 0, 0]) + bytes(253)
+
+
+class SeatError(Exception):
+    pass
+
+
+class ShowSeats:
+    def __init__(self, total):
+        if total <= 0:
+            raise SeatError("Total seats must be positive")
+        self.total = total
+        self._seats = bytearray(total)  # index = seat number - 1
+        self._holds = {}  # hold_id -> (seats, expires_at)
+        self._expiry = []  # heap of (expires_at, hold_id)
+        self._lock = threading.Lock()
+
+    def _index(self, seat):
+        if not 1 <= seat <= self.total:
+            raise SeatError(f"Seat {seat} does not exist")
+        return seat - 1
+
+    def _expire_holds(self, now):
+        while self._expiry and self._expiry[0][0] <= now:
+            _, hold_id = heapq.heappop(self._expiry)
+            hold = self._holds.get(hold_id)
+            if hold and hold[1] <= now:
+                self._release(hold_id)
+
+    def _release(self, hold_id):
+        seats, _ = self._holds.pop(hold_id)
+        for seat in seats:
+            self._seats[seat - 1] = FREE
+
+    def book(self, seat):
+        with self._lock:
+            self._expire_holds(time.monotonic())
+            i = self._index(seat)
+            if self._seats[i] != FREE:
+                return False
+            self._seats[i] = BOOKED
+            return True
+
+    def cancel(self, seat):
+        with self._lock:
+            i = self._index(seat)
+            if self._seats[i] != BOOKED:
+                return False
+            self._seats[i] = FREE
+            return True
+
+    def hold(self, seats, ttl=300):
+        """Reserve seats for ttl seconds; returns a hold id to confirm or release, or None if any seat is taken"""
+        with self._lock:
+            now = time.monotonic()
+            self._expire_holds(now)
+            indexes = [self._index(s) for s in seats]
+            if len(set(indexes)) != len(indexes) or any(self._seats[i] != FREE for i in indexes):
+                return None
+            for i in indexes:
+                self._seats[i] = HELD
+            hold_id = uuid.uuid4().hex
+            self._holds[hold_id] = (list(seats), now + ttl)
+            heapq.heappush(self._expiry, (now + ttl, hold_id))
+            return hold_id
+
+    def confirm(self, hold_id):
+        """Turn a live hold into bookings; False if it expired or was released"""
+        with self._lock:
+            self._expire_holds(time.monotonic())
+            hold = self._holds.pop(hold_id, None)
+            if hold is None:
+                return False
+            for seat in hold[0]:
+                self._seats[seat - 1] = BOOKED
+            return True
+
+    def release(self, hold_id):
+        with self._lock:
+            if hold_id not in self._holds:
+                return False
+            self._release(hold_id)
+            return True
+
+    def available_count(self):
+        with self._lock:
+            self._expire_holds(time.monotonic())
+            return self._seats.count(FREE)
+
+    def available_seats(self):
+        with self._lock:
+            self._expire_holds(time.monotonic())
+            return list(itertools.compress(range(1, self.total + 1), self._seats.translate(_FREE_MASK)))
+
+    def find_block(self, size, start=1):
+        """First seat of `size` adjacent free seats at or after `start`, or None"""
+        if size < 1:
+            raise SeatError("Block size must be positive")
+        if start < 1:
+            raise SeatError(f"Seat {start} does not exist")
+        with self._lock:
+            self._expire_holds(time.monotonic())
+            i = self._seats.find(bytes(size), start - 1)
+            return i + 1 if i >= 0 else None
+
+
+class SeatInventory:
+    def __init__(self):
+        self.shows = {}
+
+    def add_show(self, show_id, total_seats):
+        if show_id in self.shows:
+            raise SeatError(f"Show {show_id} already exists")
+        self.shows[show_id] = ShowSeats(total_seats)
+        return self.shows[show_id]
+
+    def show(self, show_id):
+        try:
+            return self.shows[show_id]
+        except KeyError:
+            raise SeatError(f"Show {show_id} not found")
+
+    def book(self, show_id, seat):
+        return self.show(show_id).book(seat)
+
+    def cancel(self, show_id, seat):
+        return self.show(show_id).cancel(seat)
+
+    def hold(self, show_id, seats, ttl=300):
+        return self.show(show_id).hold(seats, ttl)
+
+    def confirm(self, show_id, hold_id):
+        return self.show(show_id).confirm(hold_id)
+
+    def available_seats(self, show_id):
+        return self.show(show_id).available_seats()
+
+    def find_block(self, show_id, size):
+        return self.show(show_id).find_block(size)
+
+
+def benchmark(shows=10_000, seats=500, ops_per_show=200):
+    import random
+    from concurrent.futures import ThreadPoolExecutor
+
+    inv = SeatInventory()
+    start = time.perf_counter()
+    for s in range(shows):
+        inv.add_show(s, seats)
+    print(f"create {shows} shows x {seats} seats: {time.perf_counter() - start:.2f} s")
+
+    rnd = random.Random(1)
+    plan = [(rnd.randrange(shows), rnd.randint(1, seats)) for _ in range(shows * ops_per_show // 10)]
+    start = time.perf_counter()
+    booked = sum(inv.book(show, seat) for show, seat in plan)
+    elapsed = time.perf_counter() - start
+    print(f"book: {len(plan)} requests ({booked} booked) in {elapsed:.2f} s, {len(plan) / elapsed:,.0f}/s")
+
+    start = time.perf_counter()
+    free = sum(inv.show(s).available_count() for s in range(shows))
+    blocks = sum(inv.find_block(s, 6) is not None for s in range(shows))
+    elapsed = time.perf_counter() - start
+    print(f"available count + block-of-6 search on every show: {elapsed:.2f} s ({free} free, {blocks} with a block)")
+
+    def buyer(n):
+        r = random.Random(n)
+        confirmed = 0
+        for _ in range(1000):
+            show = r.randrange(shows)
+            first = inv.find_block(show, 2)
+            if first is None:
+                continue
+            hold_id = inv.hold(show, [first, first + 1], ttl=5)
+            if hold_id and inv.confirm(show, hold_id):
+                confirmed += 1
+        return confirmed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        confirmed = sum(pool.map(buyer, range(8)))
+    elapsed = time.perf_counter() - start
+    print(f"8 concurrent buyers, hold+confirm of 2 seats: {confirmed} confirmed in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    benchmark()